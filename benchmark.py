@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for comparing scraping modes.
+- Fetches each board once per mode and reports bytes transferred and parse time
+- Only benchmarks manually verified companies
+- Usage: python benchmark.py <platform> [formatted_name ...]
+"""
+
+import json
+import sys
+import os
+import time
+from statistics import median
+from typing import Callable, Dict, List, Tuple
+
+# Add src directory to path to import modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+
+from companies import tier_1a, tier_1b, tier_2a, tier_2b, tier_2c
+from scrapers import (
+    make_request,
+    make_post_request,
+    lever,
+    parse_lever_html,
+    parse_lever_json,
+    ashby,
+    ashby_graphql_payload,
+    parse_ashby_graphql,
+    parse_ashby_posting_api,
+)
+
+# Parsing is repeated to get a stable timing
+PARSE_REPETITIONS = 5
+
+
+def time_parse(parse: Callable, payload) -> Tuple[float, int]:
+    """
+    Time a parse function on a payload.
+
+    Returns:
+        Tuple of (median parse time in milliseconds, number of postings parsed)
+    """
+    timings = []
+    postings = []
+    for _ in range(PARSE_REPETITIONS):
+        start = time.perf_counter()
+        postings = parse(payload)
+        timings.append((time.perf_counter() - start) * 1000)
+    return median(timings), len(postings)
+
+
+def benchmark_lever(company: str) -> Dict[str, Tuple[int, float, int]]:
+    """
+    Compare Lever's HTML job board with its JSON postings API.
+
+    Returns:
+        Dictionary mapping mode to (bytes transferred, parse time in ms, postings)
+    """
+    results = {}
+
+    response = make_request(f"https://jobs.lever.co/{company}")
+    if response and response.status_code == 200:
+        parse_ms, count = time_parse(parse_lever_html, response.content)
+        results["html"] = (len(response.content), parse_ms, count)
+
+    total_bytes, total_parse_ms, total_count, skip = 0, 0.0, 0, 0
+    while True:
+        response = make_request(
+            f"https://api.lever.co/v0/postings/{company}",
+            params={"mode": "json", "skip": skip, "limit": 100},
+        )
+        if not response or response.status_code != 200:
+            break
+
+        total_bytes += len(response.content)
+        parse_ms, count = time_parse(
+            lambda content: parse_lever_json(json.loads(content)), response.content
+        )
+        total_parse_ms += parse_ms
+        total_count += count
+        if len(json.loads(response.content)) < 100:
+            results["json"] = (total_bytes, total_parse_ms, total_count)
+            break
+        skip += 100
+
+    return results
+
+
+def benchmark_ashby(company: str) -> Dict[str, Tuple[int, float, int]]:
+    """
+    Compare Ashby's full posting-api job board with the field-projected GraphQL API.
+
+    Returns:
+        Dictionary mapping mode to (bytes transferred, decode time in ms, postings)
+    """
+    results = {}
+
+    response = make_request(f"https://api.ashbyhq.com/posting-api/job-board/{company}")
+    if response and response.status_code == 200:
+        parse_ms, count = time_parse(
+            lambda content: parse_ashby_posting_api(json.loads(content)),
+            response.content,
+        )
+        results["posting-api"] = (len(response.content), parse_ms, count)
+
+    response = make_post_request(
+        "https://jobs.ashbyhq.com/api/non-user-graphql?op=ApiJobBoardWithTeams",
+        json=ashby_graphql_payload(company),
+    )
+    if response and response.status_code == 200:
+        parse_ms, count = time_parse(
+            lambda content: parse_ashby_graphql(json.loads(content), company),
+            response.content,
+        )
+        results["graphql"] = (len(response.content), parse_ms, count)
+
+    return results
+
+
+# Benchmarks by platform: (scraper used to select companies, benchmark function)
+BENCHMARKS = {
+    "lever": (lever, benchmark_lever),
+    "ashby": (ashby, benchmark_ashby),
+}
+
+
+def print_results(results: List[Tuple[str, Dict[str, Tuple[int, float, int]]]]):
+    """Print a table of benchmark results per board and mode."""
+    print(f"\n{'Board':<24}{'Mode':<10}{'Bytes':>12}{'Parse (ms)':>12}{'Postings':>10}")
+    print("-" * 68)
+    for company, modes in results:
+        for mode, (size, parse_ms, count) in modes.items():
+            print(f"{company:<24}{mode:<10}{size:>12,}{parse_ms:>12.1f}{count:>10}")
+        if not modes:
+            print(f"{company:<24}{'(failed)':<10}")
+
+
+def main():
+    """Main function for benchmarking."""
+    if len(sys.argv) < 2 or sys.argv[1] not in BENCHMARKS:
+        print(
+            f"Usage: python benchmark.py <{'|'.join(BENCHMARKS)}> [formatted_name ...]"
+        )
+        sys.exit(1)
+
+    scraper, benchmark = BENCHMARKS[sys.argv[1]]
+
+    companies = sys.argv[2:]
+    if not companies:
+        companies = [
+            company["formatted_name"]
+            for company in tier_1a + tier_1b + tier_2a + tier_2b + tier_2c
+            if company.get("scraper") == scraper
+            and company.get("manually_verified", False)
+        ]
+
+    print(f"Benchmarking {sys.argv[1]} on {len(companies)} boards...")
+    results = [(company, benchmark(company)) for company in companies]
+    print_results(results)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\nBenchmark interrupted by user")
+        sys.exit(1)
@@ -4,18 +4,39 @@ Manual testing script for scrapers.
 - Only outputs to console (no files)
 - No filtering on job roles (all openings listed)
 - Only scrapes companies with manually_verified=False
+- Persistent state (seen postings, page sizes, etc.) goes to a scratch directory
+
+With --concurrent, all unverified companies are scraped in parallel (requests
+stay rate limited per host) and a per-company table of status, requests,
+bytes, latency, postings and errors is printed instead of every posting.
 """
 
+import argparse
+import atexit
+import json
+import shutil
 import sys
 import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Tuple
 from collections import defaultdict
 
 # Add src directory to path to import modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 
+# Override filtering to disable it for manual testing (before config is imported)
+os.environ["APPLY_FILTERING"] = "False"
+
+# Keep state in a scratch directory, so testing unverified companies doesn't
+# leave incremental pagination or page size records behind for real runs
+os.environ["STATE_DIR"] = tempfile.mkdtemp(prefix="manual_test_state_")
+atexit.register(shutil.rmtree, os.environ["STATE_DIR"], ignore_errors=True)
+
 from companies import tier_1a, tier_1b, tier_2a, tier_2b, tier_2c
+from config import SCRAPER_WORKERS, COMPANY_TIME_BUDGET_SECONDS
+from tracking import start_company, finish_company, record_error
 from scrapers import (
     lever,
     greenhouse,
@@ -27,28 +48,42 @@ from scrapers import (
     icims,
 )
 
-# Override filtering to disable it for manual testing
-os.environ["APPLY_FILTERING"] = "False"
-
 
 def should_include_job_no_filter(job_title: str, location: str = "") -> bool:
     """Always return True to bypass all filtering for manual testing."""
     return True
 
 
+def call_scraper(company_data: Dict, found_jobs: Set[str]) -> List[Dict]:
+    """Call a company's scraper with the arguments it expects."""
+    scraper = company_data["scraper"]
+    # formatted_name not needed for custom scrapers
+    if scraper in [
+        lever,
+        greenhouse,
+        ashby,
+        myworkdayjobs,
+        myworkdaysite,
+        smartrecruiters,
+        jobvite,
+        icims,
+    ]:
+        return scraper(company_data.get("formatted_name", ""), found_jobs)
+    return scraper(found_jobs)
+
+
 def scrape_unverified_company(company_data: Dict, found_jobs: Set[str]) -> List[Dict]:
     """
     Scrape jobs for a single unverified company.
 
     Args:
         company_data: Company dictionary with scraper info
-        found_jobs: Set of previously found job URLs (for duplicate detection)
+        found_jobs: Set of previously found job keys (for duplicate detection)
 
     Returns:
         List of jobs found for this company
     """
     company_name = company_data.get("name", "")
-    formatted_name = company_data.get("formatted_name", "")
     scraper = company_data.get("scraper", "")
     manually_verified = company_data.get("manually_verified", True)
 
@@ -65,20 +100,7 @@ def scrape_unverified_company(company_data: Dict, found_jobs: Set[str]) -> List[
     print("-" * 40)
 
     try:
-        # Call the appropriate scraper
-        if scraper in [
-            lever,
-            greenhouse,
-            ashby,
-            myworkdayjobs,
-            myworkdaysite,
-            smartrecruiters,
-            jobvite,
-            icims,
-        ]:
-            jobs = scraper(formatted_name, found_jobs)
-        else:
-            jobs = scraper(found_jobs)
+        jobs = call_scraper(company_data, found_jobs)
 
         print(f"Found {len(jobs)} jobs for {company_name}")
 
@@ -97,8 +119,159 @@ def scrape_unverified_company(company_data: Dict, found_jobs: Set[str]) -> List[
         return []
 
 
+def verify_company(tier_name: str, company_data: Dict) -> Dict:
+    """
+    Scrape one unverified company, tracking its requests, bytes and latency.
+
+    Args:
+        tier_name: Name of the tier the company belongs to
+        company_data: Company dictionary with scraper info
+
+    Returns:
+        Result dictionary for the company, including its status and jobs
+    """
+    company_name = company_data.get("name", "")
+    stats = start_company(
+        company_name,
+        company_data["scraper"].__name__,
+        tier_name,
+        COMPANY_TIME_BUDGET_SECONDS,
+    )
+
+    try:
+        jobs = call_scraper(company_data, set())
+    except Exception as e:
+        record_error(f"Unexpected error: {e}")
+        jobs = []
+    finish_company()
+
+    if stats["errors"]:
+        status = "error"
+    elif not stats["requests"]:
+        status = "no requests"  # e.g. a scraper that isn't implemented yet
+    elif stats["requests"] == stats["failed_requests"]:
+        status = "failed"
+    elif stats["truncated"]:
+        status = "truncated"
+    elif not jobs:
+        status = "empty"
+    else:
+        status = "ok"
+
+    return {
+        "name": company_name,
+        "tier": tier_name,
+        "scraper": stats["scraper"],
+        "status": status,
+        "requests": stats["requests"],
+        "failed_requests": stats["failed_requests"],
+        "bytes": stats["bytes"],
+        "latency": stats["latency"] / stats["requests"] if stats["requests"] else None,
+        "duration": round(stats["duration"], 2),
+        "postings": len(jobs),
+        "errors": stats["errors"],
+        "last_error": stats["last_error"],
+        "jobs": jobs,
+    }
+
+
+def print_verification_table(results: List[Dict]) -> None:
+    """Print one row per company with its status and request statistics."""
+    header = (
+        f"{'Company':<24} {'Status':<11} {'Requests':>8} {'KB':>8} "
+        f"{'Latency':>8} {'Time':>7} {'Postings':>8} {'Errors':>6}"
+    )
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        latency = f"{result['latency']:.2f}s" if result["latency"] is not None else "-"
+        print(
+            f"{result['name'][:24]:<24} {result['status']:<11} "
+            f"{result['requests']:>8} {result['bytes'] / 1000:>8.1f} "
+            f"{latency:>8} {result['duration']:>6.1f}s "
+            f"{result['postings']:>8} {result['errors']:>6}"
+        )
+        if result["last_error"]:
+            print(f"    {result['last_error']}")
+
+
+def run_concurrent(
+    all_tiers: List[Tuple[str, List[Dict]]], workers: int, json_path: Optional[str]
+) -> None:
+    """
+    Scrape every unverified company in parallel and report the results.
+
+    Requests to the same host are still spaced by the usual per-host rate
+    limit, so only companies on different hosts actually overlap.
+
+    Args:
+        all_tiers: List of (tier name, list of company dictionaries) tuples
+        workers: Number of companies to scrape concurrently
+        json_path: File to write the results to as JSON, if given
+    """
+    unverified = [
+        (tier_name, company_data)
+        for tier_name, companies in all_tiers
+        for company_data in companies
+        if not company_data.get("manually_verified", True)
+        and company_data.get("scraper")
+    ]
+    print(f"Scraping {len(unverified)} unverified companies with {workers} workers\n")
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        results = list(executor.map(lambda item: verify_company(*item), unverified))
+
+    print()
+    print_verification_table(results)
+
+    # Companies that worked and returned postings are candidates for manually_verified=True
+    candidates = [result["name"] for result in results if result["status"] == "ok"]
+    print(f"\nCandidates for manually_verified=True ({len(candidates)}):")
+    for name in candidates:
+        print(f"  - {name}")
+    print(
+        "Check a few of their postings against the live job board before "
+        "updating src/companies.py."
+    )
+
+    if json_path:
+        report = {
+            "generated": datetime.now().isoformat(timespec="seconds"),
+            "companies": results,
+            "candidates": candidates,
+        }
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nWrote results to {json_path}")
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Test scrapers for companies that aren't manually verified yet."
+    )
+    parser.add_argument(
+        "--concurrent",
+        action="store_true",
+        help="scrape all unverified companies in parallel and print a summary table",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=SCRAPER_WORKERS * 2,
+        help="companies scraped at once in concurrent mode (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--json",
+        metavar="PATH",
+        help="also write the concurrent mode results, including jobs, as JSON",
+    )
+    return parser.parse_args()
+
+
 def main():
     """Main function for manual testing."""
+    args = parse_args()
     print("Manual Scraper Testing - No Filters, Console Only")
     print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 60)
@@ -120,6 +293,12 @@ def main():
         ("Tier 2C", tier_2c),
     ]
 
+    if args.concurrent:
+        run_concurrent(all_tiers, args.workers, args.json)
+        process_time = (datetime.now() - start_time).total_seconds()
+        print(f"\nTotal time: {process_time:.1f}s")
+        return
+
     all_results = defaultdict(list)
     total_jobs = 0
     companies_scraped = 0
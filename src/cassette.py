@@ -0,0 +1,187 @@
+"""
+Record and replay of HTTP traffic.
+In record mode, every response fetched through the request helpers is saved to
+a cassette directory. In replay mode, responses are served back from it without
+touching the network or waiting on rate limits, so whole runs can be repeated
+offline in seconds for profiling and regression checks.
+
+Cassettes are content-addressed: each request is stored under a hash of its
+method, URL and parameters, pointing at a gzip-compressed body stored under the
+hash of its content, so identical bodies are only stored once.
+
+Recording also snapshots the run's inputs (src/state/ and jobs_found.txt) as
+they were when it started. Replays run from a fresh copy of that snapshot in
+the cassette's replay/ directory, which also receives their state and output,
+so replaying a cassette twice gives the same result and live state is untouched.
+The recording's start time is snapshotted too, and replays run their cache
+expiry and date checks on that clock (see run_time), so an old cassette
+doesn't expire cached page sizes or facets whose probes were never recorded.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from config import CASSETTE_MODE, CASSETTE_DIR, STATE_DIR
+
+SRC_DIR = Path(__file__).parent
+CASSETTE_PATH = SRC_DIR / CASSETTE_DIR
+REQUESTS_DIR = CASSETTE_PATH / "requests"
+BODIES_DIR = CASSETTE_PATH / "bodies"
+SNAPSHOT_DIR = CASSETTE_PATH / "snapshot"
+REPLAY_DIR = CASSETTE_PATH / "replay"
+
+# Request arguments that identify a request; headers and timeouts don't
+KEY_ARGUMENTS = ("params", "json", "data")
+
+# Response headers worth keeping, e.g. so the text encoding is detected as before
+KEPT_HEADERS = ("Content-Type", "Location")
+
+# Run inputs snapshotted when recording, besides the state directory
+SNAPSHOT_FILES = ("jobs_found.txt",)
+RECORDED_AT_FILE = "recorded_at.json"
+
+# Seconds added to the wall clock, so replays see the time their recording started
+_clock_offset = 0.0
+
+
+def request_key(method: str, url: str, kwargs: Dict[str, Any]) -> str:
+    """Hash of everything that identifies a request."""
+    identity = {
+        "method": method,
+        "url": url,
+        **{name: kwargs.get(name) for name in KEY_ARGUMENTS},
+    }
+    encoded = json.dumps(identity, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    temp_path.write_bytes(content)
+    os.replace(temp_path, path)
+
+
+def record_response(
+    method: str, url: str, kwargs: Dict[str, Any], response: requests.Response
+) -> None:
+    """Save a response to the cassette."""
+    body_hash = hashlib.sha256(response.content).hexdigest()
+    body_path = BODIES_DIR / body_hash[:2] / f"{body_hash}.gz"
+    if not body_path.exists():
+        _write_atomic(body_path, gzip.compress(response.content))
+
+    entry = {
+        "method": method,
+        "url": url,
+        "status_code": response.status_code,
+        "headers": {
+            name: response.headers[name]
+            for name in KEPT_HEADERS
+            if name in response.headers
+        },
+        "body": body_hash,
+    }
+    key = request_key(method, url, kwargs)
+    _write_atomic(
+        REQUESTS_DIR / key[:2] / f"{key}.json",
+        json.dumps(entry, indent=2).encode(),
+    )
+
+
+def replay_response(
+    method: str, url: str, kwargs: Dict[str, Any]
+) -> Optional[requests.Response]:
+    """
+    Serve a recorded response from the cassette.
+
+    Returns:
+        The recorded response, or None if the request was never recorded
+    """
+    key = request_key(method, url, kwargs)
+    entry_path = REQUESTS_DIR / key[:2] / f"{key}.json"
+    if not entry_path.exists():
+        return None
+
+    entry = json.loads(entry_path.read_text(encoding="utf-8"))
+    body_path = BODIES_DIR / entry["body"][:2] / f"{entry['body']}.gz"
+
+    response = requests.Response()
+    response.status_code = entry["status_code"]
+    response.headers = CaseInsensitiveDict(entry["headers"])
+    response._content = gzip.decompress(body_path.read_bytes())
+    response.url = entry["url"]
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+def _copy_run_inputs(state_dir: Path, files_dir: Path, destination: Path) -> None:
+    """Replace destination with a copy of a state directory and other run inputs."""
+    shutil.rmtree(destination, ignore_errors=True)
+    destination.mkdir(parents=True)
+    if state_dir.is_dir():
+        shutil.copytree(
+            state_dir,
+            destination / "state",
+            # The rate limit ledger is live, machine-wide state rather than a run input
+            ignore=shutil.ignore_patterns("*.sqlite*", "*.tmp"),
+        )
+    for name in SNAPSHOT_FILES:
+        if (files_dir / name).exists():
+            shutil.copyfile(files_dir / name, destination / name)
+
+
+def run_directories() -> Tuple[Path, Path]:
+    """
+    Pick the directories a run reads and writes its state and output under.
+
+    In record mode, the run's inputs are snapshotted into the cassette first.
+    In replay mode, a fresh copy of that snapshot is used instead of src/.
+
+    Returns:
+        Tuple of (directory for jobs_found.txt and search results, state directory)
+    """
+    global _clock_offset
+    if CASSETTE_MODE == "record":
+        _copy_run_inputs(SRC_DIR / STATE_DIR, SRC_DIR, SNAPSHOT_DIR)
+        _write_atomic(
+            SNAPSHOT_DIR / RECORDED_AT_FILE,
+            json.dumps({"started": time.time()}).encode(),
+        )
+    elif CASSETTE_MODE == "replay":
+        _copy_run_inputs(SNAPSHOT_DIR / "state", SNAPSHOT_DIR, REPLAY_DIR)
+        recorded_at = SNAPSHOT_DIR / RECORDED_AT_FILE
+        if recorded_at.exists():
+            started = json.loads(recorded_at.read_text(encoding="utf-8"))["started"]
+            _clock_offset = started - time.time()
+        return REPLAY_DIR, REPLAY_DIR / "state"
+    return SRC_DIR, SRC_DIR / STATE_DIR
+
+
+def run_time() -> float:
+    """
+    Wall-clock time used for cache expiry and other time-based state.
+
+    Returns:
+        time.time(), or in replay mode the recording's clock, i.e. the time the
+        recording started plus the time elapsed since the replay started
+    """
+    return time.time() + _clock_offset
+
+
+def run_date() -> date:
+    """Today's date, on the same clock as run_time."""
+    return date.fromtimestamp(run_time())
+
+
+RUN_DIR, RUN_STATE_DIR = run_directories()
@@ -9,110 +9,107 @@ load_dotenv()
 # Filtering configuration
 APPLY_FILTERING = os.getenv("APPLY_FILTERING", "True").lower() == "true"
 
+# Persistent state directory under src/ (set STATE_DIR in the environment to use a scratch directory)
+STATE_DIR = os.getenv("STATE_DIR", "state")
+
+# Record/replay of HTTP traffic (set CASSETTE_MODE in the environment or .env)
+# "record" saves every response under src/CASSETTE_DIR, "replay" serves them back offline
+CASSETTE_MODE = os.getenv("CASSETTE_MODE", "off").lower()
+CASSETTE_DIR = os.getenv("CASSETTE_DIR", "cassettes")
+
 # Rate limiting configuration
-REQUEST_DELAY_SECONDS = 3  # Delay between requests to be respectful
-TIMEOUT_SECONDS = 10  # Request timeout
-
-# Keywords to include in job searches
-INCLUDE_KEYWORDS = [
-    # The first four terms here are expected to catch all relevant jobs
-    # Therefore they are frontloaded, to speed up scraping script
-    "Engineer",
-    "Developer",
-    "Software",
-    "MTS",
-    "Technical Staff"
-    # The remaining terms are unneeded but may help catch any oddball job titles
-    "Backend",
-    "Stack",  # Covers various spellings of full-stack
-    "Python",
-    "Go",
-    "JavaScript",
-    "Node.js",
-    "Web",
-    "Infrastructure",
-    "DevOps",
-    "Systems",
-    "Reliability",  # e.g. Site Reliability Engineer
-    "Platform",  # e.g. Platform Engineer
-    "Data",
-    "Machine Learning",
-    "ML",
-    "AI",
-    "SRE",
-    "Cloud Engineer",
-    "API",
-    "Microservice",
-    "Distributed",
-]
+REQUEST_DELAY_SECONDS = 3  # Delay between requests to the same host, to be respectful
+# Share per-host pacing with other scraper processes (shards, overlapping cron runs) through
+# a token bucket ledger in src/state/rate_limits.sqlite
+SHARED_RATE_LIMITS = True
+RATE_LIMIT_BURST = 1  # Requests a host's bucket can hold (1 means strict spacing)
+CONNECT_TIMEOUT_SECONDS = 5  # Time allowed to establish a connection
+READ_TIMEOUT_SECONDS = 10  # Time allowed between bytes of a response
 
-# Keywords to exclude from job searches
-EXCLUDE_KEYWORDS = [
-    # Filter out senior and managerial roles
-    "Senior",
-    "Staff",
-    "III",
-    "IV",
-    "V",
-    "Experienced",
-    "Distinguished",
-    "Principal",
-    "Lead",
-    "Manager",
-    "Dir",  # e.g. Director
-    "VP",
-    "Head",
-    "Chief",
-    "Sr",
-    "VP",
-    "CTO",
-    "President",
-    # Filter out roles in areas that are definitely out of scope
-    "Ambassador",
-    "Recruit",
-    "Sourcer",
-    "Solutions Architect",
-    "Analyst",
-    "Technical Support",
-    "Partner",
-    "Security",
-    "Hardware",
-    "Mobile",
-    "iOS",
-    "Research",
-    "Sales",
-    "Scientist",
-    "Trainer",
-    "Solutions Engineer",
-    "Design",
-    "Firmware",
-    "Control Systems",
-    "Conductor",
-    "Electrical",
-    "Mechanical",
-    "FGPA",
-    "Field",
-    "Power",
-    "Energy",
-    "Propulsion",
-    "Radar",
-    "Robotics",
-    "Sustainment",
-    "Motion",
-    "Fluid",
-    "Manufacturing",
-    "Thermal",
-    "Telecom",
-    "Structural",
-    "Material",
-    "Industrial",
-    "Aerospace",
-    "Sourcing",
-    "Perception",
-    "Vision",
-    "Administrator",
-    "Forward Deployed",
-]
+# Request quotas (None or missing for no limit)
+# Lower tiers stop short of a reserve kept for PRIORITY_TIERS, and scrape fewer pages once the
+# run quota runs low; companies cut short are reported as truncated instead of failed
+RUN_REQUEST_QUOTA = None  # Requests allowed per run
+HOST_DAILY_REQUEST_QUOTAS = {  # Requests allowed per host per day
+    # "api.greenhouse.io": 5000,
+}
+QUOTA_PRIORITY_RESERVE = 0.2  # Share of each quota only PRIORITY_TIERS may use
+# Share of the run quota left when lower tiers start scraping fewer pages
+QUOTA_SHRINK_BELOW = 0.5
+
+# Hedged requests
+# A GET that hasn't answered within its host's p95 latency gets one duplicate, and the first
+# response wins; duplicates are capped at a fraction of each host's requests, and are only
+# sent when the host's rate limit has a slot free
+HEDGED_REQUESTS = False
+HEDGE_BUDGET_FRACTION = 0.05  # Maximum duplicates per request sent to a host
+HEDGE_MIN_SAMPLES = 20  # Latencies observed for a host before it can be hedged
+# Also hedge the POST searches used for Workday and Uber, which are read-only
+HEDGE_POST_REQUESTS = False
+
+# Time budget configuration (in seconds, None for no limit)
+# When a budget runs out, pagination stops and partial results are kept
+RUN_TIME_BUDGET_SECONDS = None  # Whole run, e.g. 3300 to fit an hourly cron window
+COMPANY_TIME_BUDGET_SECONDS = 300  # Default budget for each company
+PLATFORM_TIME_BUDGET_SECONDS = {  # Per-company budget overrides by scraper
+    "myworkdayjobs": 600,
+}
+# A budget with less than this left is treated as used up, since a request couldn't finish in time
+MIN_REQUEST_SECONDS = 2
+
+# Scheduling configuration
+SCRAPER_WORKERS = (
+    4  # Companies scraped concurrently (requests stay rate limited per host)
+)
+PRIORITY_TIERS = ["Tier 1A", "Tier 1B"]  # Always scheduled ahead of other tiers
+
+# Daemon mode configuration (python run_scraper.py daemon)
+# Each tier is scraped again once its polling interval (in seconds) has elapsed
+DAEMON_TIER_INTERVALS = {
+    "Tier 1A": 15 * 60,
+    "Tier 1B": 60 * 60,
+    "Tier 2A": 4 * 60 * 60,
+    "Tier 2B": 12 * 60 * 60,
+    "Tier 2C": 24 * 60 * 60,
+}
+DAEMON_DEFAULT_INTERVAL = 24 * 60 * 60  # For tiers missing from DAEMON_TIER_INTERVALS
+
+# Adaptive polling configuration
+# Each company's next poll is scheduled from its observed rate of new matching postings,
+# and runs skip companies that aren't due yet (use --all to scrape everything).
+# PRIORITY_TIERS are always polled, and no company waits longer than its tier's daemon interval
+ADAPTIVE_POLLING = False
+# Expected detection delay (in posting-hours) allowed to build up between polls
+POLL_DELAY_BUDGET_HOURS = 12
+POLL_MIN_INTERVAL_HOURS = 1
+POLL_MAX_INTERVAL_HOURS = 7 * 24  # Every company is polled at least this often
+POLL_MIN_HISTORY = 5  # Polls recorded before a company can be skipped
+POLL_HISTORY_DAYS = 60  # Window of poll history used to estimate posting rates
+# Companies due within this margin are polled early (cron jitter)
+POLL_GRACE_MINUTES = 30
+
+# Quarantine configuration
+# Companies failing several runs in a row are skipped, apart from a single-request probe now and then
+QUARANTINE_AFTER_FAILURES = 3  # Consecutive failed runs before a company is quarantined
+QUARANTINE_PROBE_HOURS = 24  # Time between probes of a quarantined company
+
+# Deferred retry configuration
+# Requests are never retried inline; a company hitting a transient failure (timeout, connection
+# error, HTTP 429 or 5xx) is re-queued and scraped again once its backoff has passed
+RETRY_BUDGET = 10  # Deferred retries allowed across the whole run
+RETRY_MAX_PER_COMPANY = 2  # Deferred retries allowed for any one company
+RETRY_BASE_DELAY_SECONDS = (
+    30  # Backoff before a company's first retry, doubled for each further retry
+)
+
+# Keyword filter rules
+# Include and exclude keywords live in src/filter_rules.json and are validated when loaded
+# When enabled, rules are evaluated in order of observed hits per second of evaluation time
+FILTER_AUTO_ORDER = True
+
+# Filter decision cache
+# Decisions for (title, location) pairs are reused across runs until the filter configuration changes
+DECISION_CACHE_SIZE = 20000  # Most recently used decisions kept
 
 # Required URL details for companies using Workday ATS (specifically myworkdayjobs)
 # These datacenter IDs and final path segments were found by manually checking each company's job board
@@ -148,8 +145,79 @@ MYWORKDAYJOBS_URL_DETAILS = {
     },
 }
 
+# Lever scraping mode
+# "json" uses Lever's paginated postings API (falling back to HTML on failure), "html" scrapes the job board
+LEVER_MODE = "json"
+
+# Ashby scraping mode
+# "graphql" requests only the posting fields we use, "posting-api" downloads full postings including descriptions
+ASHBY_MODE = "graphql"
+
+# SmartRecruiters scraping mode
+# "json" uses SmartRecruiters' postings API with server-side keyword search, "html" scrapes the careers page
+SMARTRECRUITERS_MODE = "json"
+
+# Search queries sent to job board APIs that support server-side keyword search
+# Results of all queries are unioned; these core include keywords are expected to catch all relevant jobs
+PUSHDOWN_SEARCH_QUERIES = ["Engineer", "Developer", "Software", "MTS"]
+
+# Workday search pushdown
+# When enabled, PUSHDOWN_SEARCH_QUERIES and location filters are sent to Workday's search API
+# instead of downloading every posting, which cuts the number of pages fetched for large tenants.
+# Pushdown is always off when APPLY_FILTERING is disabled
+WORKDAY_PUSHDOWN = (
+    APPLY_FILTERING and os.getenv("WORKDAY_PUSHDOWN", "False").lower() == "true"
+)
+WORKDAY_FACET_CACHE_DAYS = 30  # How long discovered location facet IDs are reused
+
+# Netflix and Uber search pushdown
+# When enabled, PUSHDOWN_SEARCH_QUERIES, departments and (for Uber) locations are sent as native
+# search parameters, and the results of the narrow searches are unioned.
+# Pushdown is always off when APPLY_FILTERING is disabled, so every posting is still fetched.
+# Off by default, since the department and location values depend on each API's taxonomy
+NETFLIX_PUSHDOWN = (
+    APPLY_FILTERING and os.getenv("NETFLIX_PUSHDOWN", "False").lower() == "true"
+)
+NETFLIX_DEPARTMENTS = ["Engineering", "Data & Insights"]  # Sent as the "Teams" filter
+UBER_PUSHDOWN = (
+    APPLY_FILTERING and os.getenv("UBER_PUSHDOWN", "False").lower() == "true"
+)
+UBER_DEPARTMENTS = ["Engineering", "Data Science"]
+UBER_LOCATIONS = [  # Countries (ISO 3166-1 alpha-3) in the US and EU with Uber offices
+    {"country": country}
+    for country in [
+        "USA",
+        "NLD",
+        "DEU",
+        "FRA",
+        "ESP",
+        "POL",
+        "DNK",
+        "IRL",
+        "BGR",
+        "PRT",
+    ]
+]
+
+# Page-size negotiation for paginated APIs (Netflix, Uber, Workday)
+# The largest page size each company's API accepts is probed and reused on later runs
+PAGE_SIZE_NEGOTIATION = True
+PAGE_SIZE_CACHE_DAYS = 7  # How long a probed page size is reused before probing again
+
+# Pipelined pagination for paginated APIs (Netflix, Uber, Workday, SmartRecruiters)
+# Requests the next page in the background while the current page is parsed
+PAGE_PREFETCH = True
+
+# Incremental pagination for paginated scrapers (Netflix, Uber, Workday, SmartRecruiters)
+# Pagination stops once several consecutive pages contain only postings seen on earlier runs
+INCREMENTAL_PAGINATION = True
+INCREMENTAL_KNOWN_PAGES = 2  # Consecutive already-seen pages before stopping
+INCREMENTAL_FULL_SWEEP_EVERY = 10  # Every Nth run walks every page to catch stragglers
+
 # Output configuration
 OUTPUT_TO_CONSOLE = True
 OUTPUT_TO_FILES_BY_COMPANY = True
 OUTPUT_TO_FILES_BY_SCRAPE = True
+OUTPUT_TO_JSONL = True  # One JSON record per posting, plus a per-run manifest
+JSONL_GZIP = False  # Compress JSONL results with gzip
 LOG_LEVEL = "INFO"
@@ -0,0 +1,151 @@
+"""
+Long-running daemon mode.
+Loads found jobs, history and the company registry once, keeps connections warm,
+and scrapes each tier on its own polling interval instead of all tiers per run.
+SIGHUP reloads company lists, filter rules and tier intervals; SIGTERM finishes
+the companies in progress, saves results and exits. A cycle that fails is
+logged and skipped, and the daemon keeps scheduling.
+"""
+
+import importlib
+import signal
+import threading
+import time
+import traceback
+from datetime import datetime
+from typing import Dict
+
+import companies as company_lists
+import config
+from config import DAEMON_TIER_INTERVALS, DAEMON_DEFAULT_INTERVAL
+from decision_cache import decision_cache, filter_config_hash
+from filters import keyword_filter, load_filter_rules
+from main import get_tiers, print_keywords, run_cycle
+from registry import load_registry
+from scheduler import load_history
+from polling import load_poll_schedule
+from quarantine import load_quarantine
+from tracking import end_run
+from utils import load_found_jobs
+
+
+def reload_config() -> Dict[str, float]:
+    """
+    Reload company lists, filter rules and tier intervals.
+
+    Invalid filter rules are reported and the previous rules kept.
+    Other settings in config.py only take effect after a restart.
+
+    Returns:
+        Polling interval in seconds for each tier
+    """
+    importlib.reload(company_lists)
+
+    try:
+        keyword_filter.reload(load_filter_rules())
+        decision_cache.revalidate(filter_config_hash())
+    except ValueError as e:
+        print(f"Keeping previous filter rules: {e}")
+
+    return importlib.reload(config).DAEMON_TIER_INTERVALS
+
+
+def run_daemon(poll_all: bool = False) -> None:
+    """
+    Scrape each tier whenever its polling interval has elapsed, until SIGTERM.
+
+    Args:
+        poll_all: Whether to scrape every company in a due tier, even those
+            not due for their own adaptive poll yet
+    """
+    print(
+        f"Job Scraper Daemon Starting - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+    )
+    print_keywords()
+
+    stop_requested = threading.Event()
+    reload_requested = threading.Event()
+    wake_up = threading.Event()
+
+    def handle_sigterm(signum, frame):
+        print("\nShutdown requested, finishing companies in progress...")
+        stop_requested.set()
+        wake_up.set()
+        end_run()
+
+    def handle_sighup(signum, frame):
+        print("\nReload requested, reloading after the current cycle...")
+        reload_requested.set()
+        wake_up.set()
+
+    signal.signal(signal.SIGTERM, handle_sigterm)
+    if hasattr(signal, "SIGHUP"):  # Not available on Windows
+        signal.signal(signal.SIGHUP, handle_sighup)
+
+    # State is loaded once and kept up to date in memory between cycles
+    print("Loading previously found jobs...")
+    found_jobs = load_found_jobs()
+    print(f"Loaded {len(found_jobs)} previously found jobs")
+    history = load_history()
+    poll_schedule = load_poll_schedule()
+    quarantine = load_quarantine()
+    registry = load_registry(
+        [company for _, tier_companies in get_tiers() for company in tier_companies]
+    )
+
+    intervals = DAEMON_TIER_INTERVALS
+    next_due: Dict[str, float] = {}  # Monotonic time each tier is next due
+
+    while not stop_requested.is_set():
+        wake_up.clear()
+        if reload_requested.is_set():
+            reload_requested.clear()
+            intervals = reload_config()
+            print("Reloaded company lists, filter rules and tier intervals")
+
+        tiers = get_tiers()
+        now = time.monotonic()
+        due_tiers = [
+            (tier_name, tier_companies)
+            for tier_name, tier_companies in tiers
+            if next_due.get(tier_name, now) <= now
+        ]
+
+        if due_tiers:
+            print(f"\n{'=' * 60}")
+            print(
+                f"Scraping {', '.join(tier_name for tier_name, _ in due_tiers)} - "
+                f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            )
+            print(f"{'=' * 60}")
+            # A failed cycle only costs that cycle, as a failed cron run would
+            try:
+                run_cycle(
+                    due_tiers,
+                    found_jobs,
+                    history,
+                    registry,
+                    poll_schedule,
+                    quarantine,
+                    poll_all,
+                )
+            except Exception as e:
+                print(f"\nUnexpected error during scrape cycle: {e}")
+                traceback.print_exc()
+
+            # Intervals are measured from the start of each tier's scrape
+            for tier_name, _ in due_tiers:
+                next_due[tier_name] = now + intervals.get(
+                    tier_name, DAEMON_DEFAULT_INTERVAL
+                )
+            continue
+
+        sleep_seconds = min(next_due.values()) - time.monotonic()
+        if sleep_seconds > 0:
+            next_scrape = datetime.fromtimestamp(time.time() + sleep_seconds)
+            print(f"\nNext scrape at {next_scrape.strftime('%Y-%m-%d %H:%M:%S')}")
+            wake_up.wait(sleep_seconds)
+
+    print(
+        f"\nJob Scraper Daemon Stopped - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+    )
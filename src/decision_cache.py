@@ -0,0 +1,111 @@
+"""
+Cross-run cache of job filter decisions.
+The same (title, location) pairs come back every run across many companies, so
+each decision is remembered in a bounded LRU cache that's saved between runs.
+The cache is tagged with a hash of the filter configuration and starts empty
+whenever the configuration changes.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from config import APPLY_FILTERING, DECISION_CACHE_SIZE
+from filters import keyword_filter
+from state import load_state, save_state
+
+DECISION_CACHE_STATE = "filter_decisions"
+
+
+def filter_config_hash() -> str:
+    """Hash of every setting that affects filter decisions."""
+    config = {
+        "include": sorted(k.lower() for k in keyword_filter.keywords("include")),
+        "exclude": sorted(k.lower() for k in keyword_filter.keywords("exclude")),
+        "apply_filtering": APPLY_FILTERING,
+    }
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def normalize(title: str, location: str) -> str:
+    """Build the cache key for a (title, location) pair."""
+    return f"{' '.join(title.lower().split())}|{' '.join(location.lower().split())}"
+
+
+class DecisionCache:
+    """Bounded LRU cache of filter decisions, with hit and time-saved counters."""
+
+    def __init__(self, config_hash: str, max_entries: int):
+        self.config_hash = config_hash
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[str, bool]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.miss_seconds = 0.0  # Time spent evaluating decisions that weren't cached
+        self._lock = threading.Lock()
+
+        cached = load_state(DECISION_CACHE_STATE, {})
+        if cached.get("config_hash") == config_hash:
+            # Stored oldest first, so the most recently used entries end up last
+            for key, decision in cached.get("entries", [])[-max_entries:]:
+                self.entries[key] = decision
+
+    def revalidate(self, config_hash: str) -> None:
+        """Clear the cache if the filter configuration has changed."""
+        with self._lock:
+            if config_hash != self.config_hash:
+                self.config_hash = config_hash
+                self.entries.clear()
+
+    def get(self, title: str, location: str) -> Optional[bool]:
+        """Look up a decision, or None if it isn't cached."""
+        key = normalize(title, location)
+        with self._lock:
+            decision = self.entries.get(key)
+            if decision is None:
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return decision
+
+    def put(self, title: str, location: str, decision: bool, seconds: float) -> None:
+        """Store a freshly evaluated decision and the time it took to evaluate."""
+        key = normalize(title, location)
+        with self._lock:
+            self.misses += 1
+            self.miss_seconds += seconds
+            self.entries[key] = decision
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def stats(self) -> Dict:
+        """
+        Summarize cache effectiveness for this run.
+
+        Time saved is estimated from the average time of decisions that had to be evaluated.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            average_miss = self.miss_seconds / self.misses if self.misses else 0.0
+            return {
+                "lookups": lookups,
+                "hits": self.hits,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "seconds_saved": self.hits * average_miss,
+                "entries": len(self.entries),
+            }
+
+    def save(self) -> None:
+        """Persist the cache, least recently used entries first."""
+        with self._lock:
+            entries = [[key, decision] for key, decision in self.entries.items()]
+        save_state(
+            DECISION_CACHE_STATE,
+            {"config_hash": self.config_hash, "entries": entries},
+        )
+
+
+decision_cache = DecisionCache(filter_config_hash(), DECISION_CACHE_SIZE)
@@ -0,0 +1,273 @@
+"""
+Keyword filter rules for job titles.
+Rules are loaded from src/filter_rules.json and validated once at startup. Each
+rule keeps hit, miss and time counters across runs, which are used to evaluate
+the most selective rules first and to report which rules do the work.
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from config import FILTER_AUTO_ORDER
+from state import load_state, save_state
+
+FILTER_RULES_FILE = Path(__file__).parent / "filter_rules.json"
+FILTER_STATS_STATE = "filter_stats"
+
+RULE_KINDS = ("include", "exclude")
+RULE_FIELDS = {"keyword", "group", "note"}
+
+
+def load_filter_rules(rules_file: Path = FILTER_RULES_FILE) -> Dict[str, List[Dict]]:
+    """
+    Load and validate keyword filter rules.
+
+    Every problem in the file is reported at once, so typos such as
+    duplicated keywords are caught before any scraping starts.
+
+    Args:
+        rules_file: Path to the JSON rules file
+
+    Returns:
+        Dictionary mapping "include" and "exclude" to lists of rule dictionaries
+
+    Raises:
+        ValueError: If the file can't be parsed or contains invalid rules
+    """
+    try:
+        with open(rules_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ValueError(f"Could not load filter rules from {rules_file.name}: {e}")
+
+    if not isinstance(data, dict) or set(data) != set(RULE_KINDS):
+        raise ValueError(
+            f"Filter rules in {rules_file.name} must be an object with exactly "
+            f"the keys {', '.join(RULE_KINDS)}"
+        )
+
+    problems = []
+    keywords_by_kind = {}
+    for kind in RULE_KINDS:
+        rules = data[kind]
+        if not isinstance(rules, list):
+            problems.append(f"{kind}: must be a list of rules")
+            continue
+
+        seen_keywords = set()
+        for index, rule in enumerate(rules):
+            location = f"{kind}[{index}]"
+            if not isinstance(rule, dict):
+                problems.append(f"{location}: must be an object")
+                continue
+
+            unknown_fields = set(rule) - RULE_FIELDS
+            if unknown_fields:
+                problems.append(
+                    f"{location}: unknown field(s) {', '.join(sorted(unknown_fields))}"
+                )
+
+            keyword = rule.get("keyword")
+            if not isinstance(keyword, str) or not keyword.strip():
+                problems.append(f"{location}: keyword must be a non-empty string")
+                continue
+            if keyword != keyword.strip():
+                problems.append(f"{location}: keyword '{keyword}' has extra whitespace")
+
+            for field in ("group", "note"):
+                if field in rule and not isinstance(rule[field], str):
+                    problems.append(f"{location}: {field} must be a string")
+
+            if keyword.lower() in seen_keywords:
+                problems.append(f"{location}: duplicate keyword '{keyword}'")
+            seen_keywords.add(keyword.lower())
+
+        keywords_by_kind[kind] = seen_keywords
+
+    # A keyword in both lists would reject every title it lets in
+    for keyword in sorted(
+        keywords_by_kind.get("include", set()) & keywords_by_kind.get("exclude", set())
+    ):
+        problems.append(f"keyword '{keyword}' is both included and excluded")
+
+    if problems:
+        raise ValueError(
+            f"Invalid filter rules in {rules_file.name}:\n  - "
+            + "\n  - ".join(problems)
+        )
+
+    return data
+
+
+class FilterRule:
+    """A single compiled keyword rule with its usage counters."""
+
+    def __init__(self, kind: str, rule: Dict, stats: Dict):
+        self.kind = kind
+        self.keyword = rule["keyword"]
+        self.group = rule.get("group", "")
+        self.pattern = self.keyword.lower()
+        self.hits = stats.get("hits", 0)
+        self.misses = stats.get("misses", 0)
+        self.seconds = stats.get("seconds", 0.0)
+
+    @property
+    def stats_key(self) -> str:
+        return f"{self.kind}:{self.pattern}"
+
+    @property
+    def evaluations(self) -> int:
+        return self.hits + self.misses
+
+    def priority(self) -> float:
+        """
+        Rank rules for evaluation order.
+
+        Both rule lists stop at the first matching rule, so rules are best
+        evaluated in decreasing order of hits per second spent evaluating them.
+        Rules without observations are tried first so they get measured.
+        """
+        if not self.evaluations:
+            return float("inf")
+        return self.hits / max(self.seconds, 1e-9)
+
+
+class KeywordFilter:
+    """Include/exclude keyword filter with per-rule counters."""
+
+    def __init__(self, rules: Dict[str, List[Dict]], stats: Dict[str, Dict]):
+        self.rules = {
+            kind: [
+                FilterRule(
+                    kind, rule, stats.get(f"{kind}:{rule['keyword'].lower()}", {})
+                )
+                for rule in rules[kind]
+            ]
+            for kind in RULE_KINDS
+        }
+        # Evaluation order is fixed for the whole run
+        self.ordered = {
+            kind: (
+                sorted(kind_rules, key=lambda rule: -rule.priority())
+                if FILTER_AUTO_ORDER
+                else list(kind_rules)
+            )
+            for kind, kind_rules in self.rules.items()
+        }
+        self._lock = threading.Lock()
+
+    def reload(self, rules: Dict[str, List[Dict]]) -> None:
+        """Replace the rules, keeping the counters of rules that still exist."""
+        self.save_stats()
+        self.__init__(rules, load_state(FILTER_STATS_STATE, {}))
+
+    def keywords(self, kind: str) -> List[str]:
+        """Keywords of one kind of rule, in file order."""
+        return [rule.keyword for rule in self.rules[kind]]
+
+    def _first_match(self, kind: str, title_lower: str) -> Tuple[int, bool, float]:
+        """
+        Find the first rule of a kind that matches a title.
+
+        The rule loop is timed as a whole rather than per rule, since timing
+        every substring check costs more than the checks themselves.
+
+        Returns:
+            Tuple of (number of rules evaluated, whether the last one matched,
+            seconds spent evaluating them)
+        """
+        start = time.perf_counter()
+        evaluated = 0
+        hit = False
+        for rule in self.ordered[kind]:
+            evaluated += 1
+            if rule.pattern in title_lower:
+                hit = True
+                break
+        return evaluated, hit, time.perf_counter() - start
+
+    def _record(self, kind: str, evaluated: int, hit: bool, seconds: float) -> None:
+        # Time is split evenly between the evaluated rules, as each is one substring check
+        rules = self.ordered[kind][:evaluated]
+        for rule in rules:
+            rule.misses += 1
+            rule.seconds += seconds / evaluated
+        if hit:
+            rules[-1].misses -= 1
+            rules[-1].hits += 1
+
+    def matches(self, title: str) -> bool:
+        """
+        Check a title against the rules.
+
+        Returns:
+            True if the title matches at least one include rule and no exclude rules
+        """
+        title_lower = title.lower()
+        included = self._first_match("include", title_lower)
+        excluded = self._first_match("exclude", title_lower) if included[1] else None
+
+        # Counters are shared by all workers
+        with self._lock:
+            self._record("include", *included)
+            if excluded:
+                self._record("exclude", *excluded)
+
+        return included[1] and not (excluded and excluded[1])
+
+    def save_stats(self) -> None:
+        """Persist the cumulative counters of every rule."""
+        with self._lock:
+            stats = {
+                rule.stats_key: {
+                    "hits": rule.hits,
+                    "misses": rule.misses,
+                    "seconds": round(rule.seconds, 6),
+                }
+                for kind_rules in self.rules.values()
+                for rule in kind_rules
+                if rule.evaluations
+            }
+        save_state(FILTER_STATS_STATE, stats)
+
+
+keyword_filter = KeywordFilter(load_filter_rules(), load_state(FILTER_STATS_STATE, {}))
+
+
+def print_filter_stats(rule_filter: Optional[KeywordFilter] = None) -> None:
+    """Print per-rule counters, in evaluation order, and the rules that never fire."""
+    rule_filter = rule_filter or keyword_filter
+
+    for kind in RULE_KINDS:
+        rules = rule_filter.ordered[kind]
+        print(f"\n{kind.upper()} RULES ({len(rules)}, in evaluation order)")
+        print(
+            f"{'Keyword':<24}{'Group':<14}{'Evaluated':>11}{'Hits':>9}"
+            f"{'Hit rate':>10}{'Avg (µs)':>10}"
+        )
+        print("-" * 78)
+        for rule in rules:
+            hit_rate = (
+                f"{rule.hits / rule.evaluations:.1%}" if rule.evaluations else "-"
+            )
+            average = (
+                f"{rule.seconds / rule.evaluations * 1e6:.2f}"
+                if rule.evaluations
+                else "-"
+            )
+            print(
+                f"{rule.keyword:<24}{rule.group:<14}{rule.evaluations:>11,}"
+                f"{rule.hits:>9,}{hit_rate:>10}{average:>10}"
+            )
+
+        never_fired = [
+            rule.keyword for rule in rules if rule.evaluations and not rule.hits
+        ]
+        never_evaluated = [rule.keyword for rule in rules if not rule.evaluations]
+        if never_fired:
+            print(f"\nNever fired: {', '.join(never_fired)}")
+        if never_evaluated:
+            print(f"Never evaluated: {', '.join(never_evaluated)}")
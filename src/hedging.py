@@ -0,0 +1,164 @@
+"""
+Hedged requests.
+Tracks each host's recent response latencies, and when a request hasn't
+answered within the host's p95 latency, sends one duplicate and uses whichever
+response arrives first. Duplicates are limited to a fraction of each host's
+requests, and are only sent if the host's rate limit has a slot free at that
+moment, so hedging never makes a run noticeably less polite.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from typing import Callable, Deque, Dict, Optional
+
+from config import (
+    SCRAPER_WORKERS,
+    HEDGED_REQUESTS,
+    HEDGE_BUDGET_FRACTION,
+    HEDGE_MIN_SAMPLES,
+)
+from tracking import budget_exhausted, record_request
+
+LATENCY_SAMPLES = 200  # Recent latencies kept per host
+
+
+class _HostHedging:
+    """Latency samples and hedge accounting for a single host."""
+
+    def __init__(self):
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.seconds_saved = 0.0
+
+
+_hosts: Dict[str, _HostHedging] = {}
+_lock = threading.Lock()
+_executor = ThreadPoolExecutor(
+    max_workers=max(4, SCRAPER_WORKERS * 4), thread_name_prefix="hedged-request"
+)
+
+
+def _host(host: str) -> _HostHedging:
+    with _lock:
+        return _hosts.setdefault(host, _HostHedging())
+
+
+def _p95(latencies) -> float:
+    ordered = sorted(latencies)
+    return ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+
+
+def _hedge_delay(state: _HostHedging) -> Optional[float]:
+    """Seconds to wait before hedging, or None if the host can't be hedged yet."""
+    with _lock:
+        if len(state.latencies) < HEDGE_MIN_SAMPLES:
+            return None
+        # Budget: duplicates stay within a fraction of the host's requests
+        if state.hedges + 1 > HEDGE_BUDGET_FRACTION * state.requests:
+            return None
+        return _p95(state.latencies)
+
+
+def _timed(send: Callable[[], object], state: _HostHedging) -> object:
+    """Run a request, recording its latency if it gets a response."""
+    start = time.monotonic()
+    response = send()
+    with _lock:
+        state.latencies.append(time.monotonic() - start)
+    return response
+
+
+def send_hedged(
+    send: Callable[[], object],
+    host: str,
+    allow_hedge: bool,
+    take_slot: Callable[[], bool],
+) -> object:
+    """
+    Send a request, hedging it with one duplicate if it's slower than usual.
+
+    Args:
+        send: Function that sends the request and returns its response
+        host: Host the request is sent to, for latency tracking and the hedge budget
+        allow_hedge: Whether the request is idempotent and may be duplicated
+        take_slot: Function that takes a rate limit slot for the duplicate if one
+            is free right now, returning whether it did
+
+    Returns:
+        The first response to arrive. Exceptions are only raised if every
+        attempt failed.
+    """
+    state = _host(host)
+    with _lock:
+        state.requests += 1
+
+    delay = _hedge_delay(state) if HEDGED_REQUESTS and allow_hedge else None
+    if delay is None:
+        return _timed(send, state)
+
+    primary = _executor.submit(copy_context().run, _timed, send, state)
+    if wait([primary], timeout=delay).done:
+        return primary.result()
+
+    # The duplicate must fit the company's request limit and quotas, and goes
+    # through the host's rate limit like any request, or isn't sent
+    if budget_exhausted(host, truncate=False) or not take_slot():
+        return primary.result()
+
+    with _lock:
+        state.hedges += 1
+    record_request(host)  # The duplicate counts against the company like any request
+    hedge = _executor.submit(copy_context().run, _timed, send, state)
+
+    done, _ = wait([primary, hedge], return_when=FIRST_COMPLETED)
+    winner = hedge if hedge in done and primary not in done else primary
+    if winner.exception() is not None:
+        # Fall back to the other attempt if the first one to finish failed
+        winner = hedge if winner is primary else primary
+        if winner.exception() is not None:
+            raise primary.exception()
+
+    if winner is hedge:
+        hedge_finished = time.monotonic()
+        with _lock:
+            state.hedge_wins += 1
+
+        def record_saving(future: Future) -> None:
+            # Counted once the slow primary finishes (or gives up)
+            with _lock:
+                state.seconds_saved += time.monotonic() - hedge_finished
+
+        primary.add_done_callback(record_saving)
+
+    return winner.result()
+
+
+def take_hedge_stats() -> Dict:
+    """
+    Summarize hedging since the last call, and reset the counters.
+
+    Returns:
+        Dictionary with "requests", "hedges", "hedge_rate", "hedge_wins" and
+        "seconds_saved" totals across all hosts
+    """
+    with _lock:
+        totals = {
+            "requests": sum(state.requests for state in _hosts.values()),
+            "hedges": sum(state.hedges for state in _hosts.values()),
+            "hedge_wins": sum(state.hedge_wins for state in _hosts.values()),
+            "seconds_saved": sum(state.seconds_saved for state in _hosts.values()),
+        }
+        for state in _hosts.values():
+            state.requests = state.hedges = state.hedge_wins = 0
+            state.seconds_saved = 0.0
+
+    totals["hedge_rate"] = (
+        totals["hedges"] / totals["requests"] if totals["requests"] else 0.0
+    )
+    return totals
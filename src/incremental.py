@@ -0,0 +1,111 @@
+"""
+Incremental pagination for paginated scrapers.
+Keeps a per-company index of every posting seen on previous runs (the company's
+high-water mark), so pagination can stop once consecutive pages contain nothing new.
+A full sweep still runs periodically to catch postings the early stop skipped.
+"""
+
+from typing import Dict, List
+
+from config import (
+    INCREMENTAL_PAGINATION,
+    INCREMENTAL_KNOWN_PAGES,
+    INCREMENTAL_FULL_SWEEP_EVERY,
+)
+from state import load_state, save_state
+
+
+def _state_name(company: str) -> str:
+    safe_company_name = company.lower().replace(" ", "_").replace("-", "_")
+    return f"seen_postings/{safe_company_name}"
+
+
+def start_incremental(company: str) -> Dict:
+    """
+    Load a company's seen-postings index and decide whether this run is a full sweep.
+
+    Args:
+        company: Name of company, as passed to its scraper
+
+    Returns:
+        Tracker dictionary to pass to page_is_known and finish_incremental
+    """
+    index = load_state(_state_name(company), None)
+
+    # First run, incremental mode disabled, a periodic full sweep is due, or
+    # the last full sweep didn't reach the end of the listings
+    full_sweep = (
+        not INCREMENTAL_PAGINATION
+        or index is None
+        or index.get("full_sweep_owed", False)
+        or index.get("runs_since_full_sweep", 0) + 1 >= INCREMENTAL_FULL_SWEEP_EVERY
+    )
+
+    return {
+        "company": company,
+        "seen": set(index["keys"]) if index else set(),
+        "observed": set(),
+        "known_streak": 0,
+        "full_sweep": full_sweep,
+        "runs_since_full_sweep": index.get("runs_since_full_sweep", 0) if index else 0,
+    }
+
+
+def reset_known_streak(tracker: Dict) -> None:
+    """Reset the consecutive known-page count, e.g. when starting a new search."""
+    tracker["known_streak"] = 0
+
+
+def page_is_known(tracker: Dict, page_keys: List[str]) -> bool:
+    """
+    Record a page's postings and check whether pagination can stop early.
+
+    Args:
+        tracker: Tracker dictionary from start_incremental
+        page_keys: Keys of every posting on the page, whether or not it matched filters
+
+    Returns:
+        True once INCREMENTAL_KNOWN_PAGES consecutive pages contained only known
+        postings (never during a full sweep)
+    """
+    tracker["observed"].update(page_keys)
+
+    if page_keys and all(key in tracker["seen"] for key in page_keys):
+        tracker["known_streak"] += 1
+    else:
+        tracker["known_streak"] = 0
+
+    return (
+        not tracker["full_sweep"] and tracker["known_streak"] >= INCREMENTAL_KNOWN_PAGES
+    )
+
+
+def finish_incremental(tracker: Dict, complete: bool) -> None:
+    """
+    Save the company's updated seen-postings index.
+
+    After a complete full sweep the index is replaced by the postings observed,
+    which drops postings that have since been taken down. Otherwise the
+    observed postings are added to the existing index. A full sweep that stops
+    before the last page (time budget, request quota, failed page) stays owed,
+    so the next run sweeps again instead of stopping early at known pages.
+
+    Args:
+        tracker: Tracker dictionary from start_incremental
+        complete: Whether pagination reached the natural end of the listings
+    """
+    if tracker["full_sweep"] and complete:
+        keys = tracker["observed"]
+        runs_since_full_sweep = 0
+    else:
+        keys = tracker["seen"] | tracker["observed"]
+        runs_since_full_sweep = tracker["runs_since_full_sweep"] + 1
+
+    save_state(
+        _state_name(tracker["company"]),
+        {
+            "keys": sorted(keys),
+            "runs_since_full_sweep": runs_since_full_sweep,
+            "full_sweep_owed": tracker["full_sweep"] and not complete,
+        },
+    )
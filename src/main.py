@@ -3,21 +3,64 @@ Main orchestrator for the job scraper.
 Loops through company lists, runs scrapers, applies filters, and manages duplicates.
 """
 
+import argparse
+import heapq
+import itertools
 import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Tuple
 from output import print_debug
 from collections import defaultdict
 
-from companies import tier_1a, tier_1b, tier_2a, tier_2b, tier_2c
-from output import log_to_files, print_summary, print_error
-from utils import load_found_jobs, save_new_jobs, get_new_companies
+import companies as company_lists
+from output import log_to_files, print_summary, print_error, JsonlSink
+from utils import load_found_jobs, save_new_jobs
+from registry import load_registry, get_new_companies, update_registry
+from quarantine import (
+    load_quarantine,
+    split_quarantined,
+    update_quarantine,
+    scrape_failed,
+)
+from polling import (
+    load_poll_schedule,
+    split_due_companies,
+    print_not_due,
+    update_poll_schedule,
+)
+from scheduler import load_history, update_history, plan_schedule, print_plan
+from tracking import (
+    start_company,
+    finish_company,
+    set_run_budget,
+    run_budget_exhausted,
+    time_remaining,
+)
+from filters import keyword_filter, print_filter_stats
+from decision_cache import decision_cache
+from hedging import take_hedge_stats
+from quotas import (
+    start_quota_run,
+    quota_exhausted,
+    company_request_limit,
+    save_quota_usage,
+    quota_report,
+)
 from config import (
     OUTPUT_TO_CONSOLE,
     OUTPUT_TO_FILES_BY_COMPANY,
     OUTPUT_TO_FILES_BY_SCRAPE,
-    INCLUDE_KEYWORDS,
-    EXCLUDE_KEYWORDS,
+    OUTPUT_TO_JSONL,
+    JSONL_GZIP,
+    SCRAPER_WORKERS,
+    RUN_TIME_BUDGET_SECONDS,
+    COMPANY_TIME_BUDGET_SECONDS,
+    PLATFORM_TIME_BUDGET_SECONDS,
+    RETRY_BUDGET,
+    RETRY_MAX_PER_COMPANY,
+    RETRY_BASE_DELAY_SECONDS,
 )
 from scrapers import (
     lever,
@@ -31,143 +74,507 @@ from scrapers import (
 )
 
 
-def scrape_tier(
-    tier_name: str, companies: List[Dict], found_jobs=Set[str]
-) -> Dict[str, List[Dict]]:
+def get_scrapable_companies(
+    tiers: List[Tuple[str, List[Dict]]],
+) -> List[Tuple[str, Dict]]:
     """
-    Scrape jobs for all companies in a tier.
+    Collect the companies that can be scraped from all tiers.
 
     Args:
-        tier_name: Name of the tier (for logging)
-        companies: List of companies formatted as dictionaries
-        found_jobs: Set containing URLs of previously found listings
+        tiers: List of (tier name, list of company dictionaries) tuples
 
     Returns:
-        Dictionary mapping company names to lists of jobs found
+        List of (tier name, company dictionary) tuples for verified companies
     """
-    tier_results = {}
-
-    print(f"\n{'='*60}")
-    print(f"SCRAPING {tier_name.upper()}")
-    print(f"{'='*60}")
-
-    # Scrape all companies in tier
-    for company_data in companies:
-        company_name = company_data.get("name", "")
-        formatted_name = company_data.get("formatted_name", "")
-        scraper = company_data.get("scraper", "")
-        manually_verified = company_data.get("manually_verified", False)
-
-        # Skip companies without scrapers configured
-        if not scraper:
-            print_debug(f"No scraper configured for {company_name}")
-            continue
-
-        # Skip companies that haven't been manually verified
-        if not manually_verified:
-            print(f"⚠️  Skipping {company_name} - scraper not manually verified")
-            continue
-
-        print(f"\n{'- '*30}")
-        try:
-            # formatted_name not needed for custom scrapers
-            if scraper in [
-                lever,
-                greenhouse,
-                ashby,
-                myworkdayjobs,
-                myworkdaysite,
-                smartrecruiters,
-                jobvite,
-                icims,
-            ]:
-                jobs = scraper(formatted_name, found_jobs)
-            else:
-                jobs = scraper(found_jobs)
-            tier_results[company_name] = jobs
-
-            # Print results and log to files
-            print(f"Found {len(jobs)} new matching jobs for {company_name}\n")
-            for job in jobs:
-                # Include location if available
-                if job.get("location"):
-                    job_line = f"{company_name} --- {job['title']} ({job['location']})"
-                else:
-                    job_line = f"{company_name} --- {job['title']}"
-                print(job_line)
-                print(job["url"])
-                print()
-                log_to_files(company_name, job_line, job["url"])
-
-        except Exception as e:
-            print_error(company_name, f"Unexpected error: {e}")
-            tier_results[company_name] = []
-
-    return tier_results
+    scrapable_companies = []
 
+    for tier_name, companies in tiers:
+        for company_data in companies:
+            company_name = company_data.get("name", "")
+            scraper = company_data.get("scraper", "")
+            manually_verified = company_data.get("manually_verified", False)
 
-def main():
+            # Skip companies without scrapers configured
+            if not scraper:
+                print_debug(f"No scraper configured for {company_name}")
+                continue
+
+            # Skip companies that haven't been manually verified
+            if not manually_verified:
+                print(f"⚠️  Skipping {company_name} - scraper not manually verified")
+                continue
+
+            scrapable_companies.append((tier_name, company_data))
+
+    return scrapable_companies
+
+
+def scrape_company(
+    tier_name: str,
+    company_data: Dict,
+    found_jobs: Set[str],
+    probe: bool = False,
+    expected_requests: Optional[float] = None,
+) -> Tuple[List[Dict], Dict]:
     """
-    Main function that orchestrates the entire scraping process.
+    Scrape jobs for a single company, tracking its duration and page count.
+
+    The scrape is bounded by the company's time budget (COMPANY_TIME_BUDGET_SECONDS,
+    or its platform's override) as well as the whole-run budget. Lower-tier
+    companies also get a request limit once the run's request quota runs low.
+
+    Args:
+        tier_name: Name of the tier the company belongs to
+        company_data: Company dictionary with scraper info
+        found_jobs: Set containing keys of previously found listings
+        probe: Whether this is a quarantine probe, limited to a single request
+        expected_requests: Requests the company usually needs, from scrape history
+
+    Returns:
+        Tuple of (list of new jobs found, stats dictionary for the company)
     """
+    company_name = company_data.get("name", "")
+    formatted_name = company_data.get("formatted_name", "")
+    scraper = company_data.get("scraper", "")
+
+    budget_seconds = PLATFORM_TIME_BUDGET_SECONDS.get(
+        scraper.__name__, COMPANY_TIME_BUDGET_SECONDS
+    )
+    stats = start_company(
+        company_name,
+        scraper.__name__,
+        tier_name,
+        budget_seconds,
+        request_limit=(
+            1 if probe else company_request_limit(tier_name, expected_requests)
+        ),
+    )
+
+    # Don't start new companies once the whole run is out of time
+    if run_budget_exhausted():
+        print(f"⏱️  Skipping {company_name} - run time budget exhausted")
+        stats["truncated"] = True
+        return [], finish_company()
+
+    if quota_exhausted(tier_name):
+        print(f"⏱️  Skipping {company_name} - run request quota exhausted")
+        stats["truncated"] = True
+        return [], finish_company()
 
-    print(f"Job Scraper Starting - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    try:
+        # formatted_name not needed for custom scrapers
+        if scraper in [
+            lever,
+            greenhouse,
+            ashby,
+            myworkdayjobs,
+            myworkdaysite,
+            smartrecruiters,
+            jobvite,
+            icims,
+        ]:
+            jobs = scraper(formatted_name, found_jobs)
+        else:
+            jobs = scraper(found_jobs)
+    except Exception as e:
+        print_error(company_name, f"Unexpected error: {e}")
+        jobs = []
+
+    return jobs, finish_company()
+
+
+def report_company_jobs(
+    company_name: str, jobs: List[Dict], stats: Dict, sink: Optional[JsonlSink]
+) -> None:
+    """Print a company's new jobs and log them to files."""
+    print(f"\n{'- '*30}")
+    print(f"Found {len(jobs)} new matching jobs for {company_name}\n")
+    for job in jobs:
+        # Include location if available
+        if job.get("location"):
+            job_line = f"{company_name} --- {job['title']} ({job['location']})"
+        else:
+            job_line = f"{company_name} --- {job['title']}"
+        print(job_line)
+        print(job["url"])
+        print()
+        log_to_files(company_name, job_line, job["url"])
+
+    if sink:
+        sink.write_company(jobs, stats)
+
+
+def scrape_companies(
+    schedule: List[Tuple[str, Dict]],
+    found_jobs: Set[str],
+    workers: int,
+    sink: Optional[JsonlSink] = None,
+    probe_names: Set[str] = frozenset(),
+    history: Optional[Dict[str, Dict]] = None,
+) -> Tuple[Dict[str, List[Dict]], List[Dict]]:
+    """
+    Scrape all scheduled companies using a pool of workers.
 
-    start_time = datetime.now()
+    Companies are started in schedule order. Results are printed and logged
+    as each company finishes.
 
-    print(f"INCLUDE_KEYWORDS:")
-    print(", ".join(INCLUDE_KEYWORDS))
-    print()
+    A company whose scrape failed on a transient error is re-queued with a
+    not-before time instead of backing off in place, so workers move on to other
+    companies and the retry runs once its time comes (at the end of the run if
+    nothing else is left). Retries are limited by RETRY_BUDGET for the whole run
+    and RETRY_MAX_PER_COMPANY for each company. Quarantine probes aren't retried.
 
-    print("EXCLUDE_KEYWORDS:")
-    print(", ".join(EXCLUDE_KEYWORDS))
-    print()
+    Args:
+        schedule: Ordered (tier name, company dictionary) tuples
+        found_jobs: Set containing keys of previously found listings
+        workers: Number of companies to scrape concurrently
+        sink: JSONL sink that results are streamed to, if enabled
+        probe_names: Names of quarantined companies to probe with a single request
+        history: History dictionary as returned by load_history, used to size
+            request limits when the request quota runs low
 
-    # Load previously found jobs for duplicate prevention
-    print("Loading previously found jobs...")
-    found_jobs = load_found_jobs()
-    print(f"Loaded {len(found_jobs)} previously found jobs")
+    Returns:
+        Tuple of (dictionary mapping company names to lists of jobs found,
+        list of per-company stats dictionaries)
+    """
+    results = {}
+    run_stats = []
+    retries_left = RETRY_BUDGET
+    history = history or {}
+
+    def expected_requests(company_data: Dict) -> Optional[float]:
+        return history.get(company_data["name"], {}).get("pages")
+
+    # Heap of (not-before monotonic time, sequence, tier name, company dictionary, attempt)
+    retry_queue = []
+    sequence = itertools.count()
+    # Jobs and stats from the latest failed attempt of each re-queued company
+    earlier_attempts: Dict[str, Tuple[List[Dict], Dict]] = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        pending = {
+            executor.submit(
+                scrape_company,
+                tier_name,
+                company_data,
+                found_jobs,
+                company_data["name"] in probe_names,
+                expected_requests(company_data),
+            ): (tier_name, company_data, 0)
+            for tier_name, company_data in schedule
+        }
+
+        while pending or retry_queue:
+            # Once the run is out of time, queued retries keep their failed attempt's results
+            if run_budget_exhausted():
+                while retry_queue:
+                    name = heapq.heappop(retry_queue)[3]["name"]
+                    jobs, stats = earlier_attempts.pop(name)
+                    results[name] = jobs
+                    run_stats.append(stats)
+                    report_company_jobs(name, jobs, stats, sink)
+
+            # Start retries whose backoff has passed
+            now = time.monotonic()
+            while retry_queue and retry_queue[0][0] <= now:
+                _, _, tier_name, company_data, attempt = heapq.heappop(retry_queue)
+                print(f"🔁 Retrying {company_data['name']} (retry {attempt})")
+                future = executor.submit(
+                    scrape_company,
+                    tier_name,
+                    company_data,
+                    found_jobs,
+                    False,
+                    expected_requests(company_data),
+                )
+                pending[future] = (tier_name, company_data, attempt)
+
+            if not pending and not retry_queue:
+                break  # Queued retries were dropped because the run ran out of time
+
+            wait_seconds = retry_queue[0][0] - now if retry_queue else None
+            if not pending:
+                # Only retries are left; wake up regularly to notice the run ending
+                if wait_seconds is not None:
+                    time.sleep(max(0.0, min(wait_seconds, 1.0)))
+                continue
+            done, _ = wait(pending, timeout=wait_seconds, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                tier_name, company_data, attempt = pending.pop(future)
+                jobs, stats = future.result()
+                name = stats["name"]
+
+                # Keep jobs found by earlier attempts that stopped part way through
+                if name in earlier_attempts:
+                    earlier_jobs, earlier_stats = earlier_attempts.pop(name)
+                    if stats["truncated"] and not stats["requests"]:
+                        # The run ran out of time before the retry could start
+                        jobs, stats = earlier_jobs, earlier_stats
+                    else:
+                        seen_keys = {job["key"] for job in jobs}
+                        jobs = jobs + [
+                            job for job in earlier_jobs if job["key"] not in seen_keys
+                        ]
+                        stats["requests"] += earlier_stats["requests"]
+
+                delay = RETRY_BASE_DELAY_SECONDS * 2**attempt
+                remaining = time_remaining()
+                if (
+                    stats["retryable"]
+                    and scrape_failed(stats)
+                    and name not in probe_names
+                    and attempt < RETRY_MAX_PER_COMPANY
+                    and retries_left > 0
+                    and (remaining is None or remaining > delay)
+                ):
+                    retries_left -= 1
+                    earlier_attempts[name] = (jobs, stats)
+                    print(f"🔁 {name} hit a transient failure, retrying in {delay}s")
+                    heapq.heappush(
+                        retry_queue,
+                        (
+                            time.monotonic() + delay,
+                            next(sequence),
+                            tier_name,
+                            company_data,
+                            attempt + 1,
+                        ),
+                    )
+                    continue
+
+                results[name] = jobs
+                run_stats.append(stats)
+                report_company_jobs(name, jobs, stats, sink)
+
+    if retries_left < RETRY_BUDGET:
+        print(f"\nDeferred retries used: {RETRY_BUDGET - retries_left}/{RETRY_BUDGET}")
+
+    return results, run_stats
+
+
+def get_tiers() -> List[Tuple[str, List[Dict]]]:
+    """
+    Get the tiers to scrape, as (tier name, list of company dictionaries) tuples.
 
-    # Define tiers to scrape
-    tiers = [
-        ("Tier 1A", tier_1a),
-        ("Tier 1B", tier_1b),
-        ("Tier 2A", tier_2a),
-        ("Tier 2B", tier_2b),
-        ("Tier 2C", tier_2c),
+    Company lists are read from the companies module on each call, so they
+    pick up changes after the module is reloaded.
+    """
+    return [
+        ("Tier 1A", company_lists.tier_1a),
+        ("Tier 1B", company_lists.tier_1b),
+        ("Tier 2A", company_lists.tier_2a),
+        ("Tier 2B", company_lists.tier_2b),
+        ("Tier 2C", company_lists.tier_2c),
     ]
 
-    # Get all companies across all tiers to check for new ones
+
+def run_cycle(
+    tiers: List[Tuple[str, List[Dict]]],
+    found_jobs: Set[str],
+    history: Dict[str, Dict],
+    registry: Dict[str, Dict],
+    poll_schedule: Dict[str, Dict],
+    quarantine: Dict[str, Dict],
+    poll_all: bool = False,
+) -> int:
+    """
+    Scrape the given tiers once, then report and persist the results.
+
+    Companies that aren't due for a poll yet are skipped, unless poll_all is set.
+    Quarantined companies are skipped too, apart from occasional single-request probes.
+    Newly found job keys are added to found_jobs, and the history, registry, poll
+    schedule and quarantine are updated in place, so the next cycle can reuse them.
+
+    Args:
+        tiers: List of (tier name, list of company dictionaries) tuples to scrape
+        found_jobs: Set containing keys of previously found listings
+        history: History dictionary as returned by load_history
+        registry: Registry as returned by load_registry
+        poll_schedule: Polling history as returned by load_poll_schedule
+        quarantine: Failure history as returned by load_quarantine
+        poll_all: Whether to scrape every company, even those not due yet
+
+    Returns:
+        Number of new jobs discovered
+    """
+    start_time = datetime.now()
+    set_run_budget(RUN_TIME_BUDGET_SECONDS)
+    start_quota_run()
+
+    # Get all companies across the tiers to check for new ones
     all_companies = []
     for _, tier_companies in tiers:
         all_companies.extend(tier_companies)
 
     # Identify companies being scraped for the first time
-    new_companies = get_new_companies(all_companies)
+    new_companies = get_new_companies(all_companies, registry)
     if new_companies:
         print("New companies detected (first-time scrape):")
         for company in new_companies:
             print(f"  - {company}")
 
-    # Scrape each tier and extend list of newly discovered jobs
-    all_results = defaultdict(list)  # New listings stored by company
-    all_new_jobs = []  # URLs for all newly discoverd listings
-    for tier_name, tier_companies in tiers:
-        tier_results = scrape_tier(tier_name, tier_companies, found_jobs)
+    # Skip persistently failing companies, apart from occasional probes
+    scrapable_companies, probes, quarantined = split_quarantined(
+        get_scrapable_companies(tiers), quarantine
+    )
+    if quarantined:
+        print(f"Skipping {len(quarantined)} quarantined companies")
+    probe_names = {company_data["name"] for _, company_data in probes}
+
+    # Skip companies whose postings change too rarely to need a poll yet
+    if not poll_all:
+        scrapable_companies, not_due = split_due_companies(
+            scrapable_companies, poll_schedule
+        )
+        print_not_due(not_due, poll_schedule)
+
+    # Plan the run using durations observed in previous runs
+    schedule = plan_schedule(scrapable_companies + probes, history)
+    print()
+    print_plan(schedule, history, SCRAPER_WORKERS)
+
+    # Scrape all companies and collect newly discovered jobs
+    sink = JsonlSink(start_time, JSONL_GZIP) if OUTPUT_TO_JSONL else None
+    results, run_stats = scrape_companies(
+        schedule, found_jobs, SCRAPER_WORKERS, sink, probe_names, history
+    )
+    save_quota_usage()
+    update_history(history, run_stats)
+    keyword_filter.save_stats()
+    decision_cache.save()
+    update_registry(registry, run_stats, results)
+    update_poll_schedule(poll_schedule, run_stats, results)
+    quarantine_report = update_quarantine(quarantine, run_stats, probe_names)
+    quarantine_report["skipped"] = [
+        company_data["name"] for _, company_data in quarantined
+    ]
 
-        for company_name, jobs in tier_results.items():
-            for job in jobs:
-                all_new_jobs.append(job["url"])
-                all_results[company_name].append(job)
+    all_results = defaultdict(list)  # New listings stored by company
+    all_new_jobs = []  # Keys for all newly discoverd listings
+    for tier_name, company_data in schedule:
+        company_name = company_data["name"]
+        # Every scheduled company is listed, so the summary can report failures
+        all_results[company_name] = results.get(company_name, [])
+        for job in all_results[company_name]:
+            all_new_jobs.append(job["key"])
 
     # Summarize results and clean up
     print(f"\n{len(all_new_jobs)} new jobs discovered")
 
     if all_new_jobs:
-        print(f"\nSaving newly discovered job URLs to jobs_found.txt...")
+        print(f"\nSaving newly discovered job keys to jobs_found.txt...")
         save_new_jobs(all_new_jobs)
+        found_jobs.update(all_new_jobs)
+
+    if sink:
+        sink.close(new_companies)
+
+    truncated_companies = {stats["name"] for stats in run_stats if stats["truncated"]}
+    print_summary(
+        all_results,
+        new_companies,
+        truncated_companies,
+        decision_cache.stats(),
+        registry,
+        quarantine_report,
+        take_hedge_stats(),
+        quota_report(),
+    )
+
+    return len(all_new_jobs)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Scrape company job boards for new matching listings."
+    )
+    parser.add_argument(
+        "command",
+        nargs="?",
+        default="scrape",
+        choices=["scrape", "daemon", "filter-stats"],
+        help="scrape job boards once (default), keep scraping each tier on its own "
+        "interval, or report per-rule keyword filter statistics",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="scrape every company, including those not due for a poll yet",
+    )
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="estimate requests per host, download size and wall time for the "
+        "run, then exit without scraping",
+    )
+    return parser.parse_args()
+
+
+def print_keywords() -> None:
+    """Print the include and exclude keywords in use."""
+    print(f"INCLUDE_KEYWORDS:")
+    print(", ".join(keyword_filter.keywords("include")))
+    print()
+
+    print("EXCLUDE_KEYWORDS:")
+    print(", ".join(keyword_filter.keywords("exclude")))
+    print()
+
+
+def main():
+    """
+    Main function that orchestrates the entire scraping process.
+    """
+    args = parse_args()
+    if args.command == "filter-stats":
+        print_filter_stats()
+        return
+    if args.command == "daemon":
+        from daemon import run_daemon  # Import here to avoid circular imports
+
+        run_daemon(args.all)
+        return
+    if args.plan:
+        from planner import print_run_estimate  # Import here to avoid circular imports
+
+        tiers = get_tiers()
+        print_run_estimate(
+            tiers,
+            load_history(),
+            load_registry(
+                [company for _, tier_companies in tiers for company in tier_companies]
+            ),
+            load_poll_schedule(),
+            load_quarantine(),
+            args.all,
+        )
+        return
+
+    print(f"Job Scraper Starting - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
 
-    print_summary(all_results, new_companies)
+    start_time = datetime.now()
+    print_keywords()
+
+    # Load previously found jobs for duplicate prevention
+    print("Loading previously found jobs...")
+    found_jobs = load_found_jobs()
+    print(f"Loaded {len(found_jobs)} previously found jobs")
+
+    tiers = get_tiers()
+    all_companies = [
+        company for _, tier_companies in tiers for company in tier_companies
+    ]
+    run_cycle(
+        tiers,
+        found_jobs,
+        load_history(),
+        load_registry(all_companies),
+        load_poll_schedule(),
+        load_quarantine(),
+        args.all,
+    )
 
     process_time = (datetime.now() - start_time).total_seconds()
     print(f"\nJob Scraper Completed - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -2,18 +2,24 @@
 Output formatting and logging utilities for job scraper.
 """
 
+import gzip
+import json
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
+
+from tracking import record_error
+from cassette import RUN_DIR
 
 # Ensure search_results directories exist
-SEARCH_RESULTS_DIR = Path(__file__).parent / "search_results"
+SEARCH_RESULTS_DIR = RUN_DIR / "search_results"
 BY_COMPANY_DIR = SEARCH_RESULTS_DIR / "by_company"
 BY_SCRAPE_DIR = SEARCH_RESULTS_DIR / "by_scrape"
+JSONL_DIR = SEARCH_RESULTS_DIR / "jsonl"
 
-# Create both directories
+# Create all output directories
 BY_COMPANY_DIR.mkdir(parents=True, exist_ok=True)
 BY_SCRAPE_DIR.mkdir(parents=True, exist_ok=True)
+JSONL_DIR.mkdir(parents=True, exist_ok=True)
 
 
 def log_to_files(company: str, job_line: str, url: str) -> None:
@@ -32,12 +38,100 @@ def log_to_files(company: str, job_line: str, url: str) -> None:
         f.write("\n")
 
 
+class JsonlSink:
+    """
+    Machine-readable results for a single run.
+
+    Each posting is written as one JSON record as soon as its company finishes,
+    so a run that's interrupted still leaves every completed company readable.
+    A manifest describing the run is written next to the results when it ends.
+    """
+
+    def __init__(self, run_started: datetime, compress: bool = False):
+        """
+        Args:
+            run_started: Start time of the run, used to name its files
+            compress: Whether to gzip the results file
+        """
+        self.run_started = run_started
+        run_name = run_started.strftime("%Y-%m-%d_%H:%M:%S")
+        self.results_file = JSONL_DIR / f"{run_name}.jsonl{'.gz' if compress else ''}"
+        self.manifest_file = JSONL_DIR / f"{run_name}.manifest.json"
+        self.compress = compress
+        self.records = 0
+        self.companies: Dict[str, Dict] = {}
+
+        if compress:
+            self._file = gzip.open(self.results_file, "at", encoding="utf-8")
+        else:
+            self._file = open(self.results_file, "a", encoding="utf-8")
+
+    def write_company(self, jobs: List[Dict], stats: Dict) -> None:
+        """
+        Write a company's new postings.
+
+        Args:
+            jobs: New job listings found for the company
+            stats: The company's stats dictionary (name, scraper, tier, ...)
+        """
+        timestamp = datetime.now().isoformat(timespec="seconds")
+        for job in jobs:
+            record = {
+                "company": stats["name"],
+                "tier": stats["tier"],
+                "scraper": stats["scraper"],
+                "title": job["title"],
+                "location": job.get("location", ""),
+                "url": job["url"],
+                "key": job["key"],
+                "timestamp": timestamp,
+            }
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+        # Flush per company so consumers can tail the file during the run
+        self._file.flush()
+        self.records += len(jobs)
+        self.companies[stats["name"]] = {
+            "tier": stats["tier"],
+            "scraper": stats["scraper"],
+            "records": len(jobs),
+            "requests": stats["requests"],
+            "duration": round(stats["duration"], 2),
+            "truncated": stats["truncated"],
+        }
+
+    def close(self, new_companies: Optional[Set[str]] = None) -> None:
+        """Close the results file and write the run's manifest."""
+        self._file.close()
+
+        manifest = {
+            "run_started": self.run_started.isoformat(timespec="seconds"),
+            "run_finished": datetime.now().isoformat(timespec="seconds"),
+            "results_file": self.results_file.name,
+            "compressed": self.compress,
+            "records": self.records,
+            "companies": self.companies,
+            "new_companies": sorted(new_companies or []),
+        }
+        with open(self.manifest_file, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+
 def print_summary(
-    jobs_found: Dict[str, List[Dict]], new_companies: Set[str] = None
+    jobs_found: Dict[str, List[Dict]],
+    new_companies: Set[str] = None,
+    truncated_companies: Set[str] = None,
+    decision_cache_stats: Dict = None,
+    registry: Dict[str, Dict] = None,
+    quarantine_report: Dict[str, List[str]] = None,
+    hedge_stats: Dict = None,
+    quota_report: Dict = None,
 ) -> None:
     """Print a summary of jobs found across all companies."""
     if not new_companies:
         new_companies = set()
+    if not truncated_companies:
+        truncated_companies = set()
 
     print("\n" + "=" * 60)
     print("SCRAPING SUMMARY")
@@ -57,8 +151,75 @@ def print_summary(
     print(f"\nTotal jobs found: {total_jobs}")
     print(f"Companies with jobs: {companies_with_jobs}")
 
+    if truncated_companies:
+        print("\n⏱️  Truncated by time or request budget (results may be incomplete):")
+        for company in sorted(truncated_companies):
+            print(f"  - {company}")
+
+    # Companies whose scrape this run wasn't successful, according to the registry
+    if registry:
+        failed = {
+            company: registry[company]["last_success"] or "never"
+            for company in jobs_found
+            if company in registry
+            and company not in truncated_companies
+            and registry[company]["last_success"] != registry[company]["last_scraped"]
+        }
+        if failed:
+            print("\n⚠️  Failed this run:")
+            for company, last_success in sorted(failed.items()):
+                print(f"  - {company} (last successful scrape: {last_success})")
+
+    if quarantine_report:
+        sections = [
+            (
+                "quarantined",
+                "🚫 Quarantined after repeated failures (skipped until a probe succeeds):",
+            ),
+            ("restored", "✅ Restored from quarantine after a successful probe:"),
+            ("still_quarantined", "🚫 Still quarantined (probe failed):"),
+            ("skipped", "🚫 Quarantined and skipped this run:"),
+        ]
+        for key, heading in sections:
+            if quarantine_report.get(key):
+                print(f"\n{heading}")
+                for company in sorted(quarantine_report[key]):
+                    print(f"  - {company}")
+
+    if decision_cache_stats and decision_cache_stats["lookups"]:
+        print(
+            f"\nFilter decision cache: {decision_cache_stats['hit_rate']:.1%} hit rate "
+            f"({decision_cache_stats['hits']:,}/{decision_cache_stats['lookups']:,} lookups), "
+            f"~{decision_cache_stats['seconds_saved'] * 1000:.1f}ms saved"
+        )
+
+    if hedge_stats and hedge_stats["hedges"]:
+        print(
+            f"\nHedged requests: {hedge_stats['hedge_rate']:.1%} hedge rate "
+            f"({hedge_stats['hedges']:,}/{hedge_stats['requests']:,} requests), "
+            f"{hedge_stats['hedge_wins']:,} won, "
+            f"~{hedge_stats['seconds_saved']:.1f}s saved"
+        )
+
+    if quota_report:
+        if quota_report["run_quota"] is not None:
+            print(
+                f"\nRequest budget: {quota_report['run_requests']:,}/"
+                f"{quota_report['run_quota']:,} run requests used"
+            )
+        else:
+            print(f"\nRequests this run: {quota_report['run_requests']:,}")
+        for host, (used, quota) in sorted(quota_report["hosts"].items()):
+            print(f"  - {host}: {used:,}/{quota:,} requests today")
+
     # Create summary log file
-    create_summary_log(jobs_found, total_jobs, companies_with_jobs, new_companies)
+    create_summary_log(
+        jobs_found,
+        total_jobs,
+        companies_with_jobs,
+        new_companies,
+        truncated_companies,
+    )
 
 
 def create_summary_log(
@@ -66,10 +227,13 @@ def create_summary_log(
     total_jobs: int,
     companies_with_jobs: int,
     new_companies: Set[str] = None,
+    truncated_companies: Set[str] = None,
 ) -> None:
     """Create a summary log file with all jobs found in this run."""
     if not new_companies:
         new_companies = set()
+    if not truncated_companies:
+        truncated_companies = set()
 
     timestamp = datetime.now().strftime("%Y-%m-%d_%H:%M")
     summary_file = BY_SCRAPE_DIR / f"{timestamp}.txt"
@@ -83,6 +247,13 @@ def create_summary_log(
         f.write(f"Total jobs found: {total_jobs}\n")
         f.write(f"Companies with jobs: {companies_with_jobs}\n")
 
+        if truncated_companies:
+            f.write(
+                "\nTruncated by time or request budget (results may be incomplete):\n"
+            )
+            for company in sorted(truncated_companies):
+                f.write(f"  - {company}\n")
+
         for company, jobs in jobs_found.items():
             if jobs:
                 f.write(f"\n{company} ({len(jobs)} jobs):\n")
@@ -93,6 +264,12 @@ def create_summary_log(
                         f"!!! {company.upper()} JOBS BEING SCRAPED FOR THE FIRST TIME - MAY NOT BE MOST RECENT !!!\n"
                     )
 
+                # Add warning for companies cut short by their time budget
+                if company in truncated_companies:
+                    f.write(
+                        f"!!! {company.upper()} SCRAPE TRUNCATED BY TIME OR REQUEST BUDGET - RESULTS MAY BE INCOMPLETE !!!\n"
+                    )
+
                 f.write("-" * 40 + "\n")
 
                 for job in jobs:
@@ -109,6 +286,7 @@ def print_error(company: str, error_message: str) -> None:
     """
     error_msg = f"ERROR scraping {company}: {error_message}"
     print(error_msg)
+    record_error(error_message)
 
     # Log error to error log file in by_scrape directory
     error_log_file = BY_SCRAPE_DIR / "errors.txt"
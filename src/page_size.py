@@ -0,0 +1,83 @@
+"""
+Page-size negotiation for paginated job board APIs.
+Probes the largest page size each company's API accepts and caches it, so later
+runs can fetch the same postings in fewer, larger requests.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config import PAGE_SIZE_NEGOTIATION, PAGE_SIZE_CACHE_DAYS
+from output import print_debug
+from cassette import run_time
+from state import load_state, update_state
+
+PAGE_SIZES_STATE = "page_sizes"
+
+
+def negotiate_page_size(
+    company: str,
+    default_size: int,
+    candidate_sizes: List[int],
+    fetch_first_page: Callable[[int], Optional[Tuple[int, Optional[int]]]],
+) -> int:
+    """
+    Get the largest page size a company's API accepts, probing if necessary.
+
+    A candidate size is accepted if a first page requested at that size comes back
+    well formed and not truncated: either a full page, or every posting the API
+    reports. If the API returns fewer postings than requested but more than the
+    default size, it caps pages, and the observed cap is used as the page size.
+
+    Args:
+        company: Cache key for the company (e.g. "workday_nvidia")
+        default_size: Page size known to work, used if no candidate is accepted
+        candidate_sizes: Larger page sizes to try
+        fetch_first_page: Function that requests the first page at a given size and
+            returns (postings returned, total postings if reported). Rejected or
+            malformed responses count as (0, None); None means no response at all
+
+    Returns:
+        Page size to use for the company
+    """
+    if not PAGE_SIZE_NEGOTIATION:
+        return default_size
+
+    cached = load_state(PAGE_SIZES_STATE, {}).get(company)
+    if cached and run_time() - cached["probed"] < PAGE_SIZE_CACHE_DAYS * 86400:
+        return cached["page_size"]
+
+    page_size = default_size
+    probe_answered = False
+    for candidate_size in sorted(candidate_sizes, reverse=True):
+        if candidate_size <= default_size:
+            continue
+
+        print_debug(f"Probing page size {candidate_size} for {company}")
+        result = fetch_first_page(candidate_size)
+        if result is None:
+            continue
+
+        probe_answered = True
+
+        returned, total = result
+        if returned == candidate_size or (total is not None and returned == total):
+            page_size = candidate_size
+            break
+        if returned > default_size:
+            # The API caps pages below the candidate, so the cap is the page size;
+            # a larger size would make scrapers mistake full pages for the last one
+            page_size = returned
+            break
+
+    print_debug(f"Using page size {page_size} for {company}")
+
+    # Don't remember the default if the API couldn't be reached at all
+    if not probe_answered:
+        return page_size
+
+    def add_to_cache(page_sizes: Dict) -> Dict:
+        page_sizes[company] = {"page_size": page_size, "probed": run_time()}
+        return page_sizes
+
+    update_state(PAGE_SIZES_STATE, add_to_cache, {})
+    return page_size
@@ -0,0 +1,95 @@
+"""
+Pipelined pagination for paginated scrapers.
+Requests page N+1 in the background while page N is being parsed and filtered,
+so network waits and parsing overlap instead of running back to back.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+from typing import Any, Callable, Optional, Tuple
+
+from config import PAGE_PREFETCH
+from output import print_debug
+
+# Set inside prefetch threads, so a cancelled prefetch can skip its request
+_cancel_event: ContextVar[Optional[threading.Event]] = ContextVar(
+    "prefetch_cancel_event", default=None
+)
+
+
+def prefetch_cancelled() -> bool:
+    """Check whether the prefetch running in this thread has been cancelled."""
+    cancel_event = _cancel_event.get()
+    return cancel_event is not None and cancel_event.is_set()
+
+
+class PagePrefetcher:
+    """
+    Fetches pages of a paginated API, speculatively one page ahead.
+
+    A page is identified by its cursor (offset, page number, etc.). Call
+    prefetch() with the next cursor as soon as the current page is known to be
+    full, then get() it on the next iteration. Prefetched requests go through
+    the usual request path, so they respect per-host rate limits and time budgets.
+    """
+
+    def __init__(self, fetch_page: Callable[[Any], Any]):
+        """
+        Args:
+            fetch_page: Function that requests the page at a given cursor
+        """
+        self._fetch_page = fetch_page
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: Optional[Tuple[Any, Future, threading.Event]] = None
+
+    def _run_prefetch(self, cursor: Any, cancel_event: threading.Event) -> Any:
+        _cancel_event.set(cancel_event)
+        return self._fetch_page(cursor)
+
+    def prefetch(self, cursor: Any) -> None:
+        """Start fetching the page at a cursor in the background."""
+        if not PAGE_PREFETCH:
+            return
+
+        self.cancel()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="page-prefetch"
+            )
+
+        # Run in a copy of this context so the company's time budget and
+        # request counts apply to the prefetch thread too
+        cancel_event = threading.Event()
+        future = self._executor.submit(
+            copy_context().run, self._run_prefetch, cursor, cancel_event
+        )
+        self._pending = (cursor, future, cancel_event)
+
+    def get(self, cursor: Any) -> Any:
+        """Get the page at a cursor, using the prefetched response if there is one."""
+        if self._pending and self._pending[0] == cursor:
+            _, future, _ = self._pending
+            self._pending = None
+            return future.result()
+
+        self.cancel()
+        return self._fetch_page(cursor)
+
+    def cancel(self) -> None:
+        """Cancel any pending prefetch, e.g. once pagination has stopped."""
+        if not self._pending:
+            return
+
+        cursor, future, cancel_event = self._pending
+        self._pending = None
+        cancel_event.set()
+        if not future.cancel() and not future.done():
+            print_debug(f"Discarding prefetched page at {cursor}")
+
+    def close(self) -> None:
+        """Cancel any pending prefetch and release the background thread."""
+        self.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -0,0 +1,201 @@
+"""
+Dry-run planning.
+Estimates a run's requests per host, bytes downloaded and wall time from the
+company lists, scraper types, config delays and scrape history, without making
+any requests. Used to size cron windows and compare scheduling strategies.
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from config import (
+    REQUEST_DELAY_SECONDS,
+    RATE_LIMIT_BURST,
+    SCRAPER_WORKERS,
+    RUN_TIME_BUDGET_SECONDS,
+    RETRY_BUDGET,
+    LEVER_MODE,
+    ASHBY_MODE,
+    SMARTRECRUITERS_MODE,
+    MYWORKDAYJOBS_URL_DETAILS,
+)
+from main import get_scrapable_companies
+from polling import split_due_companies
+from quarantine import split_quarantined
+from scheduler import critical_path, plan_schedule
+
+# Requests assumed for companies without scrape history, by scraper
+DEFAULT_REQUESTS = {
+    "myworkdayjobs": 10,
+    "netflix": 5,
+    "uber": 5,
+    "smartrecruiters": 3,
+}
+DEFAULT_BYTES_PER_REQUEST = 50_000
+
+# Hosts requested by scrapers that don't depend on the company
+SCRAPER_HOSTS = {
+    "lever": "api.lever.co" if LEVER_MODE == "json" else "jobs.lever.co",
+    "greenhouse": "api.greenhouse.io",
+    "ashby": "jobs.ashbyhq.com" if ASHBY_MODE == "graphql" else "api.ashbyhq.com",
+    "netflix": "explore.jobs.netflix.net",
+    "spotify": "api-dot-new-spotifyjobs-com.nw.r.appspot.com",
+    "uber": "www.uber.com",
+    "jobvite": "jobs.jobvite.com",
+    "smartrecruiters": (
+        "api.smartrecruiters.com"
+        if SMARTRECRUITERS_MODE == "json"
+        else "careers.smartrecruiters.com"
+    ),
+}
+
+
+def request_host(company_data: Dict) -> str:
+    """Work out which host a company's scraper sends its requests to."""
+    scraper_name = company_data["scraper"].__name__
+    if scraper_name == "myworkdayjobs":
+        company = company_data.get("formatted_name", "")
+        details = MYWORKDAYJOBS_URL_DETAILS.get(company)
+        if details:
+            return f"{company}.wd{details['datacenter_id']}.myworkdayjobs.com"
+    return SCRAPER_HOSTS.get(scraper_name, f"{scraper_name} (unknown host)")
+
+
+def estimate_company(
+    company_data: Dict, history: Dict[str, Dict], probe: bool
+) -> Dict[str, float]:
+    """
+    Estimate one company's requests, bytes and duration.
+
+    Returns:
+        Dictionary with "requests", "bytes" and "duration" (seconds)
+    """
+    record = history.get(company_data["name"])
+    if probe:
+        requests = 1
+    elif record:
+        requests = max(1, record["pages"])
+    else:
+        requests = DEFAULT_REQUESTS.get(company_data["scraper"].__name__, 1)
+
+    if record and record.get("bytes") and record["pages"]:
+        bytes_per_request = record["bytes"] / record["pages"]
+    else:
+        bytes_per_request = DEFAULT_BYTES_PER_REQUEST
+
+    if record and not probe:
+        duration = record["duration"]
+    else:
+        # Without history, per-host pacing dominates a scrape's duration
+        duration = requests * REQUEST_DELAY_SECONDS
+
+    return {
+        "requests": requests,
+        "bytes": requests * bytes_per_request,
+        "duration": duration,
+    }
+
+
+def print_run_estimate(
+    tiers: List[Tuple[str, List[Dict]]],
+    history: Dict[str, Dict],
+    registry: Dict[str, Dict],
+    poll_schedule: Dict[str, Dict],
+    quarantine: Dict[str, Dict],
+    poll_all: bool = False,
+) -> None:
+    """
+    Print the estimated requests, bytes and wall time of the next run.
+
+    Companies are selected the same way as a real run, skipping quarantined
+    companies and those not due for a poll (unless poll_all is set). Companies
+    that failed their last scrape are assumed to need one deferred retry.
+
+    Args:
+        tiers: List of (tier name, list of company dictionaries) tuples to scrape
+        history: History dictionary as returned by load_history
+        registry: Registry as returned by load_registry
+        poll_schedule: Polling history as returned by load_poll_schedule
+        quarantine: Failure history as returned by load_quarantine
+        poll_all: Whether to include every company, even those not due yet
+    """
+    companies, probes, _ = split_quarantined(get_scrapable_companies(tiers), quarantine)
+    if not poll_all:
+        companies, _ = split_due_companies(companies, poll_schedule)
+    probe_names = {company_data["name"] for _, company_data in probes}
+
+    estimates = {
+        company_data["name"]: estimate_company(
+            company_data, history, company_data["name"] in probe_names
+        )
+        for _, company_data in companies + probes
+    }
+
+    # Companies whose last scrape failed are likely to need a retry
+    retries = [
+        company_data["name"]
+        for _, company_data in companies
+        if company_data["name"] in registry
+        and registry[company_data["name"]].get("last_scraped")
+        and registry[company_data["name"]]["last_success"]
+        != registry[company_data["name"]]["last_scraped"]
+    ][:RETRY_BUDGET]
+
+    host_requests: Dict[str, float] = defaultdict(float)
+    for _, company_data in companies + probes:
+        name = company_data["name"]
+        attempts = 2 if name in retries else 1
+        host_requests[request_host(company_data)] += (
+            attempts * estimates[name]["requests"]
+        )
+
+    total_requests = sum(host_requests.values())
+    total_bytes = sum(
+        estimate["bytes"] * (2 if name in retries else 1)
+        for name, estimate in estimates.items()
+    )
+
+    print(f"Run plan: {len(estimates)} companies ({len(probes)} quarantine probes)")
+    if retries:
+        print(f"Expecting retries for {len(retries)} companies that failed last run")
+    print(f"Estimated requests: {total_requests:,.0f}")
+    print(f"Estimated download: {total_bytes / 1_000_000:,.1f} MB")
+
+    print("\nRequests per host:")
+    for host, requests in sorted(host_requests.items(), key=lambda item: -item[1]):
+        print(f"  - {host}: {requests:,.0f}")
+
+    # Requests to one host can't go faster than its rate limit, whatever the worker count
+    busiest_host, busiest_requests = max(
+        host_requests.items(), key=lambda item: item[1], default=("", 0)
+    )
+    host_floor = max(0, busiest_requests - RATE_LIMIT_BURST) * REQUEST_DELAY_SECONDS
+
+    # Durations (including retries) in history form, so the scheduler can use them
+    planned_history = {
+        name: {
+            "duration": estimate["duration"] * (2 if name in retries else 1),
+            "pages": estimate["requests"],
+        }
+        for name, estimate in estimates.items()
+    }
+    strategies = {
+        "cost-aware": plan_schedule(companies + probes, planned_history),
+        "tier order": companies + probes,
+    }
+
+    print("\nEstimated wall time:")
+    for workers in sorted({1, SCRAPER_WORKERS, SCRAPER_WORKERS * 2}):
+        engine = "sequential" if workers == 1 else f"{workers} workers"
+        for strategy, schedule in strategies.items():
+            makespan, _ = critical_path(schedule, planned_history, workers)
+            wall_time = max(makespan, host_floor)
+            limit_note = (
+                f" (limited by {busiest_host})" if host_floor > makespan else ""
+            )
+            print(f"  - {engine}, {strategy}: {wall_time / 60:,.1f} min{limit_note}")
+            if workers == 1:
+                break  # Order doesn't change a sequential run's total time
+
+    if RUN_TIME_BUDGET_SECONDS:
+        print(f"\nRun time budget: {RUN_TIME_BUDGET_SECONDS / 60:,.1f} min")
@@ -0,0 +1,167 @@
+"""
+Adaptive per-company polling.
+Records when each company's new postings were found, estimates how quickly new
+postings arrive, and picks the company's next poll time from that rate: busy
+boards are polled often, boards that rarely change are polled less.
+"""
+
+import math
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+import config
+from config import (
+    ADAPTIVE_POLLING,
+    PRIORITY_TIERS,
+    POLL_DELAY_BUDGET_HOURS,
+    POLL_MIN_INTERVAL_HOURS,
+    POLL_MAX_INTERVAL_HOURS,
+    POLL_MIN_HISTORY,
+    POLL_HISTORY_DAYS,
+    POLL_GRACE_MINUTES,
+)
+from state import load_state, save_state
+from cassette import run_time
+
+POLL_STATE = "poll_schedule"
+
+# Prior belief about a company's posting rate (one new posting per day), which
+# keeps estimates sensible for companies with little history
+PRIOR_POSTINGS = 1.0
+PRIOR_HOURS = 24.0
+
+
+def load_poll_schedule() -> Dict[str, Dict]:
+    """
+    Load per-company polling history.
+
+    Returns:
+        Dictionary mapping company names to {"polls", "next_poll", "rate"}
+    """
+    return load_state(POLL_STATE, {})
+
+
+def estimate_rate(polls: List[List[float]], now: float) -> float:
+    """
+    Estimate a company's new-posting arrival rate, in postings per hour.
+
+    Args:
+        polls: [poll time, new postings found] pairs within the history window
+        now: Current time (seconds since the epoch)
+
+    Returns:
+        Posterior mean of the arrival rate, combining observations with the prior
+    """
+    if not polls:
+        return PRIOR_POSTINGS / PRIOR_HOURS
+
+    # Postings found by the first poll arrived before the window started
+    observed_postings = sum(new_postings for _, new_postings in polls[1:])
+    observed_hours = (now - polls[0][0]) / 3600
+    return (PRIOR_POSTINGS + observed_postings) / (PRIOR_HOURS + observed_hours)
+
+
+def poll_interval_hours(rate: float, tier_name: str) -> float:
+    """
+    Pick the time until the next poll for an arrival rate.
+
+    Postings arriving at rate r during an interval T wait T/2 on average, so
+    the expected delay accumulated before the next poll is r * T^2 / 2
+    posting-hours. Keeping that under POLL_DELAY_BUDGET_HOURS gives
+    T = sqrt(2 * budget / r), so polls are spent where postings actually appear.
+    The interval never exceeds the company's tier interval in DAEMON_TIER_INTERVALS.
+    """
+    interval = math.sqrt(2 * POLL_DELAY_BUDGET_HOURS / max(rate, 1e-6))
+    # Read through the module, so intervals reloaded by the daemon's SIGHUP apply
+    tier_interval = config.DAEMON_TIER_INTERVALS.get(
+        tier_name, config.DAEMON_DEFAULT_INTERVAL
+    )
+    tier_hours = tier_interval / 3600
+    max_interval = min(POLL_MAX_INTERVAL_HOURS, tier_hours)
+    return max(min(interval, max_interval), min(POLL_MIN_INTERVAL_HOURS, max_interval))
+
+
+def split_due_companies(
+    companies: List[Tuple[str, Dict]], poll_schedule: Dict[str, Dict]
+) -> Tuple[List[Tuple[str, Dict]], List[Tuple[str, Dict]]]:
+    """
+    Split companies into those due for a poll and those that can wait.
+
+    Companies in PRIORITY_TIERS, and companies with fewer than POLL_MIN_HISTORY
+    recorded polls, are always due.
+
+    Args:
+        companies: List of (tier name, company dictionary) tuples
+        poll_schedule: Polling history as returned by load_poll_schedule
+
+    Returns:
+        Tuple of (due companies, companies not due yet), in the original order
+    """
+    if not ADAPTIVE_POLLING:
+        return companies, []
+
+    due_before = run_time() + POLL_GRACE_MINUTES * 60
+    due, not_due = [], []
+    for item in companies:
+        record = poll_schedule.get(item[1]["name"])
+        if (
+            item[0] not in PRIORITY_TIERS
+            and record
+            and len(record["polls"]) >= POLL_MIN_HISTORY
+            and record["next_poll"] > due_before
+        ):
+            not_due.append(item)
+        else:
+            due.append(item)
+    return due, not_due
+
+
+def print_not_due(
+    not_due: List[Tuple[str, Dict]], poll_schedule: Dict[str, Dict]
+) -> None:
+    """Print the companies skipped this run because they aren't due yet."""
+    if not not_due:
+        return
+
+    print(f"Skipping {len(not_due)} companies not due for a poll yet:")
+    for _, company_data in not_due:
+        record = poll_schedule[company_data["name"]]
+        next_poll = datetime.fromtimestamp(record["next_poll"])
+        print(
+            f"  - {company_data['name']} (next poll {next_poll.strftime('%Y-%m-%d %H:%M')}, "
+            f"~{record['rate'] * 24:.2f} new postings/day)"
+        )
+
+
+def update_poll_schedule(
+    poll_schedule: Dict[str, Dict],
+    run_stats: List[Dict],
+    results: Dict[str, List[Dict]],
+) -> None:
+    """
+    Record this run's new postings and schedule each company's next poll.
+
+    Failed or truncated scrapes aren't recorded, so those companies stay due.
+
+    Args:
+        poll_schedule: Polling history as returned by load_poll_schedule
+        run_stats: Stats dictionaries collected while scraping each company
+        results: Dictionary mapping company names to lists of new jobs found
+    """
+    now = run_time()
+    window_start = now - POLL_HISTORY_DAYS * 86400
+
+    for stats in run_stats:
+        if stats["truncated"] or stats["errors"] or not stats["requests"]:
+            continue
+
+        record = poll_schedule.setdefault(stats["name"], {"polls": []})
+        polls = [poll for poll in record["polls"] if poll[0] >= window_start]
+        polls.append([now, len(results.get(stats["name"], []))])
+
+        rate = estimate_rate(polls, now)
+        record["polls"] = polls
+        record["rate"] = round(rate, 6)
+        record["next_poll"] = now + poll_interval_hours(rate, stats["tier"]) * 3600
+
+    save_state(POLL_STATE, poll_schedule)
@@ -0,0 +1,113 @@
+"""
+Quarantine of persistently failing companies.
+Companies that fail several runs in a row (e.g. a wrong formatted_name or a moved
+Workday tenant) are skipped instead of costing retries every run. A quarantined
+company is probed occasionally with a single request, and restored as soon as
+a probe succeeds.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Set, Tuple
+
+from config import QUARANTINE_AFTER_FAILURES, QUARANTINE_PROBE_HOURS
+from state import load_state, save_state
+from cassette import run_time
+
+QUARANTINE_STATE = "quarantine"
+
+
+def load_quarantine() -> Dict[str, Dict]:
+    """
+    Load per-company failure history.
+
+    Returns:
+        Dictionary mapping company names to
+        {"consecutive_failures", "last_error", "quarantined_since", "last_probe"}
+    """
+    return load_state(QUARANTINE_STATE, {})
+
+
+def split_quarantined(
+    companies: List[Tuple[str, Dict]], quarantine: Dict[str, Dict]
+) -> Tuple[List[Tuple[str, Dict]], List[Tuple[str, Dict]], List[Tuple[str, Dict]]]:
+    """
+    Separate quarantined companies from the rest.
+
+    Args:
+        companies: List of (tier name, company dictionary) tuples
+        quarantine: Failure history as returned by load_quarantine
+
+    Returns:
+        Tuple of (active companies, quarantined companies due for a probe,
+        quarantined companies skipped this run)
+    """
+    probe_before = run_time() - QUARANTINE_PROBE_HOURS * 3600
+    active, probes, skipped = [], [], []
+    for item in companies:
+        record = quarantine.get(item[1]["name"])
+        if not record or not record.get("quarantined_since"):
+            active.append(item)
+        elif record.get("last_probe", 0) <= probe_before:
+            probes.append(item)
+        else:
+            skipped.append(item)
+    return active, probes, skipped
+
+
+def scrape_failed(stats: Dict) -> bool:
+    """Check whether a company's scrape failed, from its stats dictionary."""
+    return bool(stats["errors"] or not stats["requests"])
+
+
+def update_quarantine(
+    quarantine: Dict[str, Dict], run_stats: List[Dict], probe_names: Set[str]
+) -> Dict[str, List[str]]:
+    """
+    Record this run's successes and failures and persist the failure history.
+
+    Args:
+        quarantine: Failure history as returned by load_quarantine
+        run_stats: Stats dictionaries collected while scraping each company
+        probe_names: Names of quarantined companies that were probed this run
+
+    Returns:
+        Report dictionary with the names of companies "quarantined" this run,
+        "restored" this run and "still_quarantined" after a failed probe
+    """
+    now = run_time()
+    report = {"quarantined": [], "restored": [], "still_quarantined": []}
+
+    for stats in run_stats:
+        name = stats["name"]
+
+        # Companies skipped because the run ran out of time tell us nothing
+        if stats["truncated"] and not stats["requests"]:
+            continue
+
+        if name in probe_names:
+            # A probe is a single request, which must get a successful response
+            if scrape_failed(stats) or stats["failed_requests"]:
+                quarantine[name]["last_probe"] = now
+                report["still_quarantined"].append(name)
+            else:
+                del quarantine[name]
+                report["restored"].append(name)
+            continue
+
+        # Any success resets the failure count
+        if not scrape_failed(stats):
+            quarantine.pop(name, None)
+            continue
+
+        record = quarantine.setdefault(name, {"consecutive_failures": 0})
+        record["consecutive_failures"] += 1
+        record["last_error"] = stats["last_error"]
+        if record[
+            "consecutive_failures"
+        ] >= QUARANTINE_AFTER_FAILURES and not record.get("quarantined_since"):
+            record["quarantined_since"] = datetime.now().isoformat(timespec="seconds")
+            record["last_probe"] = now
+            report["quarantined"].append(name)
+
+    save_state(QUARANTINE_STATE, quarantine)
+    return report
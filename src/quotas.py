@@ -0,0 +1,151 @@
+"""
+Request quotas.
+Counts requests per host per day and per run, and enforces the quotas set in
+config.py. Top tiers may use the whole of a quota, while lower tiers stop short
+of a reserve kept for them and paginate less deeply as the run quota runs low,
+so a shortage costs lower-tier coverage instead of failing companies outright.
+"""
+
+import math
+import threading
+from typing import Dict, Optional
+
+from config import (
+    PRIORITY_TIERS,
+    RUN_REQUEST_QUOTA,
+    HOST_DAILY_REQUEST_QUOTAS,
+    QUOTA_PRIORITY_RESERVE,
+    QUOTA_SHRINK_BELOW,
+)
+from state import load_state, update_state
+from cassette import run_date
+
+QUOTA_STATE = "request_quotas"
+
+_lock = threading.Lock()
+_day = run_date().isoformat()
+_earlier_today: Dict[str, int] = {}  # Requests per host by earlier runs today
+_run_hosts: Dict[str, int] = {}  # Requests per host this run
+_run_total = 0
+
+
+def start_quota_run() -> None:
+    """Reset this run's request counts and load today's counts from earlier runs."""
+    global _day, _earlier_today, _run_total
+    stored = load_state(QUOTA_STATE, {})
+    with _lock:
+        _day = run_date().isoformat()
+        _earlier_today = stored.get("hosts", {}) if stored.get("date") == _day else {}
+        _run_hosts.clear()
+        _run_total = 0
+
+
+def count_request(host: str) -> None:
+    """Count a request sent to a host against the quotas."""
+    global _run_total
+    with _lock:
+        _run_hosts[host] = _run_hosts.get(host, 0) + 1
+        _run_total += 1
+
+
+def _available(used: int, quota: int, tier_name: Optional[str]) -> int:
+    # Lower tiers can't dip into the share of the quota reserved for top tiers
+    reserve = 0 if tier_name in PRIORITY_TIERS else QUOTA_PRIORITY_RESERVE * quota
+    return math.floor(quota - reserve - used)
+
+
+def requests_available(
+    tier_name: Optional[str], host: Optional[str] = None
+) -> Optional[int]:
+    """
+    Number of requests a company in the tier may still send.
+
+    Args:
+        tier_name: Tier of the company sending the requests
+        host: Host the requests go to, if known
+
+    Returns:
+        Requests left under the tightest applicable quota, or None if no quota applies
+    """
+    limits = []
+    with _lock:
+        if RUN_REQUEST_QUOTA is not None:
+            limits.append(_available(_run_total, RUN_REQUEST_QUOTA, tier_name))
+        if host is not None and host in HOST_DAILY_REQUEST_QUOTAS:
+            used = _earlier_today.get(host, 0) + _run_hosts.get(host, 0)
+            limits.append(_available(used, HOST_DAILY_REQUEST_QUOTAS[host], tier_name))
+    return min(limits) if limits else None
+
+
+def quota_exhausted(tier_name: Optional[str], host: Optional[str] = None) -> bool:
+    """Check whether a company in the tier has used up its share of the quotas."""
+    available = requests_available(tier_name, host)
+    return available is not None and available <= 0
+
+
+def company_request_limit(
+    tier_name: str, expected_requests: Optional[float]
+) -> Optional[int]:
+    """
+    Pick the most requests a lower-tier company may send, based on the run quota left.
+
+    Once less than QUOTA_SHRINK_BELOW of the run quota is left, lower-tier
+    companies get a proportionally shallower scrape than they usually need.
+
+    Args:
+        tier_name: Tier of the company
+        expected_requests: Requests the company usually needs, from scrape history
+
+    Returns:
+        Request limit for the company, or None for no limit
+    """
+    if (
+        RUN_REQUEST_QUOTA is None
+        or tier_name in PRIORITY_TIERS
+        or not expected_requests
+    ):
+        return None
+
+    share_left = requests_available(tier_name) / (
+        RUN_REQUEST_QUOTA * (1 - QUOTA_PRIORITY_RESERVE)
+    )
+    if share_left >= QUOTA_SHRINK_BELOW:
+        return None
+    return max(1, math.ceil(expected_requests * share_left / QUOTA_SHRINK_BELOW))
+
+
+def save_quota_usage() -> None:
+    """Add this run's requests to today's persisted per-host counts."""
+    with _lock:
+        day, run_hosts = _day, dict(_run_hosts)
+
+    def add_run(stored: Dict) -> Dict:
+        hosts = stored.get("hosts", {}) if stored.get("date") == day else {}
+        for host, requests in run_hosts.items():
+            hosts[host] = hosts.get(host, 0) + requests
+        return {"date": day, "hosts": hosts}
+
+    update_state(QUOTA_STATE, add_run, {})
+
+
+def quota_report() -> Dict:
+    """
+    Summarize request budget consumption for the run summary.
+
+    Returns:
+        Dictionary with "run_requests", "run_quota" and "hosts", which maps each
+        host with a daily quota that was used this run to (requests today, quota)
+    """
+    with _lock:
+        return {
+            "run_requests": _run_total,
+            "run_quota": RUN_REQUEST_QUOTA,
+            "hosts": {
+                host: (
+                    _earlier_today.get(host, 0) + requests,
+                    HOST_DAILY_REQUEST_QUOTAS[host],
+                )
+                for host, requests in _run_hosts.items()
+                if host in HOST_DAILY_REQUEST_QUOTAS
+            },
+        }
@@ -0,0 +1,91 @@
+"""
+Cross-process rate limiting.
+Keeps a per-host token bucket in a SQLite ledger in src/state/, so that every
+scraper process on the machine (shards, overlapping cron runs, the daemon)
+shares the same REQUEST_DELAY_SECONDS pacing instead of each pacing itself.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from config import REQUEST_DELAY_SECONDS, RATE_LIMIT_BURST
+from state import SHARED_STATE_DIR
+
+LEDGER_FILE = SHARED_STATE_DIR / "rate_limits.sqlite"
+
+# SQLite connections can't be shared between threads
+_local = threading.local()
+
+
+def _connection() -> sqlite3.Connection:
+    connection = getattr(_local, "connection", None)
+    if connection is None:
+        SHARED_STATE_DIR.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode, so transactions are controlled explicitly below
+        connection = sqlite3.connect(LEDGER_FILE, timeout=30, isolation_level=None)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS host_buckets "
+            "(host TEXT PRIMARY KEY, next_free REAL NOT NULL)"
+        )
+        _local.connection = connection
+    return connection
+
+
+def _reserve(host: str, only_if_free: bool) -> Optional[float]:
+    connection = _connection()
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        now = time.time()
+        row = connection.execute(
+            "SELECT next_free FROM host_buckets WHERE host = ?", (host,)
+        ).fetchone()
+        next_free = max(row[0] if row else now, now)
+
+        # The request may go ahead once the bucket has at least one token
+        send_at = max(now, next_free - (RATE_LIMIT_BURST - 1) * REQUEST_DELAY_SECONDS)
+        if only_if_free and send_at > now:
+            connection.execute("COMMIT")
+            return None
+        connection.execute(
+            "INSERT OR REPLACE INTO host_buckets (host, next_free) VALUES (?, ?)",
+            (host, next_free + REQUEST_DELAY_SECONDS),
+        )
+        connection.execute("COMMIT")
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+
+    return send_at - now
+
+
+def reserve_request(host: str) -> float:
+    """
+    Reserve the next request slot for a host in the shared ledger.
+
+    The bucket refills one token every REQUEST_DELAY_SECONDS and holds up to
+    RATE_LIMIT_BURST tokens. It's stored as the time at which the bucket will
+    next be full, so a reservation is a single read and write in one
+    transaction, which SQLite's lock serializes between processes.
+
+    Args:
+        host: Host the request will be sent to
+
+    Returns:
+        Seconds to wait before sending the request (0 if it can be sent now)
+    """
+    return _reserve(host, only_if_free=False)
+
+
+def try_reserve_request(host: str) -> bool:
+    """
+    Reserve a request slot for a host only if one is free right now.
+
+    Args:
+        host: Host the request will be sent to
+
+    Returns:
+        Whether a slot was reserved
+    """
+    return _reserve(host, only_if_free=True) is not None
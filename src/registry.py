@@ -0,0 +1,125 @@
+"""
+Company registry.
+Keeps one record per company with when it was first and last scraped, when it
+last scraped successfully, and how many postings it has produced. The whole
+registry is read once at startup and written once at the end of a run.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Set
+
+from output import BY_COMPANY_DIR
+from state import load_state, save_state
+
+REGISTRY_STATE = "company_registry"
+
+# last_success of companies that were scraped successfully before the registry existed
+PRE_REGISTRY_SUCCESS = "before registry"
+
+
+def _safe_company_name(company_name: str) -> str:
+    # Same logic as in log_to_files
+    return company_name.lower().replace(" ", "_").replace("-", "_")
+
+
+def load_registry(all_companies: List[Dict]) -> Dict[str, Dict]:
+    """
+    Load the company registry.
+
+    The first time the registry is created, companies that already have a
+    by_company log file are registered as previously scraped successfully,
+    using a single directory listing rather than a check per company.
+
+    Args:
+        all_companies: List of all company dictionaries from all tiers
+
+    Returns:
+        Dictionary mapping company names to their registry records
+    """
+    registry = load_state(REGISTRY_STATE, None)
+    if registry is not None:
+        # Registries created before the marker existed left these companies unset
+        for record in registry.values():
+            if record["first_scraped"] is None and record["last_success"] is None:
+                record["last_success"] = PRE_REGISTRY_SUCCESS
+        return registry
+
+    logged_companies = {log_file.stem for log_file in BY_COMPANY_DIR.glob("*.txt")}
+    registry = {}
+    for company_data in all_companies:
+        company_name = company_data.get("name", "")
+        if company_name and _safe_company_name(company_name) in logged_companies:
+            # First scrape date is unknown for companies predating the registry
+            registry[company_name] = {
+                "first_scraped": None,
+                "last_scraped": None,
+                "last_success": PRE_REGISTRY_SUCCESS,
+                "postings_found": 0,
+                "last_postings": 0,
+                "runs": 0,
+            }
+    return registry
+
+
+def get_new_companies(all_companies: List[Dict], registry: Dict[str, Dict]) -> Set[str]:
+    """
+    Determine which companies are being scraped for the first time.
+
+    A company stays new until it has been scraped successfully, so postings
+    from a first scrape that failed or was cut short are still flagged later.
+
+    Args:
+        all_companies: List of all company dictionaries from all tiers
+        registry: Registry as returned by load_registry
+
+    Returns:
+        Set of company names that have never been scraped successfully
+    """
+    return {
+        company_data["name"]
+        for company_data in all_companies
+        if company_data.get("name")
+        and not registry.get(company_data["name"], {}).get("last_success")
+    }
+
+
+def update_registry(
+    registry: Dict[str, Dict],
+    run_stats: List[Dict],
+    results: Dict[str, List[Dict]],
+) -> None:
+    """
+    Record this run's scrapes in the registry and persist it.
+
+    A scrape counts as successful if it made requests without any errors.
+    Companies skipped because the run ran out of time aren't recorded.
+
+    Args:
+        registry: Registry as returned by load_registry
+        run_stats: Stats dictionaries collected while scraping each company
+        results: Dictionary mapping company names to lists of new jobs found
+    """
+    now = datetime.now().isoformat(timespec="seconds")
+
+    for stats in run_stats:
+        if stats["truncated"] and not stats["requests"]:
+            continue
+
+        postings = len(results.get(stats["name"], []))
+        record = registry.setdefault(
+            stats["name"],
+            {
+                "first_scraped": now,
+                "last_success": None,
+                "postings_found": 0,
+                "runs": 0,
+            },
+        )
+        record["last_scraped"] = now
+        if stats["requests"] and not stats["errors"]:
+            record["last_success"] = now
+        record["postings_found"] += postings
+        record["last_postings"] = postings
+        record["runs"] += 1
+
+    save_state(REGISTRY_STATE, registry)
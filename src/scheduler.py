@@ -0,0 +1,154 @@
+"""
+Cost-aware scheduling of company scrapes.
+Uses each company's observed duration and page count from previous runs to order
+the work so that long scrapes start early, while top-tier companies stay first.
+"""
+
+import heapq
+from typing import Dict, List, Tuple
+
+from config import PRIORITY_TIERS, REQUEST_DELAY_SECONDS
+from state import load_state, save_state
+
+HISTORY_STATE = "company_history"
+
+# Weight given to the latest observation when updating historic averages
+HISTORY_SMOOTHING = 0.5
+
+
+def load_history() -> Dict[str, Dict]:
+    """
+    Load per-company scrape history from previous runs.
+
+    Returns:
+        Dictionary mapping company names to {"duration", "pages", "bytes", "runs"}
+    """
+    return load_state(HISTORY_STATE, {})
+
+
+def update_history(history: Dict[str, Dict], run_stats: List[Dict]) -> None:
+    """
+    Fold this run's per-company stats into the history and persist it.
+
+    Args:
+        history: History dictionary as returned by load_history
+        run_stats: Stats dictionaries collected while scraping each company
+    """
+    for stats in run_stats:
+        # Companies skipped because the run ran out of time tell us nothing
+        if stats.get("truncated") and not stats["requests"]:
+            continue
+
+        previous = history.get(stats["name"])
+        if previous:
+            duration = (
+                HISTORY_SMOOTHING * stats["duration"]
+                + (1 - HISTORY_SMOOTHING) * previous["duration"]
+            )
+            pages = (
+                HISTORY_SMOOTHING * stats["requests"]
+                + (1 - HISTORY_SMOOTHING) * previous["pages"]
+            )
+            # A truncated scrape shows a lower bound on the pages a company needs
+            if stats.get("truncated"):
+                pages = max(pages, previous["pages"])
+            response_bytes = HISTORY_SMOOTHING * stats["bytes"] + (
+                1 - HISTORY_SMOOTHING
+            ) * previous.get("bytes", stats["bytes"])
+            runs = previous.get("runs", 0) + 1
+        else:
+            duration, pages, runs = stats["duration"], stats["requests"], 1
+            response_bytes = stats["bytes"]
+
+        history[stats["name"]] = {
+            "duration": round(duration, 2),
+            "pages": round(pages, 1),
+            "bytes": round(response_bytes),
+            "runs": runs,
+        }
+
+    save_state(HISTORY_STATE, history)
+
+
+def estimate_duration(company_name: str, history: Dict[str, Dict]) -> float:
+    """
+    Estimate how long a company will take to scrape, in seconds.
+
+    Companies without history are assumed to need a single request.
+    """
+    if company_name in history:
+        return history[company_name]["duration"]
+    return float(REQUEST_DELAY_SECONDS)
+
+
+def plan_schedule(
+    companies: List[Tuple[str, Dict]], history: Dict[str, Dict]
+) -> List[Tuple[str, Dict]]:
+    """
+    Order companies for scraping.
+
+    Companies in PRIORITY_TIERS come first for a fast time-to-first-result.
+    Within each group, the longest expected scrapes start first (LPT ordering),
+    which minimizes total run time when scraping with several workers.
+
+    Args:
+        companies: List of (tier name, company dictionary) tuples
+        history: History dictionary as returned by load_history
+
+    Returns:
+        The same (tier name, company dictionary) tuples, in scraping order
+    """
+    return sorted(
+        companies,
+        key=lambda item: (
+            item[0] not in PRIORITY_TIERS,
+            -estimate_duration(item[1]["name"], history),
+        ),
+    )
+
+
+def critical_path(
+    schedule: List[Tuple[str, Dict]], history: Dict[str, Dict], workers: int
+) -> Tuple[float, List[Tuple[str, float]]]:
+    """
+    Simulate the schedule on a pool of workers and find its critical path.
+
+    Args:
+        schedule: Ordered (tier name, company dictionary) tuples from plan_schedule
+        history: History dictionary as returned by load_history
+        workers: Number of concurrent workers
+
+    Returns:
+        Tuple of (estimated total run time, [(company name, estimated duration)])
+        where the list is the chain of companies on the worker that finishes last
+    """
+    worker_heap = [(0.0, worker_id) for worker_id in range(max(1, workers))]
+    assignments: Dict[int, List[Tuple[str, float]]] = {}
+
+    for _, company_data in schedule:
+        free_at, worker_id = heapq.heappop(worker_heap)
+        duration = estimate_duration(company_data["name"], history)
+        assignments.setdefault(worker_id, []).append((company_data["name"], duration))
+        heapq.heappush(worker_heap, (free_at + duration, worker_id))
+
+    finish_time, last_worker = max(worker_heap)
+    return finish_time, assignments.get(last_worker, [])
+
+
+def print_plan(
+    schedule: List[Tuple[str, Dict]], history: Dict[str, Dict], workers: int
+) -> None:
+    """Print the planned critical path before the run starts."""
+    total_time, path = critical_path(schedule, history, workers)
+
+    print(
+        f"Planned run: {len(schedule)} companies on {workers} worker(s), "
+        f"estimated {total_time:.0f}s"
+    )
+    if path:
+        print("Critical path:")
+        for company_name, duration in path:
+            pages = history.get(company_name, {}).get("pages")
+            pages_text = f", ~{pages:g} pages" if pages else ""
+            print(f"  - {company_name} ({duration:.0f}s{pages_text})")
+    print()
@@ -1,64 +1,223 @@
 """
 Scraper functions for different job platforms (Lever, Greenhouse, Ashby, etc.)
-Each function returns a list of job dictionaries: {title, url}
+Each function returns a list of job dictionaries: {title, url, key}
 """
 
 import requests
 from bs4 import BeautifulSoup
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
+from urllib.parse import urlparse
+import sqlite3
+import threading
 import time
 
-from config import REQUEST_DELAY_SECONDS, TIMEOUT_SECONDS, MYWORKDAYJOBS_URL_DETAILS
-from utils import should_include_job
+from config import (
+    APPLY_FILTERING,
+    REQUEST_DELAY_SECONDS,
+    SHARED_RATE_LIMITS,
+    SCRAPER_WORKERS,
+    CONNECT_TIMEOUT_SECONDS,
+    READ_TIMEOUT_SECONDS,
+    HEDGE_POST_REQUESTS,
+    CASSETTE_MODE,
+    MYWORKDAYJOBS_URL_DETAILS,
+    LEVER_MODE,
+    ASHBY_MODE,
+    SMARTRECRUITERS_MODE,
+    WORKDAY_PUSHDOWN,
+    NETFLIX_PUSHDOWN,
+    NETFLIX_DEPARTMENTS,
+    UBER_PUSHDOWN,
+    UBER_DEPARTMENTS,
+    UBER_LOCATIONS,
+    PUSHDOWN_SEARCH_QUERIES,
+    WORKDAY_FACET_CACHE_DAYS,
+)
+from utils import (
+    should_include_job,
+    is_us_or_eu_location,
+    make_job_key,
+    workday_job_key,
+    is_new_job,
+)
 from output import print_debug, print_error
+from state import load_state, update_state
+from page_size import negotiate_page_size
+from paginator import PagePrefetcher, prefetch_cancelled
+from hedging import send_hedged
+from ratelimit import reserve_request, try_reserve_request
+from cassette import record_response as record_cassette, replay_response, run_time
+from incremental import (
+    start_incremental,
+    reset_known_streak,
+    page_is_known,
+    finish_incremental,
+)
+from tracking import (
+    record_request,
+    record_request_failure,
+    record_response,
+    time_remaining,
+    budget_exhausted,
+)
+
+WORKDAY_FACETS_STATE = "workday_facets"
+
+# Shared session, so connections are reused across requests, companies and daemon cycles
+_session = requests.Session()
+_session.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(pool_maxsize=max(10, SCRAPER_WORKERS * 2)),
+)
+
+# Per-host pacing so that concurrent workers stay as polite as a sequential run
+_host_locks: Dict[str, threading.Lock] = {}
+_host_next_request: Dict[str, float] = {}
+_host_locks_guard = threading.Lock()
+
+
+def wait_for_host(url: str) -> None:
+    """
+    Block until a request to the URL's host is allowed by the rate limit.
 
-
-def make_request(
-    url: str, max_retries: int = 3, **kwargs
-) -> Optional[requests.Response]:
-    """Make a request with timeout, error handling, and retries."""
-    for attempt in range(max_retries):
+    Requests to the same host are spaced at least REQUEST_DELAY_SECONDS apart,
+    regardless of how many workers are scraping at once. With SHARED_RATE_LIMITS,
+    the pacing is shared with every other scraper process on the machine.
+    """
+    host = urlparse(url).netloc
+    if SHARED_RATE_LIMITS:
         try:
-            response = requests.get(url, timeout=TIMEOUT_SECONDS, **kwargs)
-            time.sleep(REQUEST_DELAY_SECONDS)  # Rate limiting
-            return response
-        except requests.exceptions.RequestException as e:
-            if attempt == max_retries - 1:  # Last attempt
-                print_debug(
-                    f"Request failed for {url} after {max_retries} attempts: {e}"
-                )
-                return None
-            else:
-                print_debug(
-                    f"Request attempt {attempt + 1} failed for {url}: {e}, retrying..."
-                )
-                # Brief exponential backoff before retry
-                time.sleep(REQUEST_DELAY_SECONDS * (2**attempt))
-    return None
+            wait_time = reserve_request(host)
+            if wait_time > 0:
+                time.sleep(wait_time)
+            return
+        except sqlite3.Error as e:
+            print_debug(f"Shared rate limit ledger unavailable, pacing locally: {e}")
+
+    with _host_locks_guard:
+        host_lock = _host_locks.setdefault(host, threading.Lock())
 
+    with host_lock:
+        wait_time = _host_next_request.get(host, 0) - time.monotonic()
+        if wait_time > 0:
+            time.sleep(wait_time)
+        _host_next_request[host] = time.monotonic() + REQUEST_DELAY_SECONDS
+
+
+def try_host_slot(url: str) -> bool:
+    """
+    Take a request slot for the URL's host only if the rate limit allows one now.
 
-def make_post_request(
-    url: str, max_retries: int = 3, **kwargs
-) -> Optional[requests.Response]:
-    """Make a POST request with timeout, error handling, and retries."""
-    for attempt in range(max_retries):
+    Used for optional requests such as hedges, which are skipped rather than
+    delayed when the host has no free slot.
+    """
+    host = urlparse(url).netloc
+    if SHARED_RATE_LIMITS:
         try:
-            response = requests.post(url, timeout=TIMEOUT_SECONDS, **kwargs)
-            time.sleep(REQUEST_DELAY_SECONDS)  # Rate limiting
-            return response
-        except requests.exceptions.RequestException as e:
-            if attempt == max_retries - 1:  # Last attempt
-                print_debug(
-                    f"POST request failed for {url} after {max_retries} attempts: {e}"
-                )
+            return try_reserve_request(host)
+        except sqlite3.Error as e:
+            print_debug(f"Shared rate limit ledger unavailable, pacing locally: {e}")
+
+    with _host_locks_guard:
+        host_lock = _host_locks.setdefault(host, threading.Lock())
+
+    # A locked host has a request waiting for its slot already
+    if not host_lock.acquire(blocking=False):
+        return False
+    try:
+        if _host_next_request.get(host, 0) > time.monotonic():
+            return False
+        _host_next_request[host] = time.monotonic() + REQUEST_DELAY_SECONDS
+        return True
+    finally:
+        host_lock.release()
+
+
+def get_timeouts() -> Tuple[float, float]:
+    """Return (connect, read) timeouts, clamped to the remaining time budget."""
+    connect_timeout, read_timeout = CONNECT_TIMEOUT_SECONDS, READ_TIMEOUT_SECONDS
+
+    # Requests aren't sent with less than MIN_REQUEST_SECONDS left (see budget_exhausted)
+    remaining = time_remaining()
+    if remaining is not None:
+        connect_timeout = min(connect_timeout, remaining)
+        read_timeout = min(read_timeout, remaining)
+
+    return connect_timeout, read_timeout
+
+
+def _send_request(method: str, url: str, **kwargs) -> Optional[requests.Response]:
+    """
+    Send a request with timeouts, per-host rate limiting, and optional hedging.
+
+    Requests are never retried or backed off inline. A transient failure
+    (timeout, connection error, HTTP 429 or 5xx) flags the current company as
+    retryable, and the orchestrator re-queues the whole company after a backoff
+    while other companies keep scraping. Timeouts are cut short by the current
+    company's (or the run's) time budget, so a request never outlives its deadline.
+    Requests beyond the company's share of the request quotas aren't sent.
+    Requests that get no successful response are recorded against the company.
+    With CASSETTE_MODE set, responses are recorded to or replayed from a cassette.
+    """
+    label = "POST request" if method == "POST" else "Request"
+    host = urlparse(url).netloc
+    if budget_exhausted(host):
+        print_debug(f"Time or request budget exhausted, not requesting {url}")
+        return None
+
+    try:
+        sent = time.monotonic()
+        if CASSETTE_MODE == "replay":
+            # Recorded responses are served without the network or rate limiting
+            record_request(host)
+            response = replay_response(method, url, kwargs)
+            if response is None:
+                print_debug(f"No recorded response for {method} {url}")
+                record_request_failure()
                 return None
-            else:
+        else:
+            wait_for_host(url)  # Rate limiting
+            # A prefetched page that's no longer needed doesn't have to be requested
+            if prefetch_cancelled():
+                return None
+            # Waiting for the host may have used up the rest of the time budget
+            if budget_exhausted(host):
                 print_debug(
-                    f"POST request attempt {attempt + 1} failed for {url}: {e}, retrying..."
+                    f"Time budget exhausted while waiting, not requesting {url}"
                 )
-                # Brief exponential backoff before retry
-                time.sleep(REQUEST_DELAY_SECONDS * (2**attempt))
-    return None
+                return None
+            record_request(host)
+            timeouts = get_timeouts()
+            sent = time.monotonic()
+            response = send_hedged(
+                lambda: _session.request(method, url, timeout=timeouts, **kwargs),
+                host,
+                allow_hedge=method == "GET" or HEDGE_POST_REQUESTS,
+                take_slot=lambda: try_host_slot(url),
+            )
+            if CASSETTE_MODE == "record":
+                record_cassette(method, url, kwargs, response)
+
+        record_response(len(response.content), time.monotonic() - sent)
+        if response.status_code >= 400:
+            record_request_failure(
+                retryable=response.status_code == 429 or response.status_code >= 500
+            )
+        return response
+    except requests.exceptions.RequestException as e:
+        print_debug(f"{label} failed for {url}: {e}")
+        record_request_failure(retryable=True)
+        return None
+
+
+def make_request(url: str, **kwargs) -> Optional[requests.Response]:
+    """Make a request with timeout and error handling."""
+    return _send_request("GET", url, **kwargs)
+
+
+def make_post_request(url: str, **kwargs) -> Optional[requests.Response]:
+    """Make a POST request with timeout and error handling."""
+    return _send_request("POST", url, **kwargs)
 
 
 # --------------------------------------------
@@ -68,14 +227,99 @@ def lever(company: str, found_jobs: Set[str]) -> List[Dict]:
     """
     Scrape jobs from Lever platform.
 
+    With LEVER_MODE set to "json", Lever's public postings API is used, paged
+    with skip/limit. The HTML job board is scraped as a fallback if the API fails.
+
     Args:
         company: Name of company, already formatted for immediate use
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
     """
+    postings = None
+    if LEVER_MODE == "json":
+        postings = _fetch_lever_json(company)
+        if postings is None:
+            print_debug(f"Falling back to Lever HTML scraping for {company}")
+
+    if postings is None:
+        postings = _fetch_lever_html(company)
+
     jobs = []
+    for posting in postings:
+        title = posting["title"]
+        url = posting["url"]
+        location = posting["location"]
+        job_key = make_job_key("lever", company, posting["id"])
+
+        # Apply filtering and check for duplicates
+        if should_include_job(title, location) and is_new_job(job_key, url, found_jobs):
+            job_data = {
+                "title": title,
+                "url": url,
+                "key": job_key,
+            }
+            if location:
+                job_data["location"] = location
+
+            jobs.append(job_data)
+
+    return jobs
+
+
+def _fetch_lever_json(company: str) -> Optional[List[Dict]]:
+    """
+    Fetch a company's postings from Lever's JSON postings API.
+
+    Returns:
+        List of postings as {id, title, url, location}, or None if the API failed
+    """
+    api_url = f"https://api.lever.co/v0/postings/{company}"
+    page_size = 100
+    skip = 0
+    postings = []
+
+    print_debug(f"Scraping Lever postings API for {company}")
+
+    while True:
+        # Stop cleanly, keeping partial results, once the time budget runs out
+        if budget_exhausted():
+            print_debug(f"{company} Lever time budget exhausted at skip={skip}")
+            break
+
+        response = make_request(
+            api_url, params={"mode": "json", "skip": skip, "limit": page_size}
+        )
+        if not response or response.status_code != 200:
+            print_debug(
+                f"Failed to fetch Lever postings API for {company} (status: {response.status_code if response else 'None'})"
+            )
+            return None
+
+        try:
+            data = response.json()
+            postings.extend(parse_lever_json(data))
+        except Exception as e:
+            print_debug(f"Error parsing Lever postings API response for {company}: {e}")
+            return None
+
+        # If we got fewer postings than requested, we've reached the end
+        if len(data) < page_size:
+            break
+
+        skip += page_size
+
+    return postings
+
+
+def _fetch_lever_html(company: str) -> List[Dict]:
+    """
+    Fetch a company's postings by scraping its jobs.lever.co HTML job board.
+
+    Returns:
+        List of postings as {id, title, url, location}
+    """
     api_url = f"https://jobs.lever.co/{company}"
 
     print_debug(f"Scraping Lever for {company}")
@@ -86,39 +330,56 @@ def lever(company: str, found_jobs: Set[str]) -> List[Dict]:
             company,
             f"Failed to fetch Lever jobs (status: {response.status_code if response else 'None'})",
         )
-        return jobs
+        return []
 
     try:
-        soup = BeautifulSoup(response.content, "html.parser")
-        job_postings = soup.find_all("div", attrs={"class": "posting"})
+        return parse_lever_html(response.content)
+    except Exception as e:
+        print_error(company, f"Error parsing Lever response: {e}")
+        return []
 
-        for posting in job_postings:
-            title_elem = posting.find("h5")
-            url_elem = posting.find("a")
-            location_elem = posting.find(
-                "span", class_="sort-by-location posting-category small-category-label"
-            )
 
-            if title_elem and url_elem:
-                title = title_elem.get_text(strip=True)
-                url = url_elem["href"]
-                location = location_elem.get_text(strip=True) if location_elem else ""
+def parse_lever_json(data: List[Dict]) -> List[Dict]:
+    """Decode a Lever postings API page into {id, title, url, location} postings."""
+    return [
+        {
+            "id": posting.get("id", ""),
+            "title": posting.get("text", ""),
+            "url": posting.get("hostedUrl", ""),
+            "location": (posting.get("categories") or {}).get("location") or "",
+        }
+        for posting in data
+        if posting.get("text") and posting.get("hostedUrl")
+    ]
 
-                # Apply filtering and check for duplicates
-                if should_include_job(title, location) and url not in found_jobs:
-                    job_data = {
-                        "title": title,
-                        "url": url,
-                    }
-                    if location:
-                        job_data["location"] = location
 
-                    jobs.append(job_data)
+def parse_lever_html(content: bytes) -> List[Dict]:
+    """Parse a jobs.lever.co HTML job board into {id, title, url, location} postings."""
+    postings = []
+    soup = BeautifulSoup(content, "html.parser")
 
-    except Exception as e:
-        print_error(company, f"Error parsing Lever response: {e}")
+    for posting in soup.find_all("div", attrs={"class": "posting"}):
+        title_elem = posting.find("h5")
+        url_elem = posting.find("a")
+        location_elem = posting.find(
+            "span", class_="sort-by-location posting-category small-category-label"
+        )
 
-    return jobs
+        if title_elem and url_elem:
+            url = url_elem["href"]
+            postings.append(
+                {
+                    # Lever URLs end with the posting's UUID
+                    "id": url.rstrip("/").split("/")[-1],
+                    "title": title_elem.get_text(strip=True),
+                    "url": url,
+                    "location": (
+                        location_elem.get_text(strip=True) if location_elem else ""
+                    ),
+                }
+            )
+
+    return postings
 
 
 def greenhouse(company: str, found_jobs: Set[str]) -> List[Dict]:
@@ -127,7 +388,7 @@ def greenhouse(company: str, found_jobs: Set[str]) -> List[Dict]:
 
     Args:
         company: Name of company, already formatted for immediate use
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
@@ -155,12 +416,16 @@ def greenhouse(company: str, found_jobs: Set[str]) -> List[Dict]:
             location = (
                 job.get("location", {}).get("name", "") if job.get("location") else ""
             )
+            job_key = make_job_key("greenhouse", company, job.get("id", ""))
 
             # Apply filtering and check for duplicates
-            if should_include_job(title, location) and url not in found_jobs:
+            if should_include_job(title, location) and is_new_job(
+                job_key, url, found_jobs
+            ):
                 job_data = {
                     "title": title,
                     "url": url,
+                    "key": job_key,
                 }
                 if location:
                     job_data["location"] = location
@@ -177,14 +442,99 @@ def ashby(company: str, found_jobs: Set[str]) -> List[Dict]:
     """
     Scrape jobs from Ashby platform.
 
+    With ASHBY_MODE set to "graphql", only the posting fields we use are requested
+    from Ashby's job board GraphQL API, so descriptions and compensation are never
+    downloaded. The full posting-api job board is used as a fallback.
+
     Args:
         company: Name of company, already formatted for immediate use
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
     """
+    postings = None
+    if ASHBY_MODE == "graphql":
+        postings = _fetch_ashby_graphql(company)
+        if postings is None:
+            print_debug(f"Falling back to Ashby posting API for {company}")
+
+    if postings is None:
+        postings = _fetch_ashby_posting_api(company)
+
     jobs = []
+    for posting in postings:
+        title = posting["title"]
+        url = posting["url"]
+        location = posting["location"]
+        job_key = make_job_key("ashby", company, posting["id"])
+
+        # Apply filtering and check for duplicates
+        if should_include_job(title, location) and is_new_job(job_key, url, found_jobs):
+            job_data = {
+                "title": title,
+                "url": url,
+                "key": job_key,
+            }
+            if location:
+                job_data["location"] = location
+
+            jobs.append(job_data)
+
+    return jobs
+
+
+# Requests only the posting fields the scraper consumes
+ASHBY_GRAPHQL_QUERY = """
+query ApiJobBoardWithTeams($organizationHostedJobsPageName: String!) {
+  jobBoard: jobBoardWithTeams(organizationHostedJobsPageName: $organizationHostedJobsPageName) {
+    jobPostings { id title locationName }
+  }
+}
+"""
+
+
+def ashby_graphql_payload(company: str) -> Dict:
+    """Build the field-projected GraphQL request body for an Ashby job board."""
+    return {
+        "operationName": "ApiJobBoardWithTeams",
+        "variables": {"organizationHostedJobsPageName": company},
+        "query": ASHBY_GRAPHQL_QUERY,
+    }
+
+
+def _fetch_ashby_graphql(company: str) -> Optional[List[Dict]]:
+    """
+    Fetch a company's postings from Ashby's GraphQL API, projected to the fields we use.
+
+    Returns:
+        List of postings as {id, title, url, location}, or None if the API failed
+    """
+    api_url = "https://jobs.ashbyhq.com/api/non-user-graphql?op=ApiJobBoardWithTeams"
+
+    print_debug(f"Scraping Ashby GraphQL API for {company}")
+
+    response = make_post_request(api_url, json=ashby_graphql_payload(company))
+    if not response or response.status_code != 200:
+        print_debug(
+            f"Failed to fetch Ashby GraphQL API for {company} (status: {response.status_code if response else 'None'})"
+        )
+        return None
+
+    try:
+        return parse_ashby_graphql(response.json(), company)
+    except Exception as e:
+        print_debug(f"Error parsing Ashby GraphQL response for {company}: {e}")
+        return None
+
+
+def _fetch_ashby_posting_api(company: str) -> List[Dict]:
+    """
+    Fetch a company's postings from Ashby's posting-api job board endpoint.
+
+    Returns:
+        List of postings as {id, title, url, location}
+    """
     api_url = f"https://api.ashbyhq.com/posting-api/job-board/{company}"
 
     print_debug(f"Scraping Ashby for {company}")
@@ -195,149 +545,286 @@ def ashby(company: str, found_jobs: Set[str]) -> List[Dict]:
             company,
             f"Failed to fetch Ashby jobs (status: {response.status_code if response else 'None'})",
         )
-        return jobs
+        return []
 
     try:
-        data = response.json()
-        job_listings = data.get("jobs", [])
+        return parse_ashby_posting_api(response.json())
+    except Exception as e:
+        print_error(company, f"Error parsing Ashby response: {e}")
+        return []
 
-        for job in job_listings:
-            title = job.get("title", "")
-            url = job.get("jobUrl", "")
 
-            # Handle Ashby's complex location format
-            location = ""
-            location_data = job.get("locationName", "") or job.get("address", "")
-
-            if isinstance(location_data, dict):
-                # Handle nested location structure like {'postalAddress': {'addressCountry': 'United States', ...}}
-                if "postalAddress" in location_data:
-                    postal = location_data["postalAddress"]
-                    parts = []
-                    if postal.get("addressLocality"):
-                        parts.append(postal["addressLocality"])
-                    if postal.get("addressRegion"):
-                        parts.append(postal["addressRegion"])
-                    if postal.get("addressCountry"):
-                        parts.append(postal["addressCountry"])
-                    location = ", ".join(parts)
-                else:
-                    # Try other common fields in location dict
-                    location = (
-                        location_data.get("name")
-                        or location_data.get("city")
-                        or location_data.get("location")
-                        or str(location_data)
-                    )
+def parse_ashby_graphql(data: Dict, company: str) -> List[Dict]:
+    """Decode an Ashby GraphQL job board response into {id, title, url, location} postings."""
+    job_board = (data.get("data") or {}).get("jobBoard")
+    if job_board is None:
+        raise ValueError(f"No job board in response: {data.get('errors')}")
+
+    return [
+        {
+            "id": posting["id"],
+            "title": posting.get("title") or "",
+            "url": f"https://jobs.ashbyhq.com/{company}/{posting['id']}",
+            "location": posting.get("locationName") or "",
+        }
+        for posting in job_board.get("jobPostings", [])
+        if posting.get("id")
+    ]
+
+
+def parse_ashby_posting_api(data: Dict) -> List[Dict]:
+    """Decode an Ashby posting-api job board response into {id, title, url, location} postings."""
+    postings = []
+
+    for job in data.get("jobs", []):
+        title = job.get("title", "")
+        url = job.get("jobUrl", "")
+
+        # Handle Ashby's complex location format
+        location = ""
+        location_data = job.get("locationName", "") or job.get("address", "")
+
+        if isinstance(location_data, dict):
+            # Handle nested location structure like {'postalAddress': {'addressCountry': 'United States', ...}}
+            if "postalAddress" in location_data:
+                postal = location_data["postalAddress"]
+                parts = []
+                if postal.get("addressLocality"):
+                    parts.append(postal["addressLocality"])
+                if postal.get("addressRegion"):
+                    parts.append(postal["addressRegion"])
+                if postal.get("addressCountry"):
+                    parts.append(postal["addressCountry"])
+                location = ", ".join(parts)
             else:
-                location = location_data or ""
+                # Try other common fields in location dict
+                location = (
+                    location_data.get("name")
+                    or location_data.get("city")
+                    or location_data.get("location")
+                    or str(location_data)
+                )
+        else:
+            location = location_data or ""
+
+        postings.append(
+            {
+                "id": job.get("id", ""),
+                "title": title,
+                "url": url,
+                "location": location,
+            }
+        )
 
-            # Apply filtering and check for duplicates
-            if should_include_job(title, location) and url not in found_jobs:
-                job_data = {
-                    "title": title,
-                    "url": url,
-                }
-                if location:
-                    job_data["location"] = location
+    return postings
 
-                jobs.append(job_data)
 
-    except Exception as e:
-        print_error(company, f"Error parsing Ashby response: {e}")
+def netflix(found_jobs: Set[str]) -> List[Dict]:
+    """
+    Custom scraper for Netflix.
+
+    With NETFLIX_PUSHDOWN enabled, one narrow search is made per
+    PUSHDOWN_SEARCH_QUERIES entry, restricted to NETFLIX_DEPARTMENTS, and the
+    results are unioned. Locations aren't pushed down, since Netflix's API only
+    takes a single free-text location, so US/EU filtering stays local. Local
+    filtering still runs on every listing.
+
+    Args:
+        found_jobs: Set containing keys of previously found listings
 
+    Returns:
+        A list of new job listings for that company
+    """
+    if NETFLIX_PUSHDOWN:
+        searches = [
+            {"query": query, "Teams": NETFLIX_DEPARTMENTS}
+            for query in PUSHDOWN_SEARCH_QUERIES
+        ]
+    else:
+        searches = [{}]
+
+    # Netflix historically returned 10 jobs per request regardless of parameters,
+    # so larger sizes are only used if a probe shows the API honours "num"
+    page_size = negotiate_page_size(
+        "netflix", 10, [100, 50], lambda size: _netflix_first_page(size)
+    )
+
+    jobs = []
+    tracker = start_incremental("netflix")
+    all_searches_complete = True
+    seen_keys = set()  # Listings can match several searches
+    postings_returned = 0
+    for search_params in searches:
+        search_jobs, search_complete, search_postings = _netflix_search(
+            search_params, page_size, found_jobs, seen_keys, tracker
+        )
+        jobs.extend(search_jobs)
+        all_searches_complete = all_searches_complete and search_complete
+        postings_returned += search_postings
+
+    # Filter values the API doesn't recognise make every narrow search come back empty,
+    # which would otherwise look like a complete sweep of an empty board
+    if NETFLIX_PUSHDOWN and all_searches_complete and not postings_returned:
+        print_error(
+            "Netflix",
+            "Netflix pushdown searches returned no postings, check the pushdown "
+            "filters or set NETFLIX_PUSHDOWN=False",
+        )
+        all_searches_complete = False
+
+    finish_incremental(tracker, all_searches_complete)
     return jobs
 
 
-def netflix(found_jobs: Set[str]) -> List[Dict]:
+def _netflix_first_page(page_size: int) -> Optional[Tuple[int, Optional[int]]]:
+    """Request Netflix's first page at a given size, for page-size negotiation."""
+    response = make_request(
+        "https://explore.jobs.netflix.net/api/apply/v2/jobs?domain=netflix.com&start=0",
+        params={"num": page_size},
+    )
+    if not response:
+        return None
+
+    try:
+        data = response.json() if response.status_code == 200 else {}
+        return len(data.get("positions", [])), data.get("count")
+    except ValueError:
+        return 0, None
+
+
+def _netflix_search(
+    search_params: Dict,
+    page_size: int,
+    found_jobs: Set[str],
+    seen_keys: Set[str],
+    tracker: Dict,
+) -> Tuple[List[Dict], bool]:
     """
-    Custom scraper for Netflix.
+    Page through a single Netflix job search.
 
     Args:
-        found_jobs: Set containing URLs of previously found listings
+        search_params: Native query parameters for the search ({} for everything)
+        page_size: Number of jobs requested per page
+        found_jobs: Set containing keys of previously found listings
+        seen_keys: Keys already returned by earlier searches in this run
+        tracker: Incremental pagination tracker for Netflix
 
     Returns:
-        A list of new job listings for that company
+        Tuple of (list of new job listings found by this search,
+        whether pagination reached the end of the search results,
+        number of postings returned before filtering)
     """
     jobs = []
-    # Netflix API hardcodes 10 jobs per request — this can't be changed using parameters
-    page_size = 10
+    postings_returned = 0
     start = 0
     # Netflix had ~546 jobs at the time of development
-    max_pages = 80
+    max_pages = -(-800 // page_size)  # Ceiling division
     pages_fetched = 0
+    reached_end = False
+    search_label = search_params.get("query") or "all jobs"
+    reset_known_streak(tracker)
+
+    print_debug(f"Scraping Netflix custom API for {search_label}")
 
-    print_debug("Scraping Netflix custom API")
+    def fetch_page(page_start: int):
+        return make_request(
+            f"https://explore.jobs.netflix.net/api/apply/v2/jobs?domain=netflix.com&start={page_start}",
+            params={**search_params, "num": page_size},
+        )
 
+    pages = PagePrefetcher(fetch_page)
     while pages_fetched < max_pages:
-        api_url = f"https://explore.jobs.netflix.net/api/apply/v2/jobs?domain=netflix.com&start={start}"
+        # Stop cleanly, keeping partial results, once the time budget runs out
+        if budget_exhausted():
+            print_debug(f"Netflix time budget exhausted after {pages_fetched} pages")
+            break
 
         print_debug(f"Fetching Netflix page {pages_fetched + 1} (start={start})")
 
-        response = make_request(api_url)
+        response = pages.get(start)
         if not response or response.status_code != 200:
-            print_error(
-                "Netflix",
-                f"Failed to fetch Netflix jobs (status: {response.status_code if response else 'None'})",
-            )
+            if not budget_exhausted():
+                print_error(
+                    "Netflix",
+                    f"Failed to fetch Netflix jobs (status: {response.status_code if response else 'None'})",
+                )
             break
 
         try:
             data = response.json()
             job_listings = data.get("positions", [])
             total_count = data.get("count", 0)  # Total jobs available
+            postings_returned += len(job_listings)
 
             # If no jobs returned, we've reached the end
             if not job_listings:
                 print_debug(f"No more Netflix jobs found after {pages_fetched} pages")
+                reached_end = True
                 break
 
+            # Fetch the next page while this one is filtered
+            if len(job_listings) >= page_size and pages_fetched + 1 < max_pages:
+                pages.prefetch(start + page_size)
+
             page_jobs_found = 0
+            page_keys = []
             for job in job_listings:
                 title = job.get("name", "")
                 url = job.get("canonicalPositionUrl", "")
                 location = job.get("locations", [""])[0] if job.get("locations") else ""
-
-                # Apply filtering and check for duplicates
-                if should_include_job(title, location) and url not in found_jobs:
+                job_key = make_job_key("netflix", job.get("id", ""))
+                page_keys.append(job_key)
+
+                # Apply filtering and check for duplicates (both previous runs and earlier searches)
+                if (
+                    should_include_job(title, location)
+                    and is_new_job(job_key, url, found_jobs)
+                    and job_key not in seen_keys
+                ):
                     job_data = {
                         "title": title,
                         "url": url,
+                        "key": job_key,
                     }
                     if location:
                         job_data["location"] = location
 
                     jobs.append(job_data)
+                    seen_keys.add(job_key)
                     page_jobs_found += 1
 
             print_debug(
                 f"Found {page_jobs_found} new Netflix jobs on page {pages_fetched + 1} (total available: {total_count})"
             )
 
+            # Stop early once consecutive pages contain only previously seen postings
+            if page_is_known(tracker, page_keys):
+                print_debug(
+                    "Netflix pages contain only previously seen postings, stopping pagination"
+                )
+                break
+
             # If we got fewer jobs than requested, we've likely reached the end
             if len(job_listings) < page_size:
                 print_debug(
                     f"Netflix returned fewer jobs than requested, stopping pagination"
                 )
+                reached_end = True
                 break
 
-            # Increment by actual number of jobs returned (always 10 for Netflix)
+            # Increment by the page size that was requested
             start += page_size
             pages_fetched += 1
 
-            # Additional sleep between pages to be respectful
-            if pages_fetched < max_pages:
-                print_debug("Sleeping briefly between Netflix pages...")
-                time.sleep(REQUEST_DELAY_SECONDS)
-
         except Exception as e:
             print_error("Netflix", f"Error parsing Netflix response: {e}")
             break
 
+    pages.close()
     print_debug(
-        f"Netflix pagination complete: {len(jobs)} total new jobs found across {pages_fetched} pages"
+        f"Netflix search for {search_label} complete: {len(jobs)} new jobs found across {pages_fetched} pages"
     )
-    return jobs
+    return jobs, reached_end, postings_returned
 
 
 def spotify(found_jobs: Set[str]) -> List[Dict]:
@@ -345,7 +832,7 @@ def spotify(found_jobs: Set[str]) -> List[Dict]:
     Custom scraper for Spotify.
 
     Args:
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
@@ -373,12 +860,16 @@ def spotify(found_jobs: Set[str]) -> List[Dict]:
             job_id = job.get("id", "")
             url = listing_url_template.format(job_id) if job_id else ""
             location = job.get("city", "")
+            job_key = make_job_key("spotify", job_id)
 
             # Apply filtering and check for duplicates
-            if should_include_job(title, location) and url not in found_jobs:
+            if should_include_job(title, location) and is_new_job(
+                job_key, url, found_jobs
+            ):
                 job_data = {
                     "title": title,
                     "url": url,
+                    "key": job_key,
                 }
                 if location:
                     job_data["location"] = location
@@ -395,21 +886,112 @@ def uber(found_jobs: Set[str]) -> List[Dict]:
     """
     Custom scraper for Uber.
 
+    With UBER_PUSHDOWN enabled, one narrow search is made per
+    PUSHDOWN_SEARCH_QUERIES entry, restricted to UBER_DEPARTMENTS and
+    UBER_LOCATIONS, and the results are unioned. Local filtering still runs
+    on every listing.
+
     Args:
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
     """
+    if UBER_PUSHDOWN:
+        searches = [
+            {
+                "query": query,
+                "department": UBER_DEPARTMENTS,
+                "location": UBER_LOCATIONS,
+            }
+            for query in PUSHDOWN_SEARCH_QUERIES
+        ]
+    else:
+        searches = [{}]
+
+    page_size = negotiate_page_size(
+        "uber", 50, [200, 100], lambda size: _uber_first_page(size)
+    )
+
+    jobs = []
+    tracker = start_incremental("uber")
+    all_searches_complete = True
+    seen_keys = set()  # Listings can match several searches
+    postings_returned = 0
+    for search_filters in searches:
+        search_jobs, search_complete, search_postings = _uber_search(
+            search_filters, page_size, found_jobs, seen_keys, tracker
+        )
+        jobs.extend(search_jobs)
+        all_searches_complete = all_searches_complete and search_complete
+        postings_returned += search_postings
+
+    # Filter values the API doesn't recognise make every narrow search come back empty,
+    # which would otherwise look like a complete sweep of an empty board
+    if UBER_PUSHDOWN and all_searches_complete and not postings_returned:
+        print_error(
+            "Uber",
+            "Uber pushdown searches returned no postings, check the pushdown "
+            "filters or set UBER_PUSHDOWN=False",
+        )
+        all_searches_complete = False
+
+    finish_incremental(tracker, all_searches_complete)
+    return jobs
+
+
+def _uber_first_page(page_size: int) -> Optional[Tuple[int, Optional[int]]]:
+    """Request Uber's first page at a given size, for page-size negotiation."""
+    response = make_post_request(
+        "https://www.uber.com/api/loadSearchJobsResults",
+        params={"localeCode": "en"},
+        headers={"x-csrf-token": "x"},
+        json={"params": {}, "page": 0, "limit": page_size},
+    )
+    if not response:
+        return None
+
+    try:
+        data = response.json() if response.status_code == 200 else {}
+        return len(data.get("data", {}).get("results", [])), None
+    except ValueError:
+        return 0, None
+
+
+def _uber_search(
+    search_filters: Dict,
+    page_size: int,
+    found_jobs: Set[str],
+    seen_keys: Set[str],
+    tracker: Dict,
+) -> Tuple[List[Dict], bool]:
+    """
+    Page through a single Uber job search.
+
+    Args:
+        search_filters: Native search "params" for the request body ({} for everything)
+        page_size: Number of jobs requested per page
+        found_jobs: Set containing keys of previously found listings
+        seen_keys: Keys already returned by earlier searches in this run
+        tracker: Incremental pagination tracker for Uber
+
+    Returns:
+        Tuple of (list of new job listings found by this search,
+        whether pagination reached the end of the search results,
+        number of postings returned before filtering)
+    """
     jobs = []
+    postings_returned = 0
     api_url = "https://www.uber.com/api/loadSearchJobsResults"
     job_url_template = "https://www.uber.com/global/en/careers/list/{}/"
 
-    page_size = 50
     current_page = 0
-    max_pages = 20  # Reasonable limit to prevent infinite loops
+    max_pages = -(-1000 // page_size)  # Reasonable limit to prevent infinite loops
+    reached_end = False
+    search_label = search_filters.get("query") or "all jobs"
+    reset_known_streak(tracker)
 
-    print_debug("Scraping Uber custom API")
+    print_debug(f"Scraping Uber custom API for {search_label}")
 
     headers = {
         "x-csrf-token": "x",
@@ -419,35 +1001,51 @@ def uber(found_jobs: Set[str]) -> List[Dict]:
         "localeCode": "en",
     }
 
-    while current_page < max_pages:
+    def fetch_page(page: int):
         json_data = {
-            "params": {},
-            "page": current_page,
+            "params": search_filters,
+            "page": page,
             "limit": page_size,
         }
+        return make_post_request(
+            api_url, params=params, headers=headers, json=json_data
+        )
+
+    pages = PagePrefetcher(fetch_page)
+    while current_page < max_pages:
+        # Stop cleanly, keeping partial results, once the time budget runs out
+        if budget_exhausted():
+            print_debug(f"Uber time budget exhausted after {current_page} pages")
+            break
 
         print_debug(f"Fetching Uber page {current_page + 1}")
 
-        response = make_post_request(
-            api_url, params=params, headers=headers, json=json_data
-        )
+        response = pages.get(current_page)
         if not response or response.status_code != 200:
-            print_error(
-                "Uber",
-                f"Failed to fetch Uber jobs (status: {response.status_code if response else 'None'})",
-            )
+            if not budget_exhausted():
+                print_error(
+                    "Uber",
+                    f"Failed to fetch Uber jobs (status: {response.status_code if response else 'None'})",
+                )
             break
 
         try:
             data = response.json()
             job_listings = data.get("data", {}).get("results", [])
+            postings_returned += len(job_listings)
 
             # If no jobs returned, we've reached the end
             if not job_listings:
                 print_debug(f"No more Uber jobs found after {current_page} pages")
+                reached_end = True
                 break
 
+            # Fetch the next page while this one is filtered
+            if len(job_listings) >= page_size and current_page + 1 < max_pages:
+                pages.prefetch(current_page + 1)
+
             page_jobs_found = 0
+            page_keys = []
             for job in job_listings:
                 title = job.get("title", "")
                 job_id = job.get("id", "")
@@ -466,44 +1064,57 @@ def uber(found_jobs: Set[str]) -> List[Dict]:
                 else:
                     location = location_data or ""
 
-                # Apply filtering and check for duplicates
-                if should_include_job(title, location) and url not in found_jobs:
+                job_key = make_job_key("uber", job_id)
+                page_keys.append(job_key)
+
+                # Apply filtering and check for duplicates (both previous runs and earlier searches)
+                if (
+                    should_include_job(title, location)
+                    and is_new_job(job_key, url, found_jobs)
+                    and job_key not in seen_keys
+                ):
                     job_data = {
                         "title": title,
                         "url": url,
+                        "key": job_key,
                     }
                     if location:
                         job_data["location"] = location
 
                     jobs.append(job_data)
+                    seen_keys.add(job_key)
                     page_jobs_found += 1
 
             print_debug(
                 f"Found {page_jobs_found} new Uber jobs on page {current_page + 1}"
             )
 
+            # Stop early once consecutive pages contain only previously seen postings
+            if page_is_known(tracker, page_keys):
+                print_debug(
+                    "Uber pages contain only previously seen postings, stopping pagination"
+                )
+                break
+
             # If we got fewer jobs than requested, we've likely reached the end
             if len(job_listings) < page_size:
                 print_debug(
                     f"Uber returned fewer jobs than requested, stopping pagination"
                 )
+                reached_end = True
                 break
 
             current_page += 1
 
-            # Additional sleep between pages to be respectful
-            if current_page < max_pages:
-                print_debug("Sleeping briefly between Uber pages...")
-                time.sleep(REQUEST_DELAY_SECONDS)
-
         except Exception as e:
             print_error("Uber", f"Error parsing Uber response: {e}")
             break
 
+    pages.close()
     print_debug(
-        f"Uber pagination complete: {len(jobs)} total new jobs found across {current_page} pages"
+        f"Uber search for {search_label} complete: {len(jobs)} new jobs found across {current_page} pages"
     )
-    return jobs
+    return jobs, reached_end, postings_returned
 
 
 # --------------------------------------------
@@ -515,9 +1126,14 @@ def myworkdayjobs(company: str, found_jobs: Set[str]) -> List[Dict]:
     """
     Scraper for Workday platform, specifically the myworkdayjobs.com domain.
 
+    With WORKDAY_PUSHDOWN enabled, keyword and location filtering is pushed to
+    Workday's search API: one search is made per PUSHDOWN_SEARCH_QUERIES entry,
+    restricted to US/EU country facets, and the results are unioned.
+    Local filtering still runs on every listing as the final check.
+
     Args:
         company: Name of company, already formatted for immediate use
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
@@ -541,39 +1157,220 @@ def myworkdayjobs(company: str, found_jobs: Set[str]) -> List[Dict]:
 
     print_debug(f"Scraping Workday API for {company} at {api_url}")
 
-    page_size = 20
-    current_offset = 0
-    # Workday sites can have many jobs, so higher limit
-    # At the time of development, Raytheon Technologies had ~2600 jobs
-    max_pages = 150
-    pages_fetched = 0
-
     headers = {
         "Accept": "application/json",
         "Content-Type": "application/json",
         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
     }
 
-    while pages_fetched < max_pages:
-        # Workday API parameters
+    if WORKDAY_PUSHDOWN:
+        search_queries = PUSHDOWN_SEARCH_QUERIES
+        applied_facets = get_workday_location_facets(company, api_url, headers)
+    else:
         # No filters used since different Workday-using companies have different filters on their job boards
+        search_queries = [""]
+        applied_facets = {}
+
+    page_size = negotiate_page_size(
+        f"workday_{company}",
+        20,
+        [100, 50],
+        lambda size: _workday_first_page(api_url, headers, size),
+    )
+
+    tracker = start_incremental(f"workday_{company}")
+    all_searches_complete = True
+    seen_keys = set()  # Listings can match several search queries
+    for search_text in search_queries:
+        search_jobs, search_complete = _myworkdayjobs_search(
+            company,
+            api_url,
+            base_url,
+            headers,
+            search_text,
+            applied_facets,
+            page_size,
+            found_jobs,
+            seen_keys,
+            tracker,
+        )
+        jobs.extend(search_jobs)
+        all_searches_complete = all_searches_complete and search_complete
+
+    finish_incremental(tracker, all_searches_complete)
+    return jobs
+
+
+def get_workday_location_facets(
+    company: str, api_url: str, headers: Dict[str, str]
+) -> Dict[str, List[str]]:
+    """
+    Get the Workday facets that restrict a tenant's search to US/EU countries.
+
+    Facet IDs differ per tenant, so they are discovered from the facets returned
+    by a minimal search and cached for WORKDAY_FACET_CACHE_DAYS.
+
+    Args:
+        company: Name of company, already formatted for immediate use
+        api_url: Workday jobs API endpoint for the company
+        headers: Headers to send with the discovery request
+
+    Returns:
+        appliedFacets dictionary (empty if no country facet could be found)
+    """
+    facet_cache = load_state(WORKDAY_FACETS_STATE, {})
+    cached = facet_cache.get(company)
+    if cached and run_time() - cached["discovered"] < WORKDAY_FACET_CACHE_DAYS * 86400:
+        return cached["applied_facets"]
+
+    print_debug(f"Discovering {company} Workday location facets")
+    search_params = {"appliedFacets": {}, "limit": 1, "offset": 0, "searchText": ""}
+    response = make_post_request(api_url, json=search_params, headers=headers)
+    if not response or response.status_code != 200:
+        print_debug(
+            f"Could not discover {company} Workday facets, searching unfiltered"
+        )
+        return {}
+
+    try:
+        applied_facets = {}
+        for facet_parameter, values in _iter_workday_facets(
+            response.json().get("facets", [])
+        ):
+            if "country" not in facet_parameter.lower():
+                continue
+
+            facet_ids = [
+                value["id"]
+                for value in values
+                if value.get("id") and is_us_or_eu_location(value.get("descriptor", ""))
+            ]
+            if facet_ids:
+                applied_facets[facet_parameter] = facet_ids
+                break  # One country facet is enough to restrict the search
+    except Exception as e:
+        print_debug(f"Error parsing {company} Workday facets: {e}")
+        return {}
+
+    def add_to_cache(facet_cache: Dict) -> Dict:
+        facet_cache[company] = {
+            "applied_facets": applied_facets,
+            "discovered": run_time(),
+        }
+        return facet_cache
+
+    update_state(WORKDAY_FACETS_STATE, add_to_cache, {})
+    return applied_facets
+
+
+def _workday_first_page(
+    api_url: str, headers: Dict[str, str], page_size: int
+) -> Optional[Tuple[int, Optional[int]]]:
+    """Request a Workday tenant's first page at a given size, for page-size negotiation."""
+    search_params = {
+        "appliedFacets": {},
+        "limit": page_size,
+        "offset": 0,
+        "searchText": "",
+    }
+    response = make_post_request(api_url, json=search_params, headers=headers)
+    if not response:
+        return None
+
+    try:
+        data = response.json() if response.status_code == 200 else {}
+        return len(data.get("jobPostings", [])), data.get("total")
+    except ValueError:
+        return 0, None
+
+
+def _iter_workday_facets(facets: List[Dict]):
+    """
+    Yield (facetParameter, values) for every facet in a Workday response.
+
+    Some tenants group facets (e.g. countries nested under a location group),
+    so nested facets are walked as well.
+    """
+    for facet in facets:
+        values = facet.get("values", [])
+        nested = [value for value in values if "facetParameter" in value]
+        if nested:
+            yield from _iter_workday_facets(nested)
+        else:
+            yield facet.get("facetParameter", ""), values
+
+
+def _myworkdayjobs_search(
+    company: str,
+    api_url: str,
+    base_url: str,
+    headers: Dict[str, str],
+    search_text: str,
+    applied_facets: Dict[str, List[str]],
+    page_size: int,
+    found_jobs: Set[str],
+    seen_keys: Set[str],
+    tracker: Dict,
+) -> Tuple[List[Dict], bool]:
+    """
+    Page through a single Workday search.
+
+    Args:
+        company: Name of company, already formatted for immediate use
+        api_url: Workday jobs API endpoint for the company
+        base_url: Base URL that job paths are appended to
+        headers: Headers to send with each request
+        search_text: Workday searchText for the search ("" for everything)
+        applied_facets: Workday appliedFacets for the search
+        page_size: Number of jobs requested per page
+        found_jobs: Set containing keys of previously found listings
+        seen_keys: Keys already returned by earlier searches in this run
+        tracker: Incremental pagination tracker for the company
+
+    Returns:
+        Tuple of (list of new job listings found by this search,
+        whether pagination reached the end of the search results)
+    """
+    jobs = []
+    current_offset = 0
+    # Workday sites can have many jobs, so higher limit
+    # At the time of development, Raytheon Technologies had ~2600 jobs
+    max_pages = -(-3000 // page_size)  # Ceiling division
+    pages_fetched = 0
+    search_label = f"'{search_text}'" if search_text else "all jobs"
+    reached_end = False
+    reset_known_streak(tracker)
+
+    def fetch_page(offset: int):
+        # Workday API parameters
         search_params = {
-            "appliedFacets": {},
+            "appliedFacets": applied_facets,
             "limit": page_size,
-            "offset": current_offset,
-            "searchText": "",
+            "offset": offset,
+            "searchText": search_text,
         }
+        return make_post_request(api_url, json=search_params, headers=headers)
+
+    pages = PagePrefetcher(fetch_page)
+    while pages_fetched < max_pages:
+        # Stop cleanly, keeping partial results, once the time budget runs out
+        if budget_exhausted():
+            print_debug(
+                f"{company} Workday time budget exhausted after {pages_fetched} pages"
+            )
+            break
 
         print_debug(
-            f"Fetching {company} Workday page {pages_fetched + 1} (offset={current_offset})"
+            f"Fetching {company} Workday page {pages_fetched + 1} for {search_label} (offset={current_offset})"
         )
 
-        response = make_post_request(api_url, json=search_params, headers=headers)
+        response = pages.get(current_offset)
         if not response or response.status_code != 200:
-            print_error(
-                company,
-                f"Failed to fetch Workday jobs (status: {response.status_code if response else 'None'})",
-            )
+            if not budget_exhausted():
+                print_error(
+                    company,
+                    f"Failed to fetch Workday jobs (status: {response.status_code if response else 'None'})",
+                )
             break
 
         try:
@@ -585,9 +1382,15 @@ def myworkdayjobs(company: str, found_jobs: Set[str]) -> List[Dict]:
                 print_debug(
                     f"No more {company} Workday jobs found after {pages_fetched} pages"
                 )
+                reached_end = True
                 break
 
+            # Fetch the next page while this one is filtered
+            if len(job_listings) >= page_size and pages_fetched + 1 < max_pages:
+                pages.prefetch(current_offset + page_size)
+
             page_jobs_found = 0
+            page_keys = []
             for job in job_listings:
                 title = job.get("title", "")
                 external_path = job.get("externalPath", "")
@@ -597,49 +1400,61 @@ def myworkdayjobs(company: str, found_jobs: Set[str]) -> List[Dict]:
 
                 # Construct the full job URL
                 job_url = f"{base_url}{external_path}"
+                job_key = workday_job_key(company, external_path)
+                page_keys.append(job_key)
 
                 # Extract location if available
                 location = job.get("locationsText", "")
 
-                # Apply filtering and check for duplicates
-                if should_include_job(title, location) and job_url not in found_jobs:
+                # Apply filtering and check for duplicates (both previous runs and earlier searches)
+                if (
+                    should_include_job(title, location)
+                    and is_new_job(job_key, job_url, found_jobs)
+                    and job_key not in seen_keys
+                ):
                     job_data = {
                         "title": title,
                         "url": job_url,
+                        "key": job_key,
                     }
                     if location:
                         job_data["location"] = location
 
                     jobs.append(job_data)
+                    seen_keys.add(job_key)
                     page_jobs_found += 1
 
             print_debug(
                 f"Found {page_jobs_found} new {company} Workday jobs on page {pages_fetched + 1}"
             )
 
+            # Stop early once consecutive pages contain only previously seen postings
+            if page_is_known(tracker, page_keys):
+                print_debug(
+                    f"{company} Workday pages contain only previously seen postings, stopping pagination"
+                )
+                break
+
             # If we got fewer jobs than requested, we've likely reached the end
             if len(job_listings) < page_size:
                 print_debug(
                     f"{company} Workday returned fewer jobs than requested, stopping pagination"
                 )
+                reached_end = True
                 break
 
             current_offset += page_size
             pages_fetched += 1
 
-            # Additional sleep between pages to be respectful
-            if pages_fetched < max_pages:
-                print_debug(f"Sleeping briefly between {company} Workday pages...")
-                time.sleep(REQUEST_DELAY_SECONDS)
-
         except Exception as e:
             print_error(company, f"Error parsing Workday JSON response: {e}")
             break
 
+    pages.close()
     print_debug(
-        f"{company} Workday pagination complete: {len(jobs)} total new jobs found across {pages_fetched} pages"
+        f"{company} Workday search for {search_label} complete: {len(jobs)} new jobs found across {pages_fetched} pages"
     )
-    return jobs
+    return jobs, reached_end
 
 
 def myworkdaysite(company: str, found_jobs: Set[str]) -> List[Dict]:
@@ -648,7 +1463,7 @@ def myworkdaysite(company: str, found_jobs: Set[str]) -> List[Dict]:
 
     Args:
         company: Name of company, already formatted for immediate use
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
@@ -667,7 +1482,7 @@ def icims(company: str, found_jobs: Set[str]) -> List[Dict]:
 
     Args:
         company: Name of company, already formatted for immediate use
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
@@ -682,7 +1497,7 @@ def successfactors(company: str, found_jobs: Set[str]) -> List[Dict]:
 
     Args:
         company: Name of company, already formatted for immediate use
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
@@ -697,7 +1512,7 @@ def nc2(company: str, found_jobs: Set[str]) -> List[Dict]:
 
     Args:
         company: Name of company, already formatted for immediate use
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
@@ -712,7 +1527,7 @@ def jobvite(company: str, found_jobs: Set[str]) -> List[Dict]:
 
     Args:
         company: Name of company, already formatted for immediate use
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
@@ -763,16 +1578,21 @@ def jobvite(company: str, found_jobs: Set[str]) -> List[Dict]:
                 if len(tds) > 1:
                     location = tds[1].get_text(strip=True)
 
+            # Jobvite URLs end with the job ID, possibly followed by a query string
+            job_id = urlparse(url).path.rstrip("/").split("/")[-1]
+            job_key = make_job_key("jobvite", company, job_id)
+
             # Apply filtering and check for duplicates
             if (
                 title
                 and url
                 and should_include_job(title, location)
-                and url not in found_jobs
+                and is_new_job(job_key, url, found_jobs)
             ):
                 job_data = {
                     "title": title,
                     "url": url,
+                    "key": job_key,
                 }
                 if location:
                     job_data["location"] = location
@@ -789,37 +1609,257 @@ def smartrecruiters(company: str, found_jobs: Set[str]) -> List[Dict]:
     """
     Scraper for SmartRecruiters platform.
 
+    With SMARTRECRUITERS_MODE set to "json", SmartRecruiters' public postings API
+    is used, with the keyword query pushed to the server (unless APPLY_FILTERING
+    is disabled). The HTML careers page is scraped as a fallback if the API fails.
+
     Args:
         company: Name of company, already formatted for immediate use
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
     """
+    if SMARTRECRUITERS_MODE == "json":
+        jobs = _smartrecruiters_json(company, found_jobs)
+        if jobs is not None:
+            return jobs
+        print_debug(f"Falling back to SmartRecruiters HTML scraping for {company}")
+
+    return _smartrecruiters_html(company, found_jobs)
+
+
+def _smartrecruiters_json(company: str, found_jobs: Set[str]) -> Optional[List[Dict]]:
+    """
+    Scrape a company's postings from SmartRecruiters' JSON postings API.
+
+    One search is made per PUSHDOWN_SEARCH_QUERIES entry and the results are unioned,
+    or a single unfiltered search if APPLY_FILTERING is disabled.
+    Local filtering still runs on every posting as the final check.
+
+    Returns:
+        A list of new job listings, or None if the API couldn't be reached
+    """
+    jobs = []
+    tracker = start_incremental(f"smartrecruiters_{company}")
+    all_searches_complete = True
+    seen_keys = set()  # Postings can match several search queries
+
+    print_debug(f"Scraping SmartRecruiters postings API for {company}")
+
+    search_queries = PUSHDOWN_SEARCH_QUERIES if APPLY_FILTERING else [""]
+    for query_index, query in enumerate(search_queries):
+        search_result = _smartrecruiters_search(
+            company, query, found_jobs, seen_keys, tracker
+        )
+        if search_result is None:
+            # Fall back to HTML only if the API failed before returning anything
+            if query_index == 0:
+                return None
+            all_searches_complete = False
+            continue
+
+        search_jobs, search_complete = search_result
+        jobs.extend(search_jobs)
+        all_searches_complete = all_searches_complete and search_complete
+
+    finish_incremental(tracker, all_searches_complete)
+    return jobs
+
+
+def _smartrecruiters_search(
+    company: str,
+    query: str,
+    found_jobs: Set[str],
+    seen_keys: Set[str],
+    tracker: Dict,
+) -> Optional[Tuple[List[Dict], bool]]:
+    """
+    Page through a single SmartRecruiters postings API search.
+
+    The first page's totalFound is used to plan how many pages to fetch.
+
+    Args:
+        company: Name of company, already formatted for immediate use
+        query: Keyword query sent to the API ("" for everything)
+        found_jobs: Set containing keys of previously found listings
+        seen_keys: Keys already returned by earlier searches in this run
+        tracker: Incremental pagination tracker for the company
+
+    Returns:
+        Tuple of (list of new job listings, whether all planned pages were fetched),
+        or None if the first page couldn't be fetched
+    """
     jobs = []
-    current_run_urls = set()  # Track URLs found in this run to prevent duplicates
+    api_url = f"https://api.smartrecruiters.com/v1/companies/{company}/postings"
+    page_size = 100  # Largest page size the API accepts
+    max_pages = 20
+    planned_pages = 1
+    pages_fetched = 0
+    reached_end = False
+    reset_known_streak(tracker)
+
+    def fetch_page(offset: int):
+        params = {"limit": page_size, "offset": offset}
+        if query:
+            params["q"] = query
+        return make_request(api_url, params=params)
+
+    pages = PagePrefetcher(fetch_page)
+    while pages_fetched < min(planned_pages, max_pages):
+        # Stop cleanly, keeping partial results, once the time budget runs out
+        if budget_exhausted():
+            print_debug(
+                f"{company} SmartRecruiters time budget exhausted after {pages_fetched} pages"
+            )
+            break
+
+        print_debug(
+            f"Fetching {company} SmartRecruiters page {pages_fetched + 1} for '{query}'"
+        )
+
+        response = pages.get(pages_fetched * page_size)
+        if not response or response.status_code != 200:
+            if pages_fetched == 0:
+                print_debug(
+                    f"Failed to fetch SmartRecruiters postings API for {company} (status: {response.status_code if response else 'None'})"
+                )
+                return None
+            if not budget_exhausted():
+                print_error(
+                    company,
+                    f"Failed to fetch SmartRecruiters jobs (status: {response.status_code if response else 'None'})",
+                )
+            break
+
+        try:
+            data = response.json()
+            postings = data.get("content", [])
+
+            # Plan the remaining pages from the total number of matching postings
+            if pages_fetched == 0:
+                total_found = data.get("totalFound", 0)
+                planned_pages = -(-total_found // page_size)  # Ceiling division
+                print_debug(
+                    f"{company} SmartRecruiters has {total_found} postings for '{query}' ({planned_pages} pages)"
+                )
+
+            # Fetch the next page while this one is filtered
+            if pages_fetched + 1 < min(planned_pages, max_pages):
+                pages.prefetch((pages_fetched + 1) * page_size)
+
+            page_jobs_found = 0
+            page_keys = []
+            for posting in postings:
+                title = posting.get("name", "")
+                job_id = posting.get("id", "")
+                url = f"https://jobs.smartrecruiters.com/{company}/{job_id}"
+                location = _smartrecruiters_location(posting.get("location") or {})
+                job_key = make_job_key("smartrecruiters", company, job_id)
+                page_keys.append(job_key)
+
+                # Apply filtering and check for duplicates (both previous runs and earlier searches)
+                if (
+                    title
+                    and job_id
+                    and should_include_job(title, location)
+                    and is_new_job(job_key, url, found_jobs)
+                    and job_key not in seen_keys
+                ):
+                    job_data = {
+                        "title": title,
+                        "url": url,
+                        "key": job_key,
+                    }
+                    if location:
+                        job_data["location"] = location
+
+                    jobs.append(job_data)
+                    seen_keys.add(job_key)
+                    page_jobs_found += 1
+
+            pages_fetched += 1
+            print_debug(
+                f"Found {page_jobs_found} new {company} SmartRecruiters jobs on page {pages_fetched}"
+            )
+
+            # Stop early once consecutive pages contain only previously seen postings
+            if page_is_known(tracker, page_keys):
+                print_debug(
+                    f"{company} SmartRecruiters pages contain only previously seen postings, stopping pagination"
+                )
+                break
+
+            if not postings or pages_fetched >= planned_pages:
+                # An empty page ends the search even if totalFound promised more
+                reached_end = True
+                break
+
+        except Exception as e:
+            print_error(company, f"Error parsing SmartRecruiters response: {e}")
+            break
+
+    pages.close()
+    return jobs, reached_end
+
+
+def _smartrecruiters_location(location_data: Dict) -> str:
+    """Build a location string from a SmartRecruiters posting's location object."""
+    if location_data.get("fullLocation"):
+        return location_data["fullLocation"]
+
+    parts = [
+        location_data.get(field)
+        for field in ("city", "region", "country")
+        if location_data.get(field)
+    ]
+    if not parts and location_data.get("remote"):
+        return "Remote"
+    return ", ".join(parts)
+
+
+def _smartrecruiters_html(company: str, found_jobs: Set[str]) -> List[Dict]:
+    """
+    Scrape a company's postings from its SmartRecruiters HTML careers page.
+
+    Args:
+        company: Name of company, already formatted for immediate use
+        found_jobs: Set containing keys of previously found listings
+
+    Returns:
+        A list of new job listings for that company
+    """
+    jobs = []
+    current_run_keys = set()  # Track keys found in this run to prevent duplicates
     base_url = f"https://careers.smartrecruiters.com/{company}/"
 
     current_page = 1
     max_pages = 20  # Reasonable limit for HTML scraping
+    tracker = start_incremental(f"smartrecruiters_{company}")
+    reached_end = False
 
     print_debug(f"Scraping SmartRecruiters for {company}")
 
     while current_page <= max_pages:
+        # Stop cleanly, keeping partial results, once the time budget runs out
+        if budget_exhausted():
+            print_debug(
+                f"{company} SmartRecruiters time budget exhausted after {current_page - 1} pages"
+            )
+            break
+
         # SmartRecruiters uses page parameter for pagination
-        if current_page == 1:
-            api_url = base_url
-        else:
-            api_url = base_url + f"&page={current_page}"
+        params = {"page": current_page} if current_page > 1 else None
 
         print_debug(f"Fetching {company} SmartRecruiters page {current_page}")
 
-        response = make_request(api_url)
+        response = make_request(base_url, params=params)
         if not response or response.status_code != 200:
-            print_error(
-                company,
-                f"Failed to fetch SmartRecruiters jobs (status: {response.status_code if response else 'None'})",
-            )
+            if not budget_exhausted():
+                print_error(
+                    company,
+                    f"Failed to fetch SmartRecruiters jobs (status: {response.status_code if response else 'None'})",
+                )
             break
 
         try:
@@ -833,9 +1873,11 @@ def smartrecruiters(company: str, found_jobs: Set[str]) -> List[Dict]:
                 print_debug(
                     f"No more {company} SmartRecruiters jobs found after {current_page - 1} pages"
                 )
+                reached_end = True
                 break
 
             page_jobs_found = 0
+            page_keys = []
             for posting in job_postings:
                 title_elem = posting.find("h4")
                 url_elem = posting.find("a")
@@ -847,50 +1889,57 @@ def smartrecruiters(company: str, found_jobs: Set[str]) -> List[Dict]:
                     location = (
                         location_elem.get_text(strip=True) if location_elem else ""
                     )
+                    # SmartRecruiters URLs look like .../{company}/{job_id}-{slug}
+                    job_id = url.rstrip("/").split("/")[-1].split("-")[0]
+                    job_key = make_job_key("smartrecruiters", company, job_id)
+                    page_keys.append(job_key)
 
                     # Apply filtering and check for duplicates (both previous runs and current run)
                     if (
                         should_include_job(title, location)
-                        and url not in found_jobs
-                        and url not in current_run_urls
+                        and is_new_job(job_key, url, found_jobs)
+                        and job_key not in current_run_keys
                     ):
                         job_data = {
                             "title": title,
                             "url": url,
+                            "key": job_key,
                         }
                         if location:
                             job_data["location"] = location
 
                         jobs.append(job_data)
-                        current_run_urls.add(
-                            url
-                        )  # Track this URL to prevent duplicates in same run
+                        current_run_keys.add(
+                            job_key
+                        )  # Track this key to prevent duplicates in same run
                         page_jobs_found += 1
 
             print_debug(
                 f"Found {page_jobs_found} new {company} SmartRecruiters jobs on page {current_page}"
             )
 
-            # If no new jobs found on this page, we've likely reached the end
-            if page_jobs_found == 0:
+            # Stop early once consecutive pages contain only previously seen postings
+            if page_is_known(tracker, page_keys):
                 print_debug(
-                    f"No new {company} SmartRecruiters jobs found on page {current_page}, stopping pagination"
+                    f"{company} SmartRecruiters pages contain only previously seen postings, stopping pagination"
                 )
                 break
 
-            current_page += 1
-
-            # Additional sleep between pages to be respectful
-            if current_page <= max_pages:
+            # If no new jobs found on this page, we've likely reached the end.
+            # A full sweep keeps going until the last page, so it can count as complete
+            if page_jobs_found == 0 and not tracker["full_sweep"]:
                 print_debug(
-                    f"Sleeping briefly between {company} SmartRecruiters pages..."
+                    f"No new {company} SmartRecruiters jobs found on page {current_page}, stopping pagination"
                 )
-                time.sleep(REQUEST_DELAY_SECONDS)
+                break
+
+            current_page += 1
 
         except Exception as e:
             print_error(company, f"Error parsing SmartRecruiters response: {e}")
             break
 
+    finish_incremental(tracker, reached_end)
     print_debug(
         f"{company} SmartRecruiters pagination complete: {len(jobs)} total new jobs found across {current_page - 1} pages"
     )
@@ -903,7 +1952,7 @@ def avature(company: str, found_jobs: Set[str]) -> List[Dict]:
 
     Args:
         company: Name of company, already formatted for immediate use
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
@@ -917,7 +1966,7 @@ def meta(found_jobs: Set[str]) -> List[Dict]:
     Custom scraper for Meta.
 
     Args:
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
@@ -931,7 +1980,7 @@ def google(found_jobs: Set[str]) -> List[Dict]:
     Custom scraper for Google.
 
     Args:
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
@@ -945,7 +1994,7 @@ def wiz(found_jobs: Set[str]) -> List[Dict]:
     Custom scraper for Wiz.
 
     Args:
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
@@ -959,7 +2008,7 @@ def apple(found_jobs: Set[str]) -> List[Dict]:
     Custom scraper for Apple.
 
     Args:
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
@@ -973,7 +2022,7 @@ def amazon(found_jobs: Set[str]) -> List[Dict]:
     Custom scraper for Amazon.
 
     Args:
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
@@ -987,7 +2036,7 @@ def microsoft(found_jobs: Set[str]) -> List[Dict]:
     Custom scraper for Microsoft.
 
     Args:
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
@@ -1001,7 +2050,7 @@ def hubspot(found_jobs: Set[str]) -> List[Dict]:
     Custom scraper for HubSpot.
 
     Args:
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
@@ -1015,7 +2064,7 @@ def deloitte(found_jobs: Set[str]) -> List[Dict]:
     Custom scraper for Deloitte.
 
     Args:
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
@@ -1029,7 +2078,7 @@ def qualcomm(found_jobs: Set[str]) -> List[Dict]:
     Custom scraper for Qualcomm.
 
     Args:
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
@@ -1043,7 +2092,7 @@ def peloton(found_jobs: Set[str]) -> List[Dict]:
     Custom scraper for Peloton.
 
     Args:
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
@@ -1057,7 +2106,7 @@ def linkedin(found_jobs: Set[str]) -> List[Dict]:
     Custom scraper for LinkedIn.
 
     Args:
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
@@ -1071,7 +2120,7 @@ def atlassian(found_jobs: Set[str]) -> List[Dict]:
     Custom scraper for Atlassian.
 
     Args:
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
@@ -1085,7 +2134,7 @@ def github(found_jobs: Set[str]) -> List[Dict]:
     Custom scraper for GitHub.
 
     Args:
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
@@ -1099,7 +2148,7 @@ def ebay(found_jobs: Set[str]) -> List[Dict]:
     Custom scraper for eBay.
 
     Args:
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
@@ -1113,7 +2162,7 @@ def tiktok(found_jobs: Set[str]) -> List[Dict]:
     Custom scraper for TikTok.
 
     Args:
-        found_jobs: Set containing URLs of previously found listings
+        found_jobs: Set containing keys of previously found listings
 
     Returns:
         A list of new job listings for that company
@@ -0,0 +1,87 @@
+"""
+Persistent state shared across scraper runs.
+Each piece of state is stored as a JSON file in src/state/ (or src/STATE_DIR).
+Replayed runs keep their state in the cassette instead (see cassette.py).
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+from cassette import RUN_STATE_DIR
+
+STATE_DIR = RUN_STATE_DIR
+# State shared by every scraper process on the machine, wherever their own state is kept
+SHARED_STATE_DIR = Path(__file__).parent / "state"
+
+# Serializes read-modify-write cycles between concurrent workers
+_state_lock = threading.RLock()
+
+
+def load_state(name: str, default: Any = None) -> Any:
+    """
+    Load a named piece of persistent state.
+
+    Args:
+        name: Name of the state file (without extension)
+        default: Value returned if the state doesn't exist or can't be read
+
+    Returns:
+        Decoded JSON state, or the default value
+    """
+    state_file = STATE_DIR / f"{name}.json"
+    if not state_file.exists():
+        return default
+
+    try:
+        with open(state_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"Error loading state file {state_file.name}: {e}")
+        return default
+
+
+def save_state(name: str, data: Any) -> None:
+    """
+    Save a named piece of persistent state.
+
+    The file is written to a temporary path first and then renamed,
+    so an interrupted run can't leave a half-written state file behind.
+
+    Args:
+        name: Name of the state file (without extension)
+        data: JSON-serializable data to store
+    """
+    state_file = STATE_DIR / f"{name}.json"
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = state_file.with_suffix(
+        f".json.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+
+    try:
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.replace(temp_file, state_file)
+    except Exception as e:
+        print(f"Error saving state file {state_file.name}: {e}")
+
+
+def update_state(name: str, update: Callable[[Any], Any], default: Any = None) -> Any:
+    """
+    Load, modify and save a named piece of persistent state atomically
+    with respect to other workers in this process.
+
+    Args:
+        name: Name of the state file (without extension)
+        update: Function that receives the current state and returns the new state
+        default: Value passed to update if the state doesn't exist yet
+
+    Returns:
+        The new state
+    """
+    with _state_lock:
+        data = update(load_state(name, default))
+        save_state(name, data)
+        return data
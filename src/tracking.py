@@ -0,0 +1,207 @@
+"""
+Per-company run tracking.
+The orchestrator starts tracking before running a company's scraper, and the
+request helpers record every request against whichever company is active.
+"""
+
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+from config import MIN_REQUEST_SECONDS
+from quotas import count_request, quota_exhausted
+
+_current_company: ContextVar[Optional[Dict]] = ContextVar(
+    "current_company", default=None
+)
+
+# Monotonic time at which the whole run must stop, if a run budget is set
+_run_deadline: Optional[float] = None
+
+
+def set_run_budget(budget_seconds: Optional[float]) -> None:
+    """Start the whole-run time budget (None for no limit)."""
+    global _run_deadline
+    _run_deadline = time.monotonic() + budget_seconds if budget_seconds else None
+
+
+def end_run() -> None:
+    """
+    Exhaust the whole-run budget immediately, e.g. on shutdown.
+
+    Companies that haven't started are skipped and scrapers in progress stop
+    at their next budget check, keeping the results they already have.
+    """
+    global _run_deadline
+    _run_deadline = time.monotonic()
+
+
+def run_budget_exhausted() -> bool:
+    """Check whether the whole-run time budget has run out."""
+    return _run_deadline is not None and time.monotonic() >= _run_deadline
+
+
+def start_company(
+    company_name: str,
+    scraper_name: str,
+    tier_name: str,
+    budget_seconds: Optional[float] = None,
+    request_limit: Optional[int] = None,
+) -> Dict:
+    """
+    Begin tracking a company scrape in the current context.
+
+    Args:
+        company_name: Display name of the company
+        scraper_name: Name of the scraper function used for the company
+        tier_name: Name of the tier the company belongs to
+        budget_seconds: Time budget for the company (None for no limit)
+        request_limit: Maximum requests for the company, e.g. 1 for a
+            quarantine probe or fewer when request quotas run low (None for no limit)
+
+    Returns:
+        The stats dictionary that requests will be recorded against
+    """
+    start = time.monotonic()
+    stats = {
+        "name": company_name,
+        "scraper": scraper_name,
+        "tier": tier_name,
+        "start": start,
+        "deadline": start + budget_seconds if budget_seconds else None,
+        "request_limit": request_limit,
+        "host": None,
+        "requests": 0,
+        "failed_requests": 0,
+        "bytes": 0,
+        "latency": 0.0,
+        "retryable": False,
+        "errors": 0,
+        "last_error": "",
+        "duration": 0.0,
+        "truncated": False,
+    }
+    _current_company.set(stats)
+    return stats
+
+
+def current_company() -> Optional[Dict]:
+    """Return the stats dictionary for the company currently being scraped."""
+    return _current_company.get()
+
+
+def time_remaining() -> Optional[float]:
+    """
+    Return the seconds left before the company or run budget runs out.
+
+    Returns:
+        Remaining seconds (possibly negative), or None if no budget applies
+    """
+    deadlines = [_run_deadline]
+    stats = _current_company.get()
+    if stats is not None:
+        deadlines.append(stats["deadline"])
+
+    deadlines = [deadline for deadline in deadlines if deadline is not None]
+    if not deadlines:
+        return None
+    return min(deadlines) - time.monotonic()
+
+
+def budget_exhausted(host: Optional[str] = None, truncate: bool = True) -> bool:
+    """
+    Check whether the current company's time budget (or the run's), its
+    request limit, or its share of the request quotas has run out.
+
+    A time budget counts as run out once less than MIN_REQUEST_SECONDS is left,
+    as a request started then would only time out. Scrapers call this between
+    pages to stop cooperatively. Once exhausted, the current company is flagged
+    as truncated.
+
+    Args:
+        host: Host about to be requested; defaults to the host the company
+            last requested
+        truncate: Whether to flag the company as truncated if exhausted; off for
+            optional requests, whose omission doesn't cut a scrape short
+    """
+    stats = _current_company.get()
+    if stats is not None and host is not None:
+        stats["host"] = host
+
+    limit_reached = (
+        stats is not None
+        and stats["request_limit"] is not None
+        and stats["requests"] >= stats["request_limit"]
+    )
+    quota_reached = stats is not None and quota_exhausted(
+        stats["tier"], stats.get("host")
+    )
+
+    remaining = time_remaining()
+    time_left = remaining is None or remaining >= MIN_REQUEST_SECONDS
+    if not limit_reached and not quota_reached and time_left:
+        return False
+
+    if stats is not None and truncate:
+        stats["truncated"] = True
+    return True
+
+
+def record_request(host: Optional[str] = None) -> None:
+    """Record a request made on behalf of the current company and count it against quotas."""
+    if host is not None:
+        count_request(host)
+    stats = _current_company.get()
+    if stats is not None:
+        stats["requests"] += 1
+
+
+def record_response(size: int, latency: float) -> None:
+    """
+    Record a response received by the current company.
+
+    Args:
+        size: Size of the response body in bytes
+        latency: Seconds between sending the request and receiving the response
+    """
+    stats = _current_company.get()
+    if stats is not None:
+        stats["bytes"] += size
+        stats["latency"] += latency
+
+
+def record_request_failure(retryable: bool = False) -> None:
+    """
+    Record a request for the current company that got no successful response.
+
+    Args:
+        retryable: Whether the failure is transient (timeout, connection error,
+            HTTP 429 or 5xx), so the company is worth retrying later in the run
+    """
+    stats = _current_company.get()
+    if stats is not None:
+        stats["failed_requests"] += 1
+        if retryable:
+            stats["retryable"] = True
+
+
+def record_error(error_message: str = "") -> None:
+    """Record a scraping error for the current company."""
+    stats = _current_company.get()
+    if stats is not None:
+        stats["errors"] += 1
+        stats["last_error"] = error_message
+
+
+def finish_company() -> Optional[Dict]:
+    """
+    Stop tracking the current company.
+
+    Returns:
+        Final stats dictionary, including the total duration in seconds
+    """
+    stats = _current_company.get()
+    if stats is not None:
+        stats["duration"] = time.monotonic() - stats["start"]
+        _current_company.set(None)
+    return stats
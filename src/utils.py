@@ -2,85 +2,216 @@
 Shared utility functions for the job scraper.
 """
 
-from pathlib import Path
-from typing import Set, List, Dict
-from config import INCLUDE_KEYWORDS, EXCLUDE_KEYWORDS, APPLY_FILTERING
+import re
+import shutil
+import time
+from typing import Set, List, Dict, Optional
+from config import APPLY_FILTERING
+from filters import keyword_filter
+from decision_cache import decision_cache
+from cassette import RUN_DIR
+
+JOBS_FOUND_FILE = RUN_DIR / "jobs_found.txt"
+
+# URL patterns used to convert legacy jobs_found.txt entries into job keys
+# Each pattern maps onto the same key format its scraper produces via make_job_key
+LEGACY_URL_PATTERNS = [
+    (
+        "greenhouse",
+        re.compile(r"greenhouse\.io/(?:embed/)?([\w-]+)/jobs/(\d+)", re.IGNORECASE),
+    ),
+    (
+        "greenhouse",
+        re.compile(
+            r"greenhouse\.io/.*[?&]for=([\w-]+).*[?&]token=(\d+)", re.IGNORECASE
+        ),
+    ),
+    ("lever", re.compile(r"jobs\.lever\.co/([^/?#]+)/([0-9a-f-]{36})", re.IGNORECASE)),
+    (
+        "ashby",
+        re.compile(r"jobs\.ashbyhq\.com/([^/?#]+)/([0-9a-f-]{36})", re.IGNORECASE),
+    ),
+    (
+        "workday",
+        re.compile(r"https?://([^./]+)\.wd\d+\.myworkdayjobs\.com/.*?(/job/[^?#]+)"),
+    ),
+    ("netflix", re.compile(r"jobs\.netflix\.net/careers/job/(\d+)")),
+    ("spotify", re.compile(r"lifeatspotify\.com/jobs/([^/?#]+)")),
+    ("uber", re.compile(r"uber\.com/.*/careers/list/(\d+)")),
+    ("jobvite", re.compile(r"jobs\.jobvite\.com/([^/?#]+)-careers/job/([^/?#]+)")),
+    (
+        "smartrecruiters",
+        re.compile(r"jobs\.smartrecruiters\.com/([^/?#]+)/(\d+)", re.IGNORECASE),
+    ),
+]
+
+
+def make_job_key(platform: str, *parts) -> str:
+    """
+    Build a canonical job key, e.g. "greenhouse:stripe:6543210".
+
+    Keys are used for duplicate detection instead of raw URLs, so that changes
+    in URL formatting or tracking parameters don't cause listings to be re-reported.
+    When a key has a board/tenant part it's lowercased, since board names are
+    case-insensitive in URLs (e.g. "Twitch" in companies.py, "twitch" in links).
+
+    Args:
+        platform: Platform prefix (e.g. "greenhouse", "workday", "netflix")
+        parts: Identifying parts, typically the board/tenant and the job ID
 
+    Returns:
+        Job key string
+    """
+    parts = [str(part).strip() for part in parts]
+    if len(parts) > 1:
+        parts[0] = parts[0].lower()
+    return ":".join([platform] + parts)
+
+
+def normalize_job_key(job_key: str) -> str:
+    """Rebuild a stored job key, so keys saved before normalization still match."""
+    platform, *parts = job_key.split(":")
+    return make_job_key(platform, *parts)
+
+
+def workday_job_key(tenant: str, external_path: str) -> str:
+    """
+    Build the job key for a Workday listing from its externalPath.
 
-def get_new_companies(all_companies: List[Dict]) -> Set[str]:
+    Workday paths end with the job requisition ID, e.g. "/job/Remote/Engineer_JR1234",
+    so the segment after the last underscore is used as the stable identifier.
     """
-    Determine which companies are being scraped for the first time.
+    last_segment = external_path.rstrip("/").rsplit("/", 1)[-1]
+    job_req_id = last_segment.rsplit("_", 1)[-1]
+    return make_job_key("workday", tenant, job_req_id)
+
+
+def url_to_job_key(url: str) -> Optional[str]:
+    """
+    Convert a legacy job URL into its canonical job key.
 
     Args:
-        all_companies: List of all company dictionaries from all tiers
+        url: Job URL as previously stored in jobs_found.txt
 
     Returns:
-        Set of company names that don't have existing log files
+        Job key, or None if the URL doesn't match any known platform format
     """
-    from output import BY_COMPANY_DIR  # Import here to avoid circular imports
+    for platform, pattern in LEGACY_URL_PATTERNS:
+        match = pattern.search(url)
+        if not match:
+            continue
 
-    new_companies = set()
+        if platform == "workday":
+            return workday_job_key(match.group(1), match.group(2))
 
-    for company_data in all_companies:
-        company_name = company_data.get("name", "")
-        if not company_name:
-            continue
+        return make_job_key(platform, *match.groups())
+
+    return None
+
+
+def is_new_job(job_key: str, url: str, found_jobs: Set[str]) -> bool:
+    """
+    Check whether a listing has not been found in a previous run.
+
+    Raw URLs are also checked, since legacy entries that couldn't be migrated
+    to job keys (e.g. Greenhouse listings hosted on custom domains) stay as URLs.
+    """
+    return job_key not in found_jobs and url not in found_jobs
+
+
+def migrate_found_jobs() -> int:
+    """
+    Rewrite jobs_found.txt so that legacy URL entries are replaced by job keys.
+
+    Existing keys are normalized too, e.g. keys saved with a mixed-case board
+    name before board names were lowercased. A backup of the original file is written to jobs_found.txt.bak.
+    Entries that can't be mapped onto a job key are kept as-is.
+
+    Returns:
+        Number of entries that were migrated
+    """
+    if not JOBS_FOUND_FILE.exists():
+        return 0
+
+    with open(JOBS_FOUND_FILE, "r", encoding="utf-8") as f:
+        entries = [line.strip() for line in f if line.strip()]
+
+    migrated_count = 0
+    migrated_entries = []
+    seen_entries = set()
+    for entry in entries:
+        if entry.startswith("http"):
+            job_key = url_to_job_key(entry)
+        else:
+            job_key = normalize_job_key(entry)
+        if job_key and job_key != entry:
+            entry = job_key
+            migrated_count += 1
+
+        # Drop entries that collapse onto an already-present key
+        if entry not in seen_entries:
+            seen_entries.add(entry)
+            migrated_entries.append(entry)
 
-        # Create safe filename from company name (same logic as in log_to_files)
-        safe_company_name = company_name.lower().replace(" ", "_").replace("-", "_")
-        log_file = BY_COMPANY_DIR / f"{safe_company_name}.txt"
+    if not migrated_count:
+        return 0
 
-        # If log file doesn't exist, this is a new company
-        if not log_file.exists():
-            new_companies.add(company_name)
+    shutil.copyfile(JOBS_FOUND_FILE, JOBS_FOUND_FILE.with_name("jobs_found.txt.bak"))
+    with open(JOBS_FOUND_FILE, "w", encoding="utf-8") as f:
+        for entry in migrated_entries:
+            f.write(f"{entry}\n")
 
-    return new_companies
+    return migrated_count
 
 
 def load_found_jobs() -> Set[str]:
     """
-    Load previously found job URLs from jobs_found.txt into a set.
+    Load previously found job keys from jobs_found.txt into a set.
+
+    Legacy URL entries are migrated to job keys before loading.
 
     Returns:
-        Set of job URLs that have been found in previous runs
+        Set of job keys (and unmigratable legacy URLs) found in previous runs
     """
     found_jobs = set()
 
-    jobs_found_file = Path(__file__).parent / "jobs_found.txt"
+    if not JOBS_FOUND_FILE.exists():  # Return empty set if file doesn't exist
+        return found_jobs
 
-    if jobs_found_file:  # Return empty set if file doesn't exist
-        try:
-            with open(jobs_found_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    url = line.strip()
-                    if url and url.startswith("http"):  # Basic URL validation
-                        found_jobs.add(url)
-        except Exception as e:
-            print(f"Error loading jobs_found.txt: {e}")
+    try:
+        migrated_count = migrate_found_jobs()
+        if migrated_count:
+            print(f"Migrated {migrated_count} entries in jobs_found.txt to job keys")
+
+        with open(JOBS_FOUND_FILE, "r", encoding="utf-8") as f:
+            for line in f:
+                entry = line.strip()
+                if entry:
+                    found_jobs.add(entry)
+    except Exception as e:
+        print(f"Error loading jobs_found.txt: {e}")
 
     return found_jobs
 
 
-def save_new_jobs(new_job_urls: List[str]) -> None:
+def save_new_jobs(new_job_keys: List[str]) -> None:
     """
-    Append new job URLs to jobs_found.txt.
+    Append new job keys to jobs_found.txt.
 
     Args:
-        new_job_urls: List of new job URLs to save
+        new_job_keys: List of new job keys to save
     """
-    if not new_job_urls:
+    if not new_job_keys:
         return  # No new jobs found
 
-    jobs_found_file = Path(__file__).parent / "jobs_found.txt"
-
     # Create new jobs_found.txt file if one doesn't already exist
-    if not jobs_found_file.exists():
-        jobs_found_file.touch()
+    if not JOBS_FOUND_FILE.exists():
+        JOBS_FOUND_FILE.touch()
 
     try:
-        with open(jobs_found_file, "a", encoding="utf-8") as f:
-            for url in new_job_urls:
-                f.write(f"{url}\n")
+        with open(JOBS_FOUND_FILE, "a", encoding="utf-8") as f:
+            for job_key in new_job_keys:
+                f.write(f"{job_key}\n")
     except Exception as e:
         print(f"Error saving new jobs to jobs_found.txt: {e}")
 
@@ -89,6 +220,8 @@ def should_include_job(job_title: str, location: str = "") -> bool:
     """
     Determine if a job should be included based on keyword and location filters.
 
+    Decisions are cached across runs by normalized (title, location), see decision_cache.py.
+
     Args:
         job_title: Job title extracted from listing
         location: Job location (optional)
@@ -100,14 +233,24 @@ def should_include_job(job_title: str, location: str = "") -> bool:
     if not APPLY_FILTERING:
         return True
 
-    job_title_lower = job_title.lower()
+    # Non-string locations (e.g. dicts from APIs) aren't cached
+    if not isinstance(location, str):
+        return _evaluate_filters(job_title, location)
 
-    # Must match at least one include keyword
-    if not any(keyword.lower() in job_title_lower for keyword in INCLUDE_KEYWORDS):
-        return False
+    decision = decision_cache.get(job_title, location)
+    if decision is not None:
+        return decision
+
+    start = time.perf_counter()
+    decision = _evaluate_filters(job_title, location)
+    decision_cache.put(job_title, location, decision, time.perf_counter() - start)
+    return decision
 
-    # Must not match any exclude keywords
-    if any(keyword.lower() in job_title_lower for keyword in EXCLUDE_KEYWORDS):
+
+def _evaluate_filters(job_title: str, location) -> bool:
+    """Apply the keyword and location filters to a job."""
+    # Must match at least one include keyword and no exclude keywords
+    if not keyword_filter.matches(job_title):
         return False
 
     # Location filtering: include if no location specified OR location is US/EU
@@ -136,8 +279,6 @@ def is_us_or_eu_location(location) -> bool:
 
     location_lower = location.lower()
 
-    import re
-
     # US country and general indicators (simple substring match)
     us_general_indicators = [
         "united states",